@@ -0,0 +1,95 @@
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List
+
+from bitcoinwallet.core.model.entity import TransactionEntity, UserEntity, WalletEntity
+from bitcoinwallet.core.repository.connection_pool import ConnectionPool
+from bitcoinwallet.core.repository.ledger_repository import LedgerRepository
+from bitcoinwallet.core.repository.repository import Repository
+from bitcoinwallet.core.service.bitcoin_service import BitcoinService
+from definitions import FORMAT, INITIAL_WALLET_BALANCE, MAX_WALLETS_PER_USER
+
+START_TIME = datetime(2024, 1, 1)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    users: List[UserEntity]
+    wallets: List[WalletEntity]
+    transactions: List[TransactionEntity]
+    hot_wallets: List[WalletEntity]
+
+
+def generate_dataset(
+    users: int, transactions: int, seed: int = 0, skew: float = 1.2
+) -> Dataset:
+    rng = random.Random(seed)
+
+    def next_uuid() -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    def timestamp(offset: int) -> str:
+        return (START_TIME + timedelta(seconds=offset)).strftime(FORMAT)
+
+    user_entities = []
+    wallets: List[WalletEntity] = []
+    for _ in range(users):
+        api_key = next_uuid()
+        wallet_count = rng.randint(1, MAX_WALLETS_PER_USER)
+        user_entities.append(UserEntity(api_key, wallet_count))
+        for _ in range(wallet_count):
+            wallets.append(
+                WalletEntity(
+                    next_uuid(),
+                    api_key,
+                    INITIAL_WALLET_BALANCE,
+                    timestamp(len(wallets)),
+                    next_uuid(),
+                )
+            )
+
+    ranked = wallets[:]
+    rng.shuffle(ranked)
+    weights = [1 / (rank + 1) ** skew for rank in range(len(ranked))]
+
+    transaction_entities = []
+    for index in range(transactions):
+        source, destination = rng.choices(ranked, weights, k=2)
+        if source is destination:
+            continue
+        amount = rng.randint(1, INITIAL_WALLET_BALANCE // 1000)
+        fee_cost = BitcoinService.calculate_fee(
+            source.owner_api_key, destination.owner_api_key, amount
+        )
+        if source.balance < amount + fee_cost:
+            continue
+        source.balance -= amount + fee_cost
+        destination.balance += amount
+        transaction_entities.append(
+            TransactionEntity(
+                next_uuid(),
+                source.address,
+                destination.address,
+                amount,
+                fee_cost,
+                timestamp(len(wallets) + index),
+            )
+        )
+
+    return Dataset(
+        users=user_entities,
+        wallets=wallets,
+        transactions=transaction_entities,
+        hot_wallets=ranked[: max(1, len(ranked) // 100)],
+    )
+
+
+def load_dataset(db_path: str, dataset: Dataset) -> None:
+    pool = ConnectionPool(db_path)
+    Repository(UserEntity, pool).create_many(dataset.users)
+    Repository(WalletEntity, pool).create_many(dataset.wallets)
+    Repository(TransactionEntity, pool).create_many(dataset.transactions)
+    LedgerRepository(pool).rebuild_statistics()
+    pool.close()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from typer import Typer
+
+from bitcoinwallet.core.model.entity import TransactionEntity, UserEntity, WalletEntity
+from bitcoinwallet.core.repository.connection_pool import ConnectionPool
+from bitcoinwallet.core.repository.group_commit import GroupCommitLedgerRepository
+from bitcoinwallet.core.repository.ledger_repository import (
+    ILedgerRepository,
+    LedgerRepository,
+)
+from bitcoinwallet.core.repository.repository import Repository
+from bitcoinwallet.core.repository.storage_profile import get_storage_profile
+from bitcoinwallet.core.util import datetime_now
+from definitions import GROUP_COMMIT_MAX_WAIT_US, INITIAL_WALLET_BALANCE
+from resources.db.sql import db_setup
+
+cli = Typer(add_completion=False)
+
+
+def create_wallets(pool: ConnectionPool, count: int) -> List[WalletEntity]:
+    wallets = []
+    for _ in range(count):
+        owner = str(uuid.uuid4())
+        Repository(UserEntity, pool).create(UserEntity(owner, 1))
+        wallets.append(
+            WalletEntity(
+                str(uuid.uuid4()),
+                owner,
+                INITIAL_WALLET_BALANCE,
+                datetime_now(),
+                str(uuid.uuid4()),
+            )
+        )
+    Repository(WalletEntity, pool).create_many(wallets)
+    return wallets
+
+
+def transfers_per_second(
+    ledger: ILedgerRepository,
+    wallets: List[WalletEntity],
+    transfers: int,
+    threads: int,
+) -> float:
+    def transfer(index: int) -> None:
+        source = wallets[index % len(wallets)]
+        destination = wallets[(index + 1) % len(wallets)]
+        transaction = TransactionEntity(
+            str(uuid.uuid4()),
+            source.address,
+            destination.address,
+            1,
+            0,
+            datetime_now(),
+        )
+        ledger.transfer(source.owner_api_key, transaction)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(transfer, range(transfers)))
+    return transfers / (time.perf_counter() - start)
+
+
+@cli.command()
+def run(
+    transfers: int = 2000,
+    threads: str = "1,4,16,64",
+    storage_profile: str = "durable",
+    max_wait_us: int = GROUP_COMMIT_MAX_WAIT_US,
+) -> None:
+    profile = get_storage_profile(storage_profile)
+    print(f"{'threads':<10}{'per-transfer commit/s':>24}{'group commit/s':>18}")
+    for thread_count in [int(value) for value in threads.split(",")]:
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = db_setup(os.path.join(directory, "group_commit.db"))
+            pool = ConnectionPool(db_path, size=thread_count, storage_profile=profile)
+            wallets = create_wallets(pool, 64)
+
+            ledger = LedgerRepository(pool)
+            plain = transfers_per_second(ledger, wallets, transfers, thread_count)
+            grouped_ledger = GroupCommitLedgerRepository(
+                ledger, max_wait_us=max_wait_us
+            )
+            grouped = transfers_per_second(
+                grouped_ledger, wallets, transfers, thread_count
+            )
+            grouped_ledger.close()
+            pool.close()
+        print(f"{thread_count:<10}{plain:>24.0f}{grouped:>18.0f}")
+
+
+if __name__ == "__main__":
+    cli()
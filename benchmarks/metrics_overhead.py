@@ -0,0 +1,58 @@
+import os
+import tempfile
+import time
+from typing import Callable, Dict
+
+from fastapi.testclient import TestClient
+from typer import Typer
+
+from bitcoinwallet.core.repository.repository_factory import repository_factory_for
+from bitcoinwallet.runner.setup import init_app
+from resources.db.sql import db_setup
+
+cli = Typer(add_completion=False)
+
+
+def microseconds_per_request(requests: int, request: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        request()
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+def benchmark_app(db_path: str, requests: int, metrics: bool) -> Dict[str, float]:
+    repository_factory = repository_factory_for(db_path)
+    client = TestClient(init_app(repository_factory, metrics=metrics))
+    headers = {"X-API-KEY": client.post("/users").json()["api_key"]}
+
+    def create_user() -> None:
+        client.post("/users")
+
+    def list_transactions() -> None:
+        client.get("/transactions", headers=headers)
+
+    results = {
+        "create_user_us": microseconds_per_request(requests, create_user),
+        "list_transactions_us": microseconds_per_request(requests, list_transactions),
+    }
+    repository_factory.close_connections()
+    return results
+
+
+@cli.command()
+def run(requests: int = 2000) -> None:
+    print(f"{'metrics':<10}{'POST /users µs':>18}{'GET /transactions µs':>24}")
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = db_setup(os.path.join(directory, "metrics.db"))
+        benchmark_app(db_path, requests // 10, metrics=True)
+        for metrics in (False, True):
+            results = benchmark_app(db_path, requests, metrics)
+            print(
+                f"{'on' if metrics else 'off':<10}"
+                f"{results['create_user_us']:>18.1f}"
+                f"{results['list_transactions_us']:>24.1f}"
+            )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,105 @@
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from typer import Typer
+
+from bitcoinwallet.core.model.entity import TransactionEntity
+from bitcoinwallet.core.model.model import ListTransactionsResponse, TransactionModel
+from bitcoinwallet.core.service.transaction_service import TransactionPage
+from bitcoinwallet.core.util import CurrencyExchangeUtil
+from bitcoinwallet.infra.fastapi.response.json_response import (
+    TransactionPageResponse,
+    encode_json,
+    fast_encode_json,
+    transaction_to_json,
+)
+
+cli = Typer(add_completion=False)
+
+
+def create_page(transactions: int) -> TransactionPage:
+    return TransactionPage(
+        [
+            TransactionEntity(
+                f"{index:036d}",
+                f"{index % 97:036d}",
+                f"{index % 89:036d}",
+                1000 + index,
+                15,
+                "2024-01-01 00:00:00.000000",
+            )
+            for index in range(transactions)
+        ]
+    )
+
+
+def to_response_model(page: TransactionPage) -> ListTransactionsResponse:
+    return ListTransactionsResponse(
+        transactions=[
+            TransactionModel(
+                from_wallet_address=transaction.from_addr,
+                to_wallet_address=transaction.to_addr,
+                amount=CurrencyExchangeUtil.satoshi_to_bitcoin(transaction.amount),
+                fee_price=transaction.fee_cost,
+            )
+            for transaction in page.transactions
+        ],
+        next_cursor=page.next_cursor,
+    )
+
+
+def create_app(page: TransactionPage) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/response-model", response_model=ListTransactionsResponse)
+    def response_model() -> ListTransactionsResponse:
+        return to_response_model(page)
+
+    @app.get("/fast", response_model=ListTransactionsResponse)
+    def fast() -> Response:
+        return TransactionPageResponse(page)
+
+    return app
+
+
+def median_ms(repeat: int, call: Callable[[], Any]) -> float:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+
+@cli.command()
+def run(transactions: int = 100000, repeat: int = 5) -> None:
+    page = create_page(transactions)
+    client = TestClient(create_app(page))
+    content: Dict[str, List[Dict[str, Any]]] = {
+        "transactions": [
+            transaction_to_json(transaction) for transaction in page.transactions
+        ]
+    }
+    results = {
+        "endpoint, response_model": median_ms(
+            repeat, lambda: client.get("/response-model").raise_for_status()
+        ),
+        "endpoint, TransactionPageResponse": median_ms(
+            repeat, lambda: client.get("/fast").raise_for_status()
+        ),
+        "encode, json": median_ms(repeat, lambda: encode_json(content)),
+        "encode, fast_encode_json": median_ms(
+            repeat, lambda: fast_encode_json(content)
+        ),
+    }
+    print(f"{transactions} transactions per response")
+    print(f"{'path':<40}{'median ms':>12}")
+    for name, duration in results.items():
+        print(f"{name:<40}{duration:>12.1f}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,76 @@
+import os
+import random
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from typer import Typer
+
+from bitcoinwallet.core.model.entity import UserEntity
+from bitcoinwallet.core.repository.connection_pool import ConnectionPool
+from bitcoinwallet.core.repository.repository import Repository
+from bitcoinwallet.core.repository.storage_profile import (
+    STORAGE_PROFILES,
+    StorageProfile,
+)
+from resources.db.sql import db_setup
+
+cli = Typer(add_completion=False)
+
+
+def ops_per_second(operations: int, action: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    action()
+    return operations / (time.perf_counter() - start)
+
+
+def benchmark_profile(
+    profile: StorageProfile, rows: int, reads: int, threads: int
+) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = db_setup(os.path.join(directory, f"{profile.name}.db"))
+        pool = ConnectionPool(db_path, size=threads, storage_profile=profile)
+        user_repo = Repository(UserEntity, pool)
+
+        single_users = [UserEntity(str(uuid.uuid4()), 0) for _ in range(rows)]
+        bulk_users = [UserEntity(str(uuid.uuid4()), 0) for _ in range(rows)]
+        api_keys: List[str] = [user.api_key for user in single_users + bulk_users]
+
+        def insert_single() -> None:
+            for user in single_users:
+                user_repo.create(user)
+
+        def insert_bulk() -> None:
+            user_repo.create_many(bulk_users)
+
+        def read_points() -> None:
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                list(executor.map(user_repo.read, random.choices(api_keys, k=reads)))
+
+        results = {
+            "single_insert_ops": ops_per_second(rows, insert_single),
+            "bulk_insert_rows": ops_per_second(rows, insert_bulk),
+            "point_read_ops": ops_per_second(reads, read_points),
+        }
+        pool.close()
+        return results
+
+
+@cli.command()
+def run(rows: int = 2000, reads: int = 20000, threads: int = 4) -> None:
+    print(
+        f"{'profile':<12}{'single insert/s':>18}"
+        f"{'bulk insert rows/s':>22}{'point reads/s':>18}"
+    )
+    for profile in STORAGE_PROFILES.values():
+        results = benchmark_profile(profile, rows, reads, threads)
+        print(
+            f"{profile.name:<12}{results['single_insert_ops']:>18.0f}"
+            f"{results['bulk_insert_rows']:>22.0f}{results['point_read_ops']:>18.0f}"
+        )
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,289 @@
+import contextlib
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi.testclient import TestClient
+from typer import Exit, Typer
+
+from benchmarks.dataset import Dataset, generate_dataset, load_dataset
+from bitcoinwallet.core.logger import NullLogger
+from bitcoinwallet.core.model.entity import WalletEntity
+from bitcoinwallet.core.repository.repository_factory import (
+    RepositoryFactory,
+    repository_factory_for,
+)
+from bitcoinwallet.core.service.bitcoin_service import (
+    BitcoinService,
+    BitcoinServiceBuilder,
+)
+from bitcoinwallet.core.service.transaction_service import TransactionServiceBuilder
+from bitcoinwallet.core.service.user_service import UserServiceBuilder
+from bitcoinwallet.core.service.wallet_service import WalletServiceBuilder
+from bitcoinwallet.runner.loadtest import percentile
+from bitcoinwallet.runner.setup import init_app
+from definitions import ADMIN_API_KEY, ROOT_PATH
+from resources.db.sql import db_setup
+
+BENCHMARKS_PATH = os.path.join(ROOT_PATH, "benchmarks")
+RESULTS_PATH = os.path.join(BENCHMARKS_PATH, "results.json")
+BASELINE_PATH = os.path.join(BENCHMARKS_PATH, "baseline.json")
+TRANSFER_AMOUNT = 0.00001
+HOT_SHARE = 0.8
+
+cli = Typer(add_completion=False)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    iterations: int
+    p50_ms: float
+    p99_ms: float
+    ops_per_sec: float
+
+
+@dataclass(frozen=True)
+class Workload:
+    transfers: List[Tuple[str, str, str]]
+    owned_wallets: List[Tuple[str, str]]
+
+
+def measure(calls: Sequence[Callable[[], Any]], warmup: int) -> BenchmarkResult:
+    for call in calls[:warmup]:
+        call()
+    durations = []
+    start = time.perf_counter()
+    for call in calls:
+        call_start = time.perf_counter()
+        call()
+        durations.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    durations.sort()
+    return BenchmarkResult(
+        iterations=len(calls),
+        p50_ms=percentile(durations, 50) * 1000,
+        p99_ms=percentile(durations, 99) * 1000,
+        ops_per_sec=len(calls) / elapsed,
+    )
+
+
+def create_workload(dataset: Dataset, iterations: int, seed: int) -> Workload:
+    rng = random.Random(seed)
+
+    def pick_wallet() -> WalletEntity:
+        wallets = dataset.hot_wallets if rng.random() < HOT_SHARE else dataset.wallets
+        return rng.choice(wallets)
+
+    transfers = []
+    owned_wallets = []
+    for _ in range(iterations):
+        source, destination = pick_wallet(), pick_wallet()
+        while destination is source:
+            destination = pick_wallet()
+        transfers.append((source.owner_api_key, source.address, destination.address))
+        owned_wallets.append((source.owner_api_key, source.address))
+    return Workload(transfers=transfers, owned_wallets=owned_wallets)
+
+
+def build_bitcoin_service(repository_factory: RepositoryFactory) -> BitcoinService:
+    logger = NullLogger()
+    return (
+        BitcoinServiceBuilder()
+        .set_logger(logger)
+        .set_user_service(
+            UserServiceBuilder()
+            .set_repository_factory(repository_factory)
+            .set_logger(logger)
+            .build()
+        )
+        .set_transaction_service(
+            TransactionServiceBuilder()
+            .set_repository_factory(repository_factory)
+            .set_logger(logger)
+            .build()
+        )
+        .set_wallet_service(
+            WalletServiceBuilder()
+            .set_repository_factory(repository_factory)
+            .set_logger(logger)
+            .build()
+        )
+        .build()
+    )
+
+
+def benchmark_services(
+    repository_factory: RepositoryFactory, workload: Workload, warmup: int
+) -> Dict[str, BenchmarkResult]:
+    service = build_bitcoin_service(repository_factory)
+    calls: Dict[str, List[Callable[[], Any]]] = {
+        "create_transaction": [
+            partial(service.create_transaction, *transfer, TRANSFER_AMOUNT)
+            for transfer in workload.transfers
+        ],
+        "get_transactions": [
+            partial(service.get_transactions, api_key)
+            for api_key, _ in workload.owned_wallets
+        ],
+        "get_addr_transactions": [
+            partial(service.get_addr_transactions, *wallet)
+            for wallet in workload.owned_wallets
+        ],
+        "get_statistics": [
+            partial(service.get_statistics, ADMIN_API_KEY) for _ in workload.transfers
+        ],
+        "get_wallet_balance": [
+            partial(service.get_wallet_balance, *wallet)
+            for wallet in workload.owned_wallets
+        ],
+    }
+    return {
+        f"service.{name}": measure(operation, warmup)
+        for name, operation in calls.items()
+    }
+
+
+def benchmark_endpoints(
+    repository_factory: RepositoryFactory, workload: Workload, warmup: int
+) -> Dict[str, BenchmarkResult]:
+    client = TestClient(init_app(repository_factory, metrics=False))
+
+    admin_headers = {"X-ADMIN-API-KEY": ADMIN_API_KEY}
+
+    def headers(api_key: str) -> Dict[str, str]:
+        return {"X-API-KEY": api_key}
+
+    def create_transaction(api_key: str, source: str, destination: str) -> None:
+        request = {
+            "from_wallet_address": source,
+            "to_wallet_address": destination,
+            "amount": TRANSFER_AMOUNT,
+        }
+        client.post(
+            "/transactions", headers=headers(api_key), json=request
+        ).raise_for_status()
+
+    def get(url: str, request_headers: Dict[str, str]) -> None:
+        client.get(url, headers=request_headers).raise_for_status()
+
+    calls: Dict[str, List[Callable[[], Any]]] = {
+        "POST /transactions": [
+            partial(create_transaction, *transfer) for transfer in workload.transfers
+        ],
+        "GET /transactions": [
+            partial(get, "/transactions", headers(api_key))
+            for api_key, _ in workload.owned_wallets
+        ],
+        "GET /wallets/{address}/transactions": [
+            partial(get, f"/wallets/{address}/transactions", headers(api_key))
+            for api_key, address in workload.owned_wallets
+        ],
+        "GET /statistics": [
+            partial(get, "/statistics", admin_headers) for _ in workload.transfers
+        ],
+        "GET /wallets/{address}": [
+            partial(get, f"/wallets/{address}", headers(api_key))
+            for api_key, address in workload.owned_wallets
+        ],
+    }
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return {
+            f"endpoint.{name}": measure(operation, warmup)
+            for name, operation in calls.items()
+        }
+
+
+def compare(
+    results: Dict[str, BenchmarkResult],
+    baseline: Optional[Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    regressions = []
+    print(
+        f"{'benchmark':<46}{'p50 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'p50 vs base':>14}"
+    )
+    for name, result in results.items():
+        base = (baseline or {}).get(name)
+        change = ""
+        if base is not None:
+            slowdown = result.p50_ms / base["p50_ms"] - 1
+            change = f"{slowdown:+.0%}"
+            if slowdown > tolerance:
+                regressions.append(name)
+                change += " !"
+        print(
+            f"{name:<46}{result.p50_ms:>10.3f}{result.p99_ms:>10.3f}"
+            f"{result.ops_per_sec:>10.0f}{change:>14}"
+        )
+    return regressions
+
+
+def write_results(path: str, config: Dict[str, Any], results: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump({"config": config, "results": results}, results_file, indent=2)
+        results_file.write("\n")
+
+
+def read_baseline(path: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as baseline_file:
+        baseline: Dict[str, Any] = json.load(baseline_file)
+    if baseline["config"] != config:
+        print(f"Baseline was recorded with a different config: {baseline['config']}")
+    results: Dict[str, Any] = baseline["results"]
+    return results
+
+
+@cli.command()
+def run(
+    users: int = 1000,
+    transactions: int = 20000,
+    iterations: int = 500,
+    seed: int = 0,
+    skew: float = 1.2,
+    output: str = RESULTS_PATH,
+    baseline: str = BASELINE_PATH,
+    tolerance: float = 0.2,
+    update_baseline: bool = False,
+    check: bool = False,
+) -> None:
+    config = {
+        "users": users,
+        "transactions": transactions,
+        "iterations": iterations,
+        "seed": seed,
+        "skew": skew,
+        "python": platform.python_version(),
+    }
+    dataset = generate_dataset(users, transactions, seed, skew)
+    workload = create_workload(dataset, iterations, seed)
+    warmup = max(1, iterations // 10)
+    results: Dict[str, BenchmarkResult] = {}
+    for benchmark in (benchmark_services, benchmark_endpoints):
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = db_setup(os.path.join(directory, "benchmark.db"))
+            load_dataset(db_path, dataset)
+            repository_factory = repository_factory_for(db_path)
+            results.update(benchmark(repository_factory, workload, warmup))
+            repository_factory.close_connections()
+
+    serialized = {name: asdict(result) for name, result in results.items()}
+    write_results(output, config, serialized)
+    regressions = compare(results, read_baseline(baseline, config), tolerance)
+    if update_baseline:
+        write_results(baseline, config, serialized)
+    if regressions:
+        print(f"Slower than baseline by more than {tolerance:.0%}: {regressions}")
+        if check:
+            raise Exit(1)
+
+
+if __name__ == "__main__":
+    cli()
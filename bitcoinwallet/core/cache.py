@@ -0,0 +1,125 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from cachetools import LRUCache
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    capacity: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class BoundedCache(Generic[K, V]):
+    def __init__(self, capacity: int) -> None:
+        self._cache: LRUCache[K, V] = LRUCache(maxsize=capacity)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._cache[key] = value
+
+    def pop(self, key: K) -> Optional[V]:
+        with self._lock:
+            return self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._cache),
+                capacity=int(self._cache.maxsize),
+            )
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    hits: int
+    misses: int
+    coalesced: int
+    size: int
+
+
+class SingleFlightCache(Generic[K, V]):
+    def __init__(self, ttl: float, timer: Callable[[], float] = time.monotonic) -> None:
+        self._ttl = ttl
+        self._timer = timer
+        self._entries: Dict[K, Tuple[V, float]] = {}
+        self._flights: Dict[K, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    def get(self, key: K, loader: Callable[[], V]) -> V:
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and self._timer() < entry[1]:
+                    self._hits += 1
+                    return entry[0]
+                flight = self._flights.get(key)
+                if flight is None:
+                    self._misses += 1
+                    flight = self._flights[key] = threading.Event()
+                    break
+                self._coalesced += 1
+                if entry is not None:
+                    return entry[0]
+            flight.wait()
+        return self._load(key, loader, flight)
+
+    def refresh(self, key: K, loader: Callable[[], V]) -> V:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], float("-inf"))
+        return self.get(key, loader)
+
+    def get_stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(
+                hits=self._hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                size=len(self._entries),
+            )
+
+    def _load(self, key: K, loader: Callable[[], V], flight: threading.Event) -> V:
+        try:
+            value = loader()
+            with self._lock:
+                self._entries[key] = (value, self._timer() + self._ttl)
+            return value
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.set()
@@ -1,12 +1,49 @@
+import functools
+import sys
+import threading
+import time
 from abc import ABC
+from collections import deque
 from dataclasses import dataclass
+from datetime import datetime
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional, TextIO, Tuple
+
+from definitions import FORMAT, LOG_BATCH_SIZE, LOG_QUEUE_SIZE
+
+
+class LogLevel(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+
+def get_log_level(name: str) -> LogLevel:
+    try:
+        return LogLevel[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown log level: {name}") from None
+
+
+def format_message(msg: str, args: Tuple[Any, ...], fields: Dict[str, Any]) -> str:
+    message = msg % args if args else msg
+    if fields:
+        message += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+    return message
 
 
 class ILogger(ABC):
-    def info(self, msg: str) -> None:
+    def debug(self, msg: str, *args: Any, **fields: Any) -> None:
+        pass
+
+    def info(self, msg: str, *args: Any, **fields: Any) -> None:
         pass
 
-    def error(self, msg: str) -> None:
+    def warning(self, msg: str, *args: Any, **fields: Any) -> None:
+        pass
+
+    def error(self, msg: str, *args: Any, **fields: Any) -> None:
         pass
 
 
@@ -14,11 +51,186 @@ class ILogger(ABC):
 class ConsoleLogger(ILogger):
     class_name: str
 
-    def info(self, msg: str) -> None:
-        print("INFO: " + self.get_logging_message(msg))
+    def debug(self, msg: str, *args: Any, **fields: Any) -> None:
+        print("DEBUG: " + self.get_logging_message(format_message(msg, args, fields)))
+
+    def info(self, msg: str, *args: Any, **fields: Any) -> None:
+        print("INFO: " + self.get_logging_message(format_message(msg, args, fields)))
 
-    def error(self, msg: str) -> None:
-        print("ERROR: " + self.get_logging_message(msg))
+    def warning(self, msg: str, *args: Any, **fields: Any) -> None:
+        print("WARNING: " + self.get_logging_message(format_message(msg, args, fields)))
+
+    def error(self, msg: str, *args: Any, **fields: Any) -> None:
+        print("ERROR: " + self.get_logging_message(format_message(msg, args, fields)))
 
     def get_logging_message(self, msg: str) -> str:
         return f"LOGGING CLASS: {self.class_name}: " + msg
+
+
+class NullLogger(ILogger):
+    pass
+
+
+@dataclass(slots=True)
+class LogRecord:
+    created: float
+    level: LogLevel
+    class_name: str
+    msg: str
+    args: Tuple[Any, ...]
+    fields: Dict[str, Any]
+
+    def format(self) -> str:
+        created = datetime.fromtimestamp(self.created).strftime(FORMAT)
+        message = format_message(self.msg, self.args, self.fields)
+        return f"{created} {self.level.name} {self.class_name}: {message}\n"
+
+
+@dataclass(frozen=True)
+class LogWriterStats:
+    written: int
+    dropped: int
+    queued: int
+
+
+class LogWriter:
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        path: Optional[str] = None,
+        capacity: int = LOG_QUEUE_SIZE,
+        batch_size: int = LOG_BATCH_SIZE,
+    ) -> None:
+        self._stream = stream
+        self._path = path
+        self._capacity = capacity
+        self._batch_size = batch_size
+        self._records: Deque[LogRecord] = deque()
+        self._pending = threading.Event()
+        self._stopping = False
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._written = 0
+        self._dropped = 0
+
+    def submit(self, record: LogRecord) -> None:
+        with self._lock:
+            if len(self._records) >= self._capacity:
+                self._dropped += 1
+                return
+            self._records.append(record)
+            if self._writer is None and not self._stopping:
+                self._start_writer()
+        if not self._pending.is_set():
+            self._pending.set()
+
+    def get_stats(self) -> LogWriterStats:
+        with self._lock:
+            return LogWriterStats(
+                written=self._written,
+                dropped=self._dropped,
+                queued=len(self._records),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            writer, self._writer = self._writer, None
+            self._stopping = writer is not None
+        if writer is None:
+            return
+        self._pending.set()
+        writer.join()
+        with self._lock:
+            # Records submitted after the writer's last drain are written here;
+            # submit() does not start a new writer until _stopping is cleared.
+            self._stopping = False
+            remaining = list(self._records)
+            self._records.clear()
+            if remaining:
+                stream = self._open()
+                try:
+                    self._write_batch(stream, remaining)
+                finally:
+                    self._close_stream(stream)
+                self._written += len(remaining)
+
+    def _start_writer(self) -> None:
+        self._writer = threading.Thread(
+            target=self._write, name="log-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _write(self) -> None:
+        stream = self._open()
+        try:
+            while True:
+                self._pending.wait()
+                self._pending.clear()
+                stopping = self._stopping
+                self._drain(stream)
+                if stopping:
+                    return
+        finally:
+            self._close_stream(stream)
+
+    def _drain(self, stream: TextIO) -> None:
+        while self._records:
+            batch: List[LogRecord] = []
+            while self._records and len(batch) < self._batch_size:
+                batch.append(self._records.popleft())
+            self._write_batch(stream, batch)
+            with self._lock:
+                self._written += len(batch)
+
+    def _write_batch(self, stream: TextIO, batch: List[LogRecord]) -> None:
+        stream.write("".join(record.format() for record in batch))
+        stream.flush()
+
+    def _open(self) -> TextIO:
+        if self._stream is not None:
+            return self._stream
+        if self._path:
+            return open(self._path, "a", encoding="utf-8")
+        return sys.stdout
+
+    def _close_stream(self, stream: TextIO) -> None:
+        if stream is not self._stream and stream is not sys.stdout:
+            stream.close()
+
+
+@dataclass
+class BufferedLogger(ILogger):
+    class_name: str
+    writer: LogWriter
+    level: LogLevel = LogLevel.INFO
+
+    def debug(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.DEBUG, msg, args, fields)
+
+    def info(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.INFO, msg, args, fields)
+
+    def warning(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.WARNING, msg, args, fields)
+
+    def error(self, msg: str, *args: Any, **fields: Any) -> None:
+        self._log(LogLevel.ERROR, msg, args, fields)
+
+    def _log(
+        self, level: LogLevel, msg: str, args: Tuple[Any, ...], fields: Dict[str, Any]
+    ) -> None:
+        if level >= self.level:
+            self.writer.submit(
+                LogRecord(time.time(), level, self.class_name, msg, args, fields)
+            )
+
+
+LoggerFactory = Callable[[str], ILogger]
+
+
+def create_logger_factory(
+    writer: Optional[LogWriter], level: LogLevel = LogLevel.INFO
+) -> LoggerFactory:
+    if writer is None:
+        return ConsoleLogger
+    return functools.partial(BufferedLogger, writer=writer, level=level)
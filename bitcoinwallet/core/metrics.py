@@ -0,0 +1,348 @@
+import bisect
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from bitcoinwallet.core.cache import SingleFlightStats
+from bitcoinwallet.core.logger import LogWriterStats
+from bitcoinwallet.core.repository.connection_pool import PoolStats
+from bitcoinwallet.core.repository.query_observer import (
+    IQueryObserver,
+    query_operation,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[str, ...]
+Sample = Tuple[Labels, float]
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+QUERY_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.1)
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{escape_label_value(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Labels) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.render_samples(),
+        ]
+
+    @abstractmethod
+    def render_samples(self) -> List[str]:
+        pass
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Labels = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def get(self, labels: Labels = ()) -> float:
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def render_samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{format_labels(self.label_names, labels)} "
+            f"{format_value(value)}"
+            for labels, value in values
+        ]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._counts: Dict[Labels, List[int]] = {}
+        self._sums: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(labels)
+            if counts is None:
+                counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+                self._sums[labels] = 0.0
+            counts[index] += 1
+            self._sums[labels] += value
+
+    def get_count(self, labels: Labels = ()) -> int:
+        with self._lock:
+            return sum(self._counts.get(labels, ()))
+
+    def render_samples(self) -> List[str]:
+        with self._lock:
+            series = sorted(
+                (labels, list(counts), self._sums[labels])
+                for labels, counts in self._counts.items()
+            )
+        lines = []
+        bucket_labels = self.label_names + ("le",)
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = labels + (format_value(bound),)
+                lines.append(
+                    f"{self.name}_bucket{format_labels(bucket_labels, le)} "
+                    f"{cumulative}"
+                )
+            label_text = format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class CallbackMetric(Metric):
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels,
+        kind: str,
+        callback: Callable[[], Iterable[Sample]],
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.kind = kind
+        self._callback = callback
+
+    def render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{format_labels(self.label_names, labels)} "
+            f"{format_value(value)}"
+            for labels, value in self._callback()
+        ]
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str, label_names: Labels = ()
+    ) -> Counter:
+        counter = Counter(name, documentation, label_names)
+        self.register(counter)
+        return counter
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        histogram = Histogram(name, documentation, label_names, buckets)
+        self.register(histogram)
+        return histogram
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[Sample]],
+        label_names: Labels = (),
+        kind: str = "gauge",
+    ) -> CallbackMetric:
+        metric = CallbackMetric(name, documentation, label_names, kind, callback)
+        self.register(metric)
+        return metric
+
+    def register(self, metric: Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(line + "\n" for metric in metrics for line in metric.render())
+
+
+class MetricsQueryObserver(IQueryObserver):
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self.queries = registry.counter(
+            "db_queries_total", "SQL statements executed.", ("operation",)
+        )
+        self.rows = registry.counter(
+            "db_rows_total", "Rows fetched or written.", ("operation",)
+        )
+        self.query_duration = registry.histogram(
+            "db_query_duration_seconds",
+            "Time spent executing and fetching SQL statements.",
+            ("operation",),
+            QUERY_BUCKETS,
+        )
+        self.commit_duration = registry.histogram(
+            "db_commit_duration_seconds",
+            "Time spent committing transactions.",
+            buckets=QUERY_BUCKETS,
+        )
+
+    def on_execute(
+        self,
+        connection: sqlite3.Connection,
+        query: str,
+        parameters: Any,
+        duration: float,
+    ) -> None:
+        labels = (query_operation(query),)
+        self.queries.inc(labels)
+        self.query_duration.observe(duration, labels)
+        if labels[0] != "SELECT":
+            self.rows.inc(labels, len(parameters) if _is_batch(parameters) else 1)
+
+    def on_fetch(
+        self, connection: sqlite3.Connection, query: str, rows: int, duration: float
+    ) -> None:
+        labels = (query_operation(query),)
+        self.rows.inc(labels, rows)
+        self.query_duration.observe(duration, labels)
+
+    def on_commit(self, duration: float) -> None:
+        self.commit_duration.observe(duration)
+
+
+def _is_batch(parameters: Any) -> bool:
+    return isinstance(parameters, list) and bool(parameters)
+
+
+def register_pool_metrics(
+    registry: MetricsRegistry, get_stats: Callable[[], PoolStats]
+) -> None:
+    registry.callback(
+        "db_pool_connections",
+        "Database connections by state.",
+        lambda: _pool_connections(get_stats()),
+        ("state",),
+    )
+    registry.callback(
+        "db_pool_checkouts_total",
+        "Database connection checkouts.",
+        lambda: [((), get_stats().checkouts)],
+        kind="counter",
+    )
+    registry.callback(
+        "db_pool_waits_total",
+        "Checkouts that waited for a free connection.",
+        lambda: [((), get_stats().waits)],
+        kind="counter",
+    )
+    registry.callback(
+        "db_pool_timeouts_total",
+        "Checkouts that timed out.",
+        lambda: [((), get_stats().timeouts)],
+        kind="counter",
+    )
+
+
+def register_currency_metrics(
+    registry: MetricsRegistry, get_stats: Callable[[], SingleFlightStats]
+) -> None:
+    registry.callback(
+        "currency_rate_cache_total",
+        "BTC/USD rate lookups by cache result; every miss is a CoinGecko fetch.",
+        lambda: _cache_results(get_stats()),
+        ("result",),
+        kind="counter",
+    )
+
+
+def register_log_metrics(
+    registry: MetricsRegistry, get_stats: Callable[[], LogWriterStats]
+) -> None:
+    registry.callback(
+        "log_records_total",
+        "Log records by outcome; records are dropped when the queue is full.",
+        lambda: _log_records(get_stats()),
+        ("result",),
+        kind="counter",
+    )
+    registry.callback(
+        "log_queue_size",
+        "Log records waiting for the writer thread.",
+        lambda: [((), get_stats().queued)],
+    )
+
+
+def _pool_connections(stats: PoolStats) -> List[Sample]:
+    return [
+        (("size",), stats.size),
+        (("opened",), stats.opened),
+        (("in_use",), stats.in_use),
+        (("high_water_mark",), stats.high_water_mark),
+    ]
+
+
+def _cache_results(stats: SingleFlightStats) -> List[Sample]:
+    return [
+        (("hit",), stats.hits),
+        (("miss",), stats.misses),
+        (("coalesced",), stats.coalesced),
+    ]
+
+
+def _log_records(stats: LogWriterStats) -> List[Sample]:
+    return [(("written",), stats.written), (("dropped",), stats.dropped)]
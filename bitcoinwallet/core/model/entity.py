@@ -72,3 +72,21 @@ class TransactionEntity(Entity):
     @staticmethod
     def get_primary_key() -> str:
         return "id"
+
+
+PLATFORM_STATISTICS_ID = "platform"
+
+
+@dataclass
+class PlatformStatisticsEntity(Entity):
+    id: str
+    transactions_num: int
+    platform_profit: int
+
+    @staticmethod
+    def get_table_name() -> str:
+        return "platform_statistics"
+
+    @staticmethod
+    def get_primary_key() -> str:
+        return "id"
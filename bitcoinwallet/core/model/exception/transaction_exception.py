@@ -0,0 +1,9 @@
+from bitcoinwallet.core.model.exception.exception import InvalidInputException
+
+
+class InvalidCursorException(InvalidInputException):
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+
+    def get_msg(self) -> str:
+        return f"Invalid pagination cursor: {self.cursor}"
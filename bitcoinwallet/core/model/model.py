@@ -1,4 +1,9 @@
-from pydantic import BaseModel
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from definitions import MAX_TRANSACTIONS_BATCH_SIZE
 
 
 class CreateUserResponse(BaseModel):
@@ -29,8 +34,34 @@ class CreateTransactionResponse(BaseModel):
     transaction: TransactionModel
 
 
+class BatchMode(str, Enum):
+    ATOMIC = "atomic"
+    BEST_EFFORT = "best_effort"
+
+
+class CreateTransactionsRequest(BaseModel):
+    transactions: list[CreateTransactionRequest] = Field(
+        min_length=1, max_length=MAX_TRANSACTIONS_BATCH_SIZE
+    )
+    mode: BatchMode = BatchMode.ATOMIC
+
+
+class TransactionResult(BaseModel):
+    status: str
+    transaction: TransactionModel
+    transaction_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class CreateTransactionsResponse(BaseModel):
+    completed: int
+    failed: int
+    results: list[TransactionResult]
+
+
 class ListTransactionsResponse(BaseModel):
     transactions: list[TransactionModel]
+    next_cursor: Optional[str] = None
 
 
 class WalletBalanceResponse(BaseModel):
@@ -1,4 +1,16 @@
+import json
+import math
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Optional, Tuple
+
+from bitcoinwallet.core.model.exception.transaction_exception import (
+    InvalidCursorException,
+)
+
+SQLITE_INTEGER_MIN = -(2**63)
+SQLITE_INTEGER_MAX = 2**63 - 1
 
 
 class Operator(Enum):
@@ -18,3 +30,53 @@ class Logical(Enum):
     OR = "OR"
     OPEN = "("
     CLOSE = ")"
+
+
+class Aggregate(Enum):
+    COUNT = "COUNT"
+    SUM = "SUM"
+    MIN = "MIN"
+    MAX = "MAX"
+    AVG = "AVG"
+
+
+@dataclass(frozen=True)
+class AggregateExpression:
+    function: Aggregate
+    field: str = "*"
+    alias: Optional[str] = None
+
+    def to_sql(self) -> str:
+        expression = f"{self.function.value}({self.field})"
+        return f"{expression} AS {self.alias}" if self.alias else expression
+
+
+@dataclass(frozen=True)
+class Keyset:
+    fields: Tuple[str, ...]
+    values: Tuple[Any, ...]
+
+    def encode(self) -> str:
+        return urlsafe_b64encode(json.dumps(self.values).encode()).decode()
+
+    @classmethod
+    def decode(cls, fields: Tuple[str, ...], cursor: str) -> "Keyset":
+        try:
+            values = json.loads(urlsafe_b64decode(cursor.encode()))
+        except ValueError:
+            raise InvalidCursorException(cursor)
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise InvalidCursorException(cursor)
+        if not all(cls._is_bindable(value) for value in values):
+            raise InvalidCursorException(cursor)
+        return cls(fields, tuple(values))
+
+    @staticmethod
+    def _is_bindable(value: Any) -> bool:
+        if isinstance(value, bool):
+            return False
+        if isinstance(value, int):
+            return SQLITE_INTEGER_MIN <= value <= SQLITE_INTEGER_MAX
+        if isinstance(value, float):
+            return math.isfinite(value)
+        return isinstance(value, str)
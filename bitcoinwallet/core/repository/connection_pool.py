@@ -0,0 +1,183 @@
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+from bitcoinwallet.core.repository.query_observer import (
+    IQueryObserver,
+    ObservedConnection,
+)
+from bitcoinwallet.core.repository.storage_profile import (
+    StorageProfile,
+    get_storage_profile,
+)
+from definitions import DB_POOL_SIZE, DB_POOL_TIMEOUT, STORAGE_PROFILE
+
+
+class ConnectionPoolTimeoutError(Exception):
+    def __init__(self, timeout: float) -> None:
+        super().__init__(f"No database connection available after {timeout}s")
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    opened: int
+    in_use: int
+    checkouts: int
+    waits: int
+    timeouts: int
+    high_water_mark: int
+
+
+class IConnectionPool(ABC):
+    @abstractmethod
+    def connection(self) -> ContextManager[sqlite3.Connection]:
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> PoolStats:
+        pass
+
+    @abstractmethod
+    def get_storage_profile(self) -> StorageProfile:
+        pass
+
+    @abstractmethod
+    def set_storage_profile(self, storage_profile: StorageProfile) -> None:
+        pass
+
+    @abstractmethod
+    def get_query_observer(self) -> Optional[IQueryObserver]:
+        pass
+
+    @abstractmethod
+    def set_query_observer(self, query_observer: Optional[IQueryObserver]) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class ConnectionPool(IConnectionPool):
+    def __init__(
+        self,
+        db_path: str,
+        size: int = DB_POOL_SIZE,
+        timeout: float = DB_POOL_TIMEOUT,
+        storage_profile: Optional[StorageProfile] = None,
+        query_observer: Optional[IQueryObserver] = None,
+    ) -> None:
+        self._db_path = db_path
+        self._size = size
+        self._timeout = timeout
+        self._storage_profile = (
+            get_storage_profile(STORAGE_PROFILE)
+            if storage_profile is None
+            else storage_profile
+        )
+        self._query_observer = query_observer
+        self._idle: List[sqlite3.Connection] = []
+        self._available = threading.Condition()
+        self._generation = 0
+        self._connection_generations: Dict[int, int] = {}
+        self._opened = 0
+        self._in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._high_water_mark = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._checkout()
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            self._release(connection)
+
+    def get_stats(self) -> PoolStats:
+        with self._available:
+            return PoolStats(
+                size=self._size,
+                opened=self._opened,
+                in_use=self._in_use,
+                checkouts=self._checkouts,
+                waits=self._waits,
+                timeouts=self._timeouts,
+                high_water_mark=self._high_water_mark,
+            )
+
+    def get_storage_profile(self) -> StorageProfile:
+        return self._storage_profile
+
+    def set_storage_profile(self, storage_profile: StorageProfile) -> None:
+        with self._available:
+            self._storage_profile = storage_profile
+        self.close()
+
+    def get_query_observer(self) -> Optional[IQueryObserver]:
+        return self._query_observer
+
+    def set_query_observer(self, query_observer: Optional[IQueryObserver]) -> None:
+        with self._available:
+            self._query_observer = query_observer
+        self.close()
+
+    def close(self) -> None:
+        with self._available:
+            self._generation += 1
+            while self._idle:
+                self._discard(self._idle.pop())
+            self._available.notify_all()
+
+    def _checkout(self) -> sqlite3.Connection:
+        with self._available:
+            self._checkouts += 1
+            deadline: Optional[float] = None
+            while not self._idle and self._opened >= self._size:
+                if deadline is None:
+                    self._waits += 1
+                    deadline = time.monotonic() + self._timeout
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._available.wait(remaining):
+                    self._timeouts += 1
+                    raise ConnectionPoolTimeoutError(self._timeout)
+
+            connection = self._idle.pop() if self._idle else self._open()
+            self._in_use += 1
+            self._high_water_mark = max(self._high_water_mark, self._in_use)
+            return connection
+
+    def _release(self, connection: sqlite3.Connection) -> None:
+        with self._available:
+            self._in_use -= 1
+            if self._connection_generations.get(id(connection)) == self._generation:
+                self._idle.append(connection)
+            else:
+                self._discard(connection)
+            self._available.notify()
+
+    def _open(self) -> sqlite3.Connection:
+        if self._query_observer is None:
+            connection = sqlite3.connect(self._db_path, check_same_thread=False)
+        else:
+            connection = sqlite3.connect(
+                self._db_path, check_same_thread=False, factory=ObservedConnection
+            )
+            connection.observer = self._query_observer
+        self._storage_profile.apply(connection)
+        self._connection_generations[id(connection)] = self._generation
+        self._opened += 1
+        return connection
+
+    def _discard(self, connection: sqlite3.Connection) -> None:
+        self._connection_generations.pop(id(connection), None)
+        self._opened -= 1
+        connection.close()
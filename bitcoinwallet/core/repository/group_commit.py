@@ -0,0 +1,187 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from bitcoinwallet.core.model.entity import TransactionEntity
+from bitcoinwallet.core.repository.ledger_repository import (
+    ILedgerRepository,
+    TransferOutcome,
+    TransferStatus,
+)
+from definitions import GROUP_COMMIT_MAX_BATCH_SIZE, GROUP_COMMIT_MAX_WAIT_US
+
+
+@dataclass(frozen=True)
+class PendingTransfer:
+    user_api_key: str
+    transaction: TransactionEntity
+    result: "Future[TransferStatus]"
+
+
+PendingQueue = queue.Queue[Optional[PendingTransfer]]
+
+
+@dataclass(frozen=True)
+class GroupCommitStats:
+    transfers: int
+    batches: int
+    largest_batch: int
+
+    @property
+    def average_batch(self) -> float:
+        return self.transfers / self.batches if self.batches else 0.0
+
+
+class GroupCommitLedgerRepository(ILedgerRepository):
+    def __init__(
+        self,
+        ledger_repository: ILedgerRepository,
+        max_batch_size: int = GROUP_COMMIT_MAX_BATCH_SIZE,
+        max_wait_us: int = GROUP_COMMIT_MAX_WAIT_US,
+    ) -> None:
+        self._ledger_repository = ledger_repository
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_us / 1_000_000
+        self._writer: Optional[threading.Thread] = None
+        self._writer_queue: Optional[PendingQueue] = None
+        self._lock = threading.Lock()
+        self._transfers = 0
+        self._batches = 0
+        self._largest_batch = 0
+
+    def transfer(
+        self, user_api_key: str, transaction: TransactionEntity
+    ) -> TransferStatus:
+        result: Future[TransferStatus] = Future()
+        with self._lock:
+            self._start_writer().put(PendingTransfer(user_api_key, transaction, result))
+        return result.result()
+
+    def transfer_many(
+        self,
+        user_api_key: str,
+        transactions: List[TransactionEntity],
+        atomic: bool = True,
+    ) -> List[TransferStatus]:
+        return self._ledger_repository.transfer_many(user_api_key, transactions, atomic)
+
+    def transfer_each(
+        self, transfers: Sequence[Tuple[str, TransactionEntity]]
+    ) -> List[TransferOutcome]:
+        return self._ledger_repository.transfer_each(transfers)
+
+    def record_transaction(self, transaction: TransactionEntity) -> None:
+        self._ledger_repository.record_transaction(transaction)
+
+    def rebuild_statistics(self) -> None:
+        self._ledger_repository.rebuild_statistics()
+
+    def get_stats(self) -> GroupCommitStats:
+        with self._lock:
+            return GroupCommitStats(
+                transfers=self._transfers,
+                batches=self._batches,
+                largest_batch=self._largest_batch,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            writer, self._writer = self._writer, None
+            pending, self._writer_queue = self._writer_queue, None
+            if pending is not None:
+                pending.put(None)
+        if writer is not None:
+            writer.join()
+
+    def _start_writer(self) -> PendingQueue:
+        # Each writer owns its queue, so a writer started after close() can
+        # never take the stop sentinel meant for the writer being closed.
+        if self._writer_queue is None:
+            self._writer_queue = queue.Queue()
+            self._writer = threading.Thread(
+                target=self._write,
+                args=(self._writer_queue,),
+                name="group-commit",
+                daemon=True,
+            )
+            self._writer.start()
+        return self._writer_queue
+
+    def _write(self, pending: PendingQueue) -> None:
+        batch: List[PendingTransfer] = []
+        try:
+            while True:
+                batch, stopping = self._collect_batch(pending)
+                if batch:
+                    self._commit(batch)
+                if stopping:
+                    return
+        except BaseException as error:
+            self._fail_pending(pending, batch, error)
+            raise
+
+    def _fail_pending(
+        self,
+        pending_queue: PendingQueue,
+        batch: List[PendingTransfer],
+        error: BaseException,
+    ) -> None:
+        with self._lock:
+            if self._writer_queue is pending_queue:
+                self._writer = None
+                self._writer_queue = None
+            pending = list(batch)
+            while not pending_queue.empty():
+                item = pending_queue.get_nowait()
+                if item is not None:
+                    pending.append(item)
+        failure = RuntimeError("Group commit writer stopped")
+        failure.__cause__ = error
+        for item in pending:
+            if not item.result.done():
+                item.result.set_exception(failure)
+
+    def _collect_batch(
+        self, pending_queue: PendingQueue
+    ) -> Tuple[List[PendingTransfer], bool]:
+        first = pending_queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self._max_wait
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                pending = (
+                    pending_queue.get(timeout=remaining)
+                    if remaining > 0
+                    else pending_queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if pending is None:
+                return batch, True
+            batch.append(pending)
+        return batch, False
+
+    def _commit(self, batch: List[PendingTransfer]) -> None:
+        try:
+            outcomes = self._ledger_repository.transfer_each(
+                [(pending.user_api_key, pending.transaction) for pending in batch]
+            )
+        except Exception as e:
+            for pending in batch:
+                pending.result.set_exception(e)
+            return
+        with self._lock:
+            self._transfers += len(batch)
+            self._batches += 1
+            self._largest_batch = max(self._largest_batch, len(batch))
+        for pending, outcome in zip(batch, outcomes):
+            if isinstance(outcome, Exception):
+                pending.result.set_exception(outcome)
+            else:
+                pending.result.set_result(outcome)
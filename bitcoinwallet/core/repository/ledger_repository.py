@@ -0,0 +1,267 @@
+import sqlite3
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import List, Sequence, Tuple, Union
+
+from bitcoinwallet.core.model.entity import (
+    PLATFORM_STATISTICS_ID,
+    TransactionEntity,
+)
+from bitcoinwallet.core.repository.connection_pool import IConnectionPool
+from bitcoinwallet.core.repository.statement import compile_statements
+
+
+class TransferStatus(Enum):
+    COMPLETED = "COMPLETED"
+    SOURCE_NOT_FOUND = "SOURCE_NOT_FOUND"
+    DESTINATION_NOT_FOUND = "DESTINATION_NOT_FOUND"
+    NOT_OWNER = "NOT_OWNER"
+    INSUFFICIENT_BALANCE = "INSUFFICIENT_BALANCE"
+    INVALID_AMOUNT = "INVALID_AMOUNT"
+    NOT_APPLIED = "NOT_APPLIED"
+
+
+TransferOutcome = Union[TransferStatus, Exception]
+
+DEBIT_QUERY = (
+    "UPDATE wallets SET balance = balance - ? "
+    "WHERE address = ? AND owner_api_key = ? AND balance >= ?"
+)
+CREDIT_QUERY = "UPDATE wallets SET balance = balance + ? WHERE address = ?"
+SOURCE_QUERY = "SELECT owner_api_key FROM wallets WHERE address = ?"
+RECORD_STATISTICS_QUERY = (
+    "UPDATE platform_statistics "
+    "SET transactions_num = transactions_num + 1, "
+    "platform_profit = platform_profit + ? "
+    "WHERE id = ?"
+)
+REBUILD_STATISTICS_QUERY = (
+    "INSERT OR REPLACE INTO platform_statistics "
+    "(id, transactions_num, platform_profit) "
+    "SELECT ?, COUNT(*), COALESCE(SUM(fee_cost), 0) FROM transactions"
+)
+
+
+class ILedgerRepository(ABC):
+    @abstractmethod
+    def transfer(
+        self, user_api_key: str, transaction: TransactionEntity
+    ) -> TransferStatus:
+        pass
+
+    @abstractmethod
+    def transfer_many(
+        self,
+        user_api_key: str,
+        transactions: List[TransactionEntity],
+        atomic: bool = True,
+    ) -> List[TransferStatus]:
+        pass
+
+    @abstractmethod
+    def transfer_each(
+        self, transfers: Sequence[Tuple[str, TransactionEntity]]
+    ) -> List[TransferOutcome]:
+        pass
+
+    @abstractmethod
+    def record_transaction(self, transaction: TransactionEntity) -> None:
+        pass
+
+    @abstractmethod
+    def rebuild_statistics(self) -> None:
+        pass
+
+
+class LedgerRepository(ILedgerRepository):
+    def __init__(self, connection_pool: IConnectionPool):
+        self._connection_pool = connection_pool
+        self._transaction_statements = compile_statements(TransactionEntity)
+
+    def transfer(
+        self, user_api_key: str, transaction: TransactionEntity
+    ) -> TransferStatus:
+        with self._connection_pool.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                status = self._apply_transfer(connection, user_api_key, transaction)
+            except Exception:
+                connection.rollback()
+                raise
+            if status is TransferStatus.COMPLETED:
+                connection.commit()
+            else:
+                connection.rollback()
+            return status
+
+    def transfer_many(
+        self,
+        user_api_key: str,
+        transactions: List[TransactionEntity],
+        atomic: bool = True,
+    ) -> List[TransferStatus]:
+        with self._connection_pool.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                if atomic:
+                    statuses = self._apply_all(connection, user_api_key, transactions)
+                else:
+                    statuses = self._raise_errors(
+                        self._apply_each(
+                            connection,
+                            [
+                                (user_api_key, transaction)
+                                for transaction in transactions
+                            ],
+                        )
+                    )
+            except Exception:
+                connection.rollback()
+                raise
+            if atomic and statuses.count(TransferStatus.COMPLETED) < len(statuses):
+                connection.rollback()
+            else:
+                connection.commit()
+            return statuses
+
+    def transfer_each(
+        self, transfers: Sequence[Tuple[str, TransactionEntity]]
+    ) -> List[TransferOutcome]:
+        with self._connection_pool.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                outcomes = self._apply_each(connection, transfers)
+            except Exception:
+                connection.rollback()
+                raise
+            connection.commit()
+            return outcomes
+
+    def record_transaction(self, transaction: TransactionEntity) -> None:
+        with self._connection_pool.connection() as connection, connection:
+            self._insert_transaction(connection, transaction)
+
+    def rebuild_statistics(self) -> None:
+        with self._connection_pool.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(REBUILD_STATISTICS_QUERY, (PLATFORM_STATISTICS_ID,))
+            except Exception:
+                connection.rollback()
+                raise
+            connection.commit()
+
+    def _apply_all(
+        self,
+        connection: sqlite3.Connection,
+        user_api_key: str,
+        transactions: List[TransactionEntity],
+    ) -> List[TransferStatus]:
+        for index, transaction in enumerate(transactions):
+            status = self._apply_transfer(connection, user_api_key, transaction)
+            if status is not TransferStatus.COMPLETED:
+                statuses = [TransferStatus.NOT_APPLIED] * len(transactions)
+                statuses[index] = status
+                return statuses
+        return [TransferStatus.COMPLETED] * len(transactions)
+
+    def _apply_each(
+        self,
+        connection: sqlite3.Connection,
+        transfers: Sequence[Tuple[str, TransactionEntity]],
+    ) -> List[TransferOutcome]:
+        outcomes: List[TransferOutcome] = []
+        for user_api_key, transaction in transfers:
+            connection.execute("SAVEPOINT transfer")
+            try:
+                outcome: TransferOutcome = self._apply_transfer(
+                    connection, user_api_key, transaction
+                )
+            except Exception as error:
+                outcome = error
+            if outcome is not TransferStatus.COMPLETED:
+                connection.execute("ROLLBACK TO transfer")
+            connection.execute("RELEASE transfer")
+            outcomes.append(outcome)
+        return outcomes
+
+    @staticmethod
+    def _raise_errors(outcomes: List[TransferOutcome]) -> List[TransferStatus]:
+        statuses = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+            statuses.append(outcome)
+        return statuses
+
+    def _apply_transfer(
+        self,
+        connection: sqlite3.Connection,
+        user_api_key: str,
+        transaction: TransactionEntity,
+    ) -> TransferStatus:
+        debit = transaction.amount + transaction.fee_cost
+        debited = connection.execute(
+            DEBIT_QUERY, (debit, transaction.from_addr, user_api_key, debit)
+        )
+        if debited.rowcount == 0:
+            return self._debit_failure(connection, user_api_key, transaction)
+
+        credited = connection.execute(
+            CREDIT_QUERY, (transaction.amount, transaction.to_addr)
+        )
+        if credited.rowcount == 0:
+            return TransferStatus.DESTINATION_NOT_FOUND
+
+        self._insert_transaction(connection, transaction)
+        return TransferStatus.COMPLETED
+
+    def _insert_transaction(
+        self, connection: sqlite3.Connection, transaction: TransactionEntity
+    ) -> None:
+        connection.execute(
+            self._transaction_statements.insert,
+            self._transaction_statements.to_row(transaction),
+        )
+        connection.execute(
+            RECORD_STATISTICS_QUERY, (transaction.fee_cost, PLATFORM_STATISTICS_ID)
+        )
+
+    @staticmethod
+    def _debit_failure(
+        connection: sqlite3.Connection,
+        user_api_key: str,
+        transaction: TransactionEntity,
+    ) -> TransferStatus:
+        source = connection.execute(SOURCE_QUERY, (transaction.from_addr,)).fetchone()
+        if source is None:
+            return TransferStatus.SOURCE_NOT_FOUND
+        if source[0] != user_api_key:
+            return TransferStatus.NOT_OWNER
+        return TransferStatus.INSUFFICIENT_BALANCE
+
+
+class NullLedgerRepository(ILedgerRepository):
+    def transfer(
+        self, user_api_key: str, transaction: TransactionEntity
+    ) -> TransferStatus:
+        return TransferStatus.COMPLETED
+
+    def transfer_many(
+        self,
+        user_api_key: str,
+        transactions: List[TransactionEntity],
+        atomic: bool = True,
+    ) -> List[TransferStatus]:
+        return [TransferStatus.COMPLETED] * len(transactions)
+
+    def transfer_each(
+        self, transfers: Sequence[Tuple[str, TransactionEntity]]
+    ) -> List[TransferOutcome]:
+        return [TransferStatus.COMPLETED for _ in transfers]
+
+    def record_transaction(self, transaction: TransactionEntity) -> None:
+        pass
+
+    def rebuild_statistics(self) -> None:
+        pass
@@ -0,0 +1,163 @@
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import Any, Iterable, List, Literal, Optional, Type
+
+TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "PRAGMA")
+
+
+def query_operation(query: str) -> str:
+    return query.lstrip().split(None, 1)[0].upper() if query.strip() else ""
+
+
+class IQueryObserver(ABC):
+    @abstractmethod
+    def on_execute(
+        self,
+        connection: sqlite3.Connection,
+        query: str,
+        parameters: Any,
+        duration: float,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def on_fetch(
+        self, connection: sqlite3.Connection, query: str, rows: int, duration: float
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def on_commit(self, duration: float) -> None:
+        pass
+
+
+class CompositeQueryObserver(IQueryObserver):
+    def __init__(self, observers: Iterable[IQueryObserver]) -> None:
+        self.observers = list(observers)
+
+    def on_execute(
+        self,
+        connection: sqlite3.Connection,
+        query: str,
+        parameters: Any,
+        duration: float,
+    ) -> None:
+        for observer in self.observers:
+            observer.on_execute(connection, query, parameters, duration)
+
+    def on_fetch(
+        self, connection: sqlite3.Connection, query: str, rows: int, duration: float
+    ) -> None:
+        for observer in self.observers:
+            observer.on_fetch(connection, query, rows, duration)
+
+    def on_commit(self, duration: float) -> None:
+        for observer in self.observers:
+            observer.on_commit(duration)
+
+
+class NullQueryObserver(IQueryObserver):
+    def on_execute(
+        self,
+        connection: sqlite3.Connection,
+        query: str,
+        parameters: Any,
+        duration: float,
+    ) -> None:
+        pass
+
+    def on_fetch(
+        self, connection: sqlite3.Connection, query: str, rows: int, duration: float
+    ) -> None:
+        pass
+
+    def on_commit(self, duration: float) -> None:
+        pass
+
+
+class ObservedCursor(sqlite3.Cursor):
+    query = ""
+
+    def execute(self, sql: str, parameters: Any = (), /) -> "ObservedCursor":
+        start = time.perf_counter()
+        super().execute(sql, parameters)
+        self._on_execute(sql, parameters, time.perf_counter() - start)
+        return self
+
+    def executemany(
+        self, sql: str, seq_of_parameters: Iterable[Any]
+    ) -> "ObservedCursor":
+        parameters = list(seq_of_parameters)
+        start = time.perf_counter()
+        super().executemany(sql, parameters)
+        self._on_execute(sql, parameters, time.perf_counter() - start)
+        return self
+
+    def fetchone(self) -> Any:
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._on_fetch(0 if row is None else 1, time.perf_counter() - start)
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Any]:
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._on_fetch(len(rows), time.perf_counter() - start)
+        return rows
+
+    def fetchall(self) -> List[Any]:
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._on_fetch(len(rows), time.perf_counter() - start)
+        return rows
+
+    def _on_execute(self, sql: str, parameters: Any, duration: float) -> None:
+        self.query = sql
+        if query_operation(sql) not in TRANSACTION_CONTROL:
+            connection = self._connection()
+            connection.observer.on_execute(connection, sql, parameters, duration)
+
+    def _on_fetch(self, rows: int, duration: float) -> None:
+        connection = self._connection()
+        connection.observer.on_fetch(connection, self.query, rows, duration)
+
+    def _connection(self) -> "ObservedConnection":
+        connection = self.connection
+        assert isinstance(connection, ObservedConnection)
+        return connection
+
+
+class ObservedConnection(sqlite3.Connection):
+    observer: IQueryObserver = NullQueryObserver()
+
+    def cursor(self, factory: Any = ObservedCursor) -> Any:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:
+        return ObservedCursor(self).execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> sqlite3.Cursor:
+        return ObservedCursor(self).executemany(sql, seq_of_parameters)
+
+    def commit(self) -> None:
+        if not self.in_transaction:
+            return super().commit()
+        start = time.perf_counter()
+        super().commit()
+        self.observer.on_commit(time.perf_counter() - start)
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+        /,
+    ) -> Literal[False]:
+        if exc_type is not None or not self.in_transaction:
+            return super().__exit__(exc_type, exc_value, traceback)
+        start = time.perf_counter()
+        result = super().__exit__(exc_type, exc_value, traceback)
+        self.observer.on_commit(time.perf_counter() - start)
+        return result
@@ -0,0 +1,123 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from bitcoinwallet.core.logger import ConsoleLogger, ILogger
+from bitcoinwallet.core.repository.query_observer import IQueryObserver
+from definitions import SLOW_QUERY_THRESHOLD_MS
+
+
+class QueryBudgetExceededError(AssertionError):
+    def __init__(self, name: str, queries: int, max_queries: int) -> None:
+        super().__init__(
+            f"{name} issued {queries} queries, over its budget of {max_queries}"
+        )
+
+
+@dataclass
+class QueryProfile:
+    queries: int = 0
+    rows: int = 0
+    duration: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def add_query(self, duration: float) -> None:
+        with self._lock:
+            self.queries += 1
+            self.duration += duration
+
+    def add_rows(self, rows: int, duration: float) -> None:
+        with self._lock:
+            self.rows += rows
+            self.duration += duration
+
+
+_current_profile: ContextVar[Optional[QueryProfile]] = ContextVar(
+    "query_profile", default=None
+)
+
+
+def current_query_profile() -> Optional[QueryProfile]:
+    return _current_profile.get()
+
+
+@contextmanager
+def profile_queries() -> Iterator[QueryProfile]:
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int, name: str = "block") -> Iterator[QueryProfile]:
+    with profile_queries() as profile:
+        yield profile
+    check_query_budget(name, profile, max_queries)
+
+
+def check_query_budget(name: str, profile: QueryProfile, max_queries: int) -> None:
+    if profile.queries > max_queries:
+        raise QueryBudgetExceededError(name, profile.queries, max_queries)
+
+
+class QueryProfiler(IQueryObserver):
+    def __init__(
+        self,
+        logger: ILogger = ConsoleLogger("QueryProfiler"),
+        slow_query_threshold_ms: float = SLOW_QUERY_THRESHOLD_MS,
+    ) -> None:
+        self.logger = logger
+        self.slow_query_threshold = slow_query_threshold_ms / 1000
+
+    def on_execute(
+        self,
+        connection: sqlite3.Connection,
+        query: str,
+        parameters: Any,
+        duration: float,
+    ) -> None:
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.add_query(duration)
+        if duration >= self.slow_query_threshold:
+            self._log_slow_query(connection, query, duration)
+
+    def on_fetch(
+        self, connection: sqlite3.Connection, query: str, rows: int, duration: float
+    ) -> None:
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.add_rows(rows, duration)
+        if duration >= self.slow_query_threshold:
+            self._log_slow_query(connection, query, duration)
+
+    def on_commit(self, duration: float) -> None:
+        pass
+
+    def _log_slow_query(
+        self, connection: sqlite3.Connection, query: str, duration: float
+    ) -> None:
+        self.logger.error(
+            "Slow query (%.1f ms): %s",
+            duration * 1000,
+            " ".join(query.split()),
+            plan=explain_query_plan(connection, query),
+        )
+
+
+def explain_query_plan(connection: sqlite3.Connection, query: str) -> str:
+    parameters = [None] * query.count("?")
+    try:
+        cursor = sqlite3.Cursor(connection)
+        rows = cursor.execute(f"EXPLAIN QUERY PLAN {query}", parameters).fetchall()
+    except sqlite3.Error as e:
+        return f"unavailable ({e})"
+    return "; ".join(str(row[-1]) for row in rows) or "none"
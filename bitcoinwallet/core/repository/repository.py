@@ -1,12 +1,39 @@
 import sqlite3
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Tuple, Type, TypeVar, Union
+from itertools import islice
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from bitcoinwallet.core.logger import ILogger
 from bitcoinwallet.core.model.entity import Entity
-from bitcoinwallet.core.model.query import Logical, Operator
+from bitcoinwallet.core.model.query import (
+    AggregateExpression,
+    Keyset,
+    Logical,
+    Operator,
+)
+from bitcoinwallet.core.repository.connection_pool import IConnectionPool
+from bitcoinwallet.core.repository.statement import compile_statements
+from definitions import BULK_CHUNK_SIZE, QUERY_BATCH_SIZE
 
 T = TypeVar("T", bound=Entity)
+V = TypeVar("V")
+
+
+def chunked(iterable: Iterable[V], chunk_size: int) -> Iterator[List[V]]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
 
 
 class IRepository(ABC):
@@ -14,6 +41,10 @@ class IRepository(ABC):
     def create(self, entity: T) -> None:
         pass
 
+    @abstractmethod
+    def create_if_count_below(self, entity: T, field_name: str, limit: int) -> bool:
+        pass
+
     @abstractmethod
     def read(self, entity_id: str) -> Optional[Entity]:
         pass
@@ -30,14 +61,68 @@ class IRepository(ABC):
     def get_by_field(self, field_name: str, field_value: Any) -> List[Entity]:
         pass
 
+    @abstractmethod
+    def create_many(
+        self, entities: Iterable[T], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def update_many(
+        self, entities: Iterable[T], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def delete_many(
+        self, entity_ids: Iterable[str], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        pass
+
     def query_with_builder(
         self,
         conditions: List[Union[Tuple[str, Operator, Any], Logical]],
         order_by: Optional[str] = None,
         limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[Entity]:
+        return []
+
+    def query_union(
+        self,
+        branches: List[List[Union[Tuple[str, Operator, Any], Logical]]],
+        order_by: str,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
     ) -> List[Entity]:
         return []
 
+    @abstractmethod
+    def exists(
+        self, conditions: List[Union[Tuple[str, Operator, Any], Logical]]
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    def aggregate(
+        self,
+        expressions: List[AggregateExpression],
+        conditions: List[Union[Tuple[str, Operator, Any], Logical]],
+        group_by: Optional[List[str]] = None,
+        having: Optional[List[Union[Tuple[str, Operator, Any], Logical]]] = None,
+        order_by: Optional[str] = None,
+    ) -> List[sqlite3.Row]:
+        pass
+
+    @abstractmethod
+    def iter_query(
+        self,
+        conditions: List[Union[Tuple[str, Operator, Any], Logical]],
+        order_by: Optional[str] = None,
+        batch_size: int = QUERY_BATCH_SIZE,
+    ) -> Iterator[Entity]:
+        pass
+
     @abstractmethod
     def close_connection(self) -> None:
         pass
@@ -46,61 +131,114 @@ class IRepository(ABC):
 class Repository(IRepository):
     logger: ILogger
 
-    def __init__(self, entity_class: Type[T], db_path: str):
+    def __init__(self, entity_class: Type[T], connection_pool: IConnectionPool):
         self._entity_class = entity_class
-        self._db_path = db_path
-        self._connection = sqlite3.connect(db_path, check_same_thread=False)
-        self._cursor = self._connection.cursor()
+        self._connection_pool = connection_pool
+        self._statements = compile_statements(entity_class)
 
     def create(self, entity: T) -> None:
-        table_name = self._entity_class.get_table_name()
-        columns = ", ".join(entity.__dict__.keys())
-        placeholders = ", ".join(["?" for _ in entity.__dict__.values()])
-        values = tuple(entity.__dict__.values())
-        query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-        self._cursor.execute(query, values)
-        self._connection.commit()
+        self._write(self._statements.insert, self._statements.to_row(entity))
 
-    def read(self, entity_id: str) -> Optional[Entity]:
-        table_name = self._entity_class.get_table_name()
-        primary_key = self._entity_class.get_primary_key()
+    def create_if_count_below(self, entity: T, field_name: str, limit: int) -> bool:
+        query = self._statements.insert_if_count_below(field_name)
+        values = (*self._statements.to_row(entity), getattr(entity, field_name), limit)
+        with self._connection_pool.connection() as connection, connection:
+            return connection.execute(query, values).rowcount == 1
 
-        query = f"SELECT * FROM {table_name} WHERE {primary_key} = ?"
-        self._cursor.execute(query, (entity_id,))
-        result = self._cursor.fetchone()
-        return self._create_entity(result) if result else None
+    def read(self, entity_id: str) -> Optional[Entity]:
+        results = self._fetch_all(self._statements.select_by_id, (entity_id,))
+        return results[0] if results else None
 
     def update(self, entity: T) -> None:
-        table_name = self._entity_class.get_table_name()
-        set_clause = ", ".join([f"{key} = ?" for key in entity.__dict__.keys()])
-        primary_key = self._entity_class.get_primary_key()
-        values = tuple(entity.__dict__.values()) + (entity.__dict__[primary_key],)
-        query = f"UPDATE {table_name} SET {set_clause} WHERE {primary_key} = ?"
-        self._cursor.execute(query, values)
-        self._connection.commit()
+        self._write(self._statements.update, self._statements.to_update_row(entity))
 
     def delete(self, entity_id: str) -> None:
-        table_name = self._entity_class.get_table_name()
-        primary_key = self._entity_class.get_primary_key()
-        query = f"DELETE FROM {table_name} WHERE {primary_key} = ?"
-        self._cursor.execute(query, (entity_id,))
-        self._connection.commit()
+        self._write(self._statements.delete, (entity_id,))
 
     def get_by_field(self, field_name: str, field_value: Any) -> List[Entity]:
-        table_name = self._entity_class.get_table_name()
-        query = f"SELECT * FROM {table_name} WHERE {field_name} = ?"
-        self._cursor.execute(query, (field_value,))
-        results = self._cursor.fetchall()
-        return [self._create_entity(result) for result in results]
+        query = self._statements.select_by_field(field_name)
+        return self._fetch_all(query, (field_value,))
+
+    def create_many(
+        self, entities: Iterable[T], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        self._execute_many(
+            self._statements.insert,
+            map(self._statements.to_row, entities),
+            chunk_size,
+        )
+
+    def update_many(
+        self, entities: Iterable[T], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        self._execute_many(
+            self._statements.update,
+            map(self._statements.to_update_row, entities),
+            chunk_size,
+        )
+
+    def delete_many(
+        self, entity_ids: Iterable[str], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        self._execute_many(
+            self._statements.delete,
+            ((entity_id,) for entity_id in entity_ids),
+            chunk_size,
+        )
+
+    def _execute_many(
+        self, query: str, rows: Iterable[Tuple[Any, ...]], chunk_size: int
+    ) -> None:
+        with self._connection_pool.connection() as connection, connection:
+            cursor = connection.cursor()
+            for chunk in chunked(rows, chunk_size):
+                cursor.executemany(query, chunk)
+
+    def _write(self, query: str, values: Sequence[Any]) -> None:
+        with self._connection_pool.connection() as connection, connection:
+            connection.execute(query, values)
+
+    def _fetch_all(self, query: str, values: Sequence[Any]) -> List[Entity]:
+        with self._connection_pool.connection() as connection:
+            cursor = connection.cursor()
+            cursor.row_factory = self._statements.row_factory
+            return cursor.execute(query, values).fetchall()
 
     def _build_query(
         self,
         conditions: List[Union[Tuple[str, Operator, Any], Logical]],
         order_by: Optional[str] = None,
         limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
     ) -> tuple[str, List[Any]]:
-        table_name = self._entity_class.get_table_name()
+        query_parts, values = self._build_conditions(conditions)
+
+        if after:
+            keyset_placeholders = ", ".join(["?" for _ in after.fields])
+            keyset_clause = f"({', '.join(after.fields)}) > ({keyset_placeholders})"
+            query_parts = (
+                [f"({' '.join(query_parts)}) AND {keyset_clause}"]
+                if query_parts
+                else [keyset_clause]
+            )
+            values.extend(after.values)
+
+        query = self._statements.select
+        if query_parts:
+            query += f" WHERE {' '.join(query_parts)}"
+
+        if order_by:
+            query += f" ORDER BY {order_by}"
 
+        if limit:
+            query += f" LIMIT {limit}"
+
+        return query, values
+
+    @staticmethod
+    def _build_conditions(
+        conditions: List[Union[Tuple[str, Operator, Any], Logical]],
+    ) -> tuple[List[str], List[Any]]:
         query_parts = []
         values = []
 
@@ -118,42 +256,107 @@ class Repository(IRepository):
                     query_parts.append(f"{field} {operator.value} ?")
                     values.append(value)
 
-        query = f"SELECT * FROM {table_name}"
+        return query_parts, values
+
+    def exists(
+        self, conditions: List[Union[Tuple[str, Operator, Any], Logical]]
+    ) -> bool:
+        table_name = self._entity_class.get_table_name()
+        query = f"SELECT 1 FROM {table_name}"
+        query_parts, values = self._build_conditions(conditions)
         if query_parts:
             query += f" WHERE {' '.join(query_parts)}"
+        query += " LIMIT 1"
+
+        with self._connection_pool.connection() as connection:
+            return connection.execute(query, values).fetchone() is not None
+
+    def aggregate(
+        self,
+        expressions: List[AggregateExpression],
+        conditions: List[Union[Tuple[str, Operator, Any], Logical]],
+        group_by: Optional[List[str]] = None,
+        having: Optional[List[Union[Tuple[str, Operator, Any], Logical]]] = None,
+        order_by: Optional[str] = None,
+    ) -> List[sqlite3.Row]:
+        table_name = self._entity_class.get_table_name()
+        select_list = list(group_by or []) + [
+            expression.to_sql() for expression in expressions
+        ]
+        query = f"SELECT {', '.join(select_list)} FROM {table_name}"
+
+        where_parts, values = self._build_conditions(conditions)
+        if where_parts:
+            query += f" WHERE {' '.join(where_parts)}"
+
+        if group_by:
+            query += f" GROUP BY {', '.join(group_by)}"
+
+        if having:
+            having_parts, having_values = self._build_conditions(having)
+            query += f" HAVING {' '.join(having_parts)}"
+            values.extend(having_values)
 
         if order_by:
             query += f" ORDER BY {order_by}"
 
-        if limit:
-            query += f" LIMIT {limit}"
-
-        return query, values
+        with self._connection_pool.connection() as connection:
+            cursor = connection.cursor()
+            cursor.row_factory = sqlite3.Row
+            return cursor.execute(query, values).fetchall()
 
     def query_with_builder(
         self,
         conditions: List[Union[Tuple[str, Operator, Any], Logical]],
         order_by: Optional[str] = None,
         limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
     ) -> List[Entity]:
-        query, values = self._build_query(conditions, order_by, limit)
-        self._cursor.execute(query, values)
-        results = self._cursor.fetchall()
-        return [self._create_entity(result) for result in results]
+        query, values = self._build_query(conditions, order_by, limit, after)
+        return self._fetch_all(query, values)
 
-    def _create_entity(self, result: Any) -> Entity:
-        field_names = self._entity_class.__dataclass_fields__.keys()
-        entity_data = dict(zip(field_names, result))
-        return self._entity_class(**entity_data)
+    def query_union(
+        self,
+        branches: List[List[Union[Tuple[str, Operator, Any], Logical]]],
+        order_by: str,
+        limit: Optional[int] = None,
+        after: Optional[Keyset] = None,
+    ) -> List[Entity]:
+        queries, values = [], []
+        for conditions in branches:
+            query, branch_values = self._build_query(conditions, after=after)
+            queries.append(query)
+            values.extend(branch_values)
+        query = f"{' UNION '.join(queries)} ORDER BY {order_by}"
+        if limit:
+            query += f" LIMIT {limit}"
+        return self._fetch_all(query, values)
+
+    def iter_query(
+        self,
+        conditions: List[Union[Tuple[str, Operator, Any], Logical]],
+        order_by: Optional[str] = None,
+        batch_size: int = QUERY_BATCH_SIZE,
+    ) -> Iterator[Entity]:
+        query, values = self._build_query(conditions, order_by)
+        with self._connection_pool.connection() as connection:
+            cursor = connection.cursor()
+            cursor.row_factory = self._statements.row_factory
+            cursor.execute(query, values)
+            while batch := cursor.fetchmany(batch_size):
+                yield from batch
 
     def close_connection(self) -> None:
-        self._connection.close()
+        self._connection_pool.close()
 
 
 class NullRepository(IRepository):
     def create(self, entity: T) -> None:
         pass
 
+    def create_if_count_below(self, entity: T, field_name: str, limit: int) -> bool:
+        return False
+
     def read(self, entity_id: str) -> Optional[Entity]:
         return None
 
@@ -166,5 +369,43 @@ class NullRepository(IRepository):
     def get_by_field(self, field_name: str, field_value: Any) -> List[Entity]:
         return List[Entity]()
 
+    def create_many(
+        self, entities: Iterable[T], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        pass
+
+    def update_many(
+        self, entities: Iterable[T], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        pass
+
+    def delete_many(
+        self, entity_ids: Iterable[str], chunk_size: int = BULK_CHUNK_SIZE
+    ) -> None:
+        pass
+
+    def exists(
+        self, conditions: List[Union[Tuple[str, Operator, Any], Logical]]
+    ) -> bool:
+        return False
+
+    def aggregate(
+        self,
+        expressions: List[AggregateExpression],
+        conditions: List[Union[Tuple[str, Operator, Any], Logical]],
+        group_by: Optional[List[str]] = None,
+        having: Optional[List[Union[Tuple[str, Operator, Any], Logical]]] = None,
+        order_by: Optional[str] = None,
+    ) -> List[sqlite3.Row]:
+        return []
+
+    def iter_query(
+        self,
+        conditions: List[Union[Tuple[str, Operator, Any], Logical]],
+        order_by: Optional[str] = None,
+        batch_size: int = QUERY_BATCH_SIZE,
+    ) -> Iterator[Entity]:
+        return iter(())
+
     def close_connection(self) -> None:
         return None
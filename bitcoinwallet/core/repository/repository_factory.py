@@ -1,13 +1,39 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Type, TypeVar
+from typing import Dict, Optional, Type, TypeVar
 
 from bitcoinwallet.core.model.entity import Entity
+from bitcoinwallet.core.repository.connection_pool import (
+    ConnectionPool,
+    IConnectionPool,
+    PoolStats,
+)
+from bitcoinwallet.core.repository.group_commit import (
+    GroupCommitLedgerRepository,
+    GroupCommitStats,
+)
+from bitcoinwallet.core.repository.ledger_repository import (
+    ILedgerRepository,
+    LedgerRepository,
+    NullLedgerRepository,
+)
+from bitcoinwallet.core.repository.query_observer import IQueryObserver
 from bitcoinwallet.core.repository.repository import (
     IRepository,
     NullRepository,
     Repository,
 )
-from definitions import DB_NAME
+from bitcoinwallet.core.repository.storage_profile import (
+    StorageProfile,
+    get_storage_profile,
+)
+from definitions import (
+    DB_NAME,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    GROUP_COMMIT,
+    STORAGE_PROFILE,
+)
 
 TRepositoryFactory = TypeVar("TRepositoryFactory", bound="RepositoryFactory")
 
@@ -27,12 +53,38 @@ class IRepositoryFactory(ABC):
     def get_repository(self, entity_class: Type[Entity]) -> IRepository:
         pass
 
+    @abstractmethod
+    def get_ledger_repository(self) -> ILedgerRepository:
+        pass
+
+    @abstractmethod
+    def set_query_observer(self, query_observer: Optional[IQueryObserver]) -> None:
+        pass
+
+    @abstractmethod
+    def get_pool_stats(self) -> PoolStats:
+        pass
+
 
 class RepositoryFactory(IRepositoryFactory):
     _instance = None
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        pool_size: int = DB_POOL_SIZE,
+        pool_timeout: float = DB_POOL_TIMEOUT,
+        storage_profile: str = STORAGE_PROFILE,
+        group_commit: bool = GROUP_COMMIT,
+    ) -> None:
         self._dao_map: Dict[Type[Entity], IRepository] = {}
+        self._pool_size = pool_size
+        self._pool_timeout = pool_timeout
+        self._storage_profile = get_storage_profile(storage_profile)
+        self._query_observer: Optional[IQueryObserver] = None
+        self._connection_pool: Optional[IConnectionPool] = None
+        self._group_commit = group_commit
+        self._ledger_repository: Optional[ILedgerRepository] = None
+        self._lock = threading.Lock()
 
     @staticmethod
     def get_db_path() -> str:
@@ -49,12 +101,87 @@ class RepositoryFactory(IRepositoryFactory):
             self._initialize_repository(entity_class)
         return self._dao_map[entity_class]
 
+    def get_ledger_repository(self) -> ILedgerRepository:
+        with self._lock:
+            if self._ledger_repository is None:
+                self._ledger_repository = self._create_ledger_repository()
+            return self._ledger_repository
+
+    def _create_ledger_repository(self) -> ILedgerRepository:
+        ledger_repository = LedgerRepository(self._get_connection_pool())
+        if self._group_commit:
+            return GroupCommitLedgerRepository(ledger_repository)
+        return ledger_repository
+
+    def set_group_commit(self, group_commit: bool) -> None:
+        with self._lock:
+            if self._group_commit == group_commit:
+                return
+            self._group_commit = group_commit
+            self._close_ledger_repository()
+
+    def get_group_commit_stats(self) -> Optional[GroupCommitStats]:
+        ledger_repository = self.get_ledger_repository()
+        if isinstance(ledger_repository, GroupCommitLedgerRepository):
+            return ledger_repository.get_stats()
+        return None
+
+    def get_connection_pool(self) -> IConnectionPool:
+        with self._lock:
+            return self._get_connection_pool()
+
+    def _get_connection_pool(self) -> IConnectionPool:
+        if self._connection_pool is None:
+            self._connection_pool = ConnectionPool(
+                self.get_db_path(),
+                self._pool_size,
+                self._pool_timeout,
+                self._storage_profile,
+                self._query_observer,
+            )
+        return self._connection_pool
+
+    def get_storage_profile(self) -> StorageProfile:
+        return self._storage_profile
+
+    def set_storage_profile(self, storage_profile: str) -> None:
+        with self._lock:
+            self._storage_profile = get_storage_profile(storage_profile)
+            if self._connection_pool is not None:
+                self._connection_pool.set_storage_profile(self._storage_profile)
+
+    def set_query_observer(self, query_observer: Optional[IQueryObserver]) -> None:
+        with self._lock:
+            self._query_observer = query_observer
+            if self._connection_pool is not None:
+                self._connection_pool.set_query_observer(query_observer)
+
+    def get_pool_stats(self) -> PoolStats:
+        return self.get_connection_pool().get_stats()
+
     def _initialize_repository(self, entity_class: Type[Entity]) -> None:
-        self._dao_map[entity_class] = Repository(entity_class, self.get_db_path())
+        self._dao_map[entity_class] = Repository(
+            entity_class, self.get_connection_pool()
+        )
 
     def close_connections(self) -> None:
-        for v in self._dao_map.values():
-            v.close_connection()
+        with self._lock:
+            self._close_ledger_repository()
+            self._get_connection_pool().close()
+
+    def _close_ledger_repository(self) -> None:
+        if isinstance(self._ledger_repository, GroupCommitLedgerRepository):
+            self._ledger_repository.close()
+        self._ledger_repository = None
+
+
+def repository_factory_for(db_path: str) -> RepositoryFactory:
+    class PathRepositoryFactory(RepositoryFactory):
+        @staticmethod
+        def get_db_path() -> str:
+            return db_path
+
+    return PathRepositoryFactory()
 
 
 class NullRepositoryFactory(IRepositoryFactory):
@@ -68,3 +195,20 @@ class NullRepositoryFactory(IRepositoryFactory):
 
     def get_repository(self, entity_class: Type[Entity]) -> IRepository:
         return NullRepository()
+
+    def get_ledger_repository(self) -> ILedgerRepository:
+        return NullLedgerRepository()
+
+    def set_query_observer(self, query_observer: Optional[IQueryObserver]) -> None:
+        pass
+
+    def get_pool_stats(self) -> PoolStats:
+        return PoolStats(
+            size=0,
+            opened=0,
+            in_use=0,
+            checkouts=0,
+            waits=0,
+            timeouts=0,
+            high_water_mark=0,
+        )
@@ -0,0 +1,85 @@
+import sqlite3
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Tuple, Type
+
+from bitcoinwallet.core.model.entity import Entity
+
+RowFactory = Callable[[sqlite3.Cursor, Tuple[Any, ...]], Entity]
+
+
+def _tuple_getter(*names: str) -> Callable[[Any], Tuple[Any, ...]]:
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        return lambda entity: (getter(entity),)
+    return getter
+
+
+@dataclass(frozen=True)
+class EntityStatements:
+    entity_class: Type[Entity]
+    columns: Tuple[str, ...]
+    insert: str
+    select: str
+    select_by_id: str
+    update: str
+    delete: str
+    to_row: Callable[[Any], Tuple[Any, ...]]
+    to_update_row: Callable[[Any], Tuple[Any, ...]]
+    row_factory: RowFactory
+
+    def select_by_field(self, field_name: str) -> str:
+        return _select_by_field(self.select, field_name)
+
+    def insert_if_count_below(self, field_name: str) -> str:
+        return _insert_if_count_below(
+            self.entity_class.get_table_name(), self.columns, field_name
+        )
+
+
+@lru_cache(maxsize=None)
+def _select_by_field(select: str, field_name: str) -> str:
+    return f"{select} WHERE {field_name} = ?"
+
+
+@lru_cache(maxsize=None)
+def _insert_if_count_below(
+    table_name: str, columns: Tuple[str, ...], field_name: str
+) -> str:
+    placeholders = ", ".join(["?" for _ in columns])
+    return (
+        f"INSERT INTO {table_name} ({', '.join(columns)}) SELECT {placeholders} "
+        f"WHERE (SELECT COUNT(*) FROM {table_name} WHERE {field_name} = ?) < ?"
+    )
+
+
+@lru_cache(maxsize=None)
+def compile_statements(entity_class: Type[Entity]) -> EntityStatements:
+    table_name = entity_class.get_table_name()
+    primary_key = entity_class.get_primary_key()
+    columns = tuple(field.name for field in fields(entity_class))
+    update_columns = tuple(column for column in columns if column != primary_key)
+
+    column_list = ", ".join(columns)
+    placeholders = ", ".join(["?" for _ in columns])
+    set_clause = ", ".join([f"{column} = ?" for column in update_columns])
+    select = f"SELECT {column_list} FROM {table_name}"
+
+    constructor: Callable[..., Entity] = entity_class
+
+    def row_factory(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Entity:
+        return constructor(*row)
+
+    return EntityStatements(
+        entity_class=entity_class,
+        columns=columns,
+        insert=f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders})",
+        select=select,
+        select_by_id=f"{select} WHERE {primary_key} = ?",
+        update=f"UPDATE {table_name} SET {set_clause} WHERE {primary_key} = ?",
+        delete=f"DELETE FROM {table_name} WHERE {primary_key} = ?",
+        to_row=_tuple_getter(*columns),
+        to_update_row=_tuple_getter(*update_columns, primary_key),
+        row_factory=row_factory,
+    )
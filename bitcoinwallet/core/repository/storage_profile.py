@@ -0,0 +1,77 @@
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    name: str
+    journal_mode: str
+    synchronous: str
+    cache_size: int
+    mmap_size: int
+    temp_store: str
+    busy_timeout: int
+
+    def get_pragmas(self) -> List[str]:
+        return [
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA cache_size = {self.cache_size}",
+            f"PRAGMA mmap_size = {self.mmap_size}",
+            f"PRAGMA temp_store = {self.temp_store}",
+            f"PRAGMA busy_timeout = {self.busy_timeout}",
+        ]
+
+    def apply(self, connection: sqlite3.Connection) -> None:
+        for pragma in self.get_pragmas():
+            connection.execute(pragma)
+
+
+class UnknownStorageProfileError(ValueError):
+    def __init__(self, name: str) -> None:
+        super().__init__(
+            f"Unknown storage profile: {name}. "
+            f"Available profiles: {', '.join(STORAGE_PROFILES)}"
+        )
+
+
+DURABLE = StorageProfile(
+    name="durable",
+    journal_mode="WAL",
+    synchronous="FULL",
+    cache_size=-8000,
+    mmap_size=0,
+    temp_store="DEFAULT",
+    busy_timeout=5000,
+)
+
+BALANCED = StorageProfile(
+    name="balanced",
+    journal_mode="WAL",
+    synchronous="NORMAL",
+    cache_size=-32000,
+    mmap_size=256 * 1024 * 1024,
+    temp_store="MEMORY",
+    busy_timeout=5000,
+)
+
+THROUGHPUT = StorageProfile(
+    name="throughput",
+    journal_mode="WAL",
+    synchronous="OFF",
+    cache_size=-128000,
+    mmap_size=1024 * 1024 * 1024,
+    temp_store="MEMORY",
+    busy_timeout=10000,
+)
+
+STORAGE_PROFILES: Dict[str, StorageProfile] = {
+    profile.name: profile for profile in (DURABLE, BALANCED, THROUGHPUT)
+}
+
+
+def get_storage_profile(name: str) -> StorageProfile:
+    if name not in STORAGE_PROFILES:
+        raise UnknownStorageProfileError(name)
+    return STORAGE_PROFILES[name]
@@ -0,0 +1,238 @@
+import asyncio
+import contextvars
+import functools
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, ParamSpec, Tuple, TypeVar
+
+from bitcoinwallet.core.logger import ConsoleLogger, ILogger
+from bitcoinwallet.core.model.model import (
+    BatchMode,
+    CreateTransactionRequest,
+    CreateTransactionResponse,
+    CreateTransactionsResponse,
+)
+from bitcoinwallet.core.service.bitcoin_service import (
+    BitcoinServiceBuilder,
+    IBitcoinService,
+)
+from bitcoinwallet.core.service.currency_api_client import (
+    IAsyncCurrencyApiClient,
+    NullAsyncCurrencyApiClient,
+)
+from bitcoinwallet.core.service.transaction_service import TransactionPage
+from bitcoinwallet.core.service.wallet_service import IWalletService, NullWalletService
+from bitcoinwallet.core.util import CurrencyExchangeUtil
+from definitions import DB_POOL_SIZE
+
+TAsyncBitcoinService = TypeVar(
+    "TAsyncBitcoinService", bound="AsyncBitcoinServiceBuilder"
+)
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def database_executor(max_workers: int = DB_POOL_SIZE) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="database")
+
+
+class IAsyncBitcoinService(ABC):
+    @abstractmethod
+    async def create_user(self) -> str:
+        pass
+
+    @abstractmethod
+    async def create_transaction(
+        self,
+        user_api_key: str,
+        from_wallet_addr: str,
+        to_wallet_addr: str,
+        amount: float,
+    ) -> CreateTransactionResponse:
+        pass
+
+    @abstractmethod
+    async def create_transactions(
+        self,
+        user_api_key: str,
+        transactions: List[CreateTransactionRequest],
+        mode: BatchMode = BatchMode.ATOMIC,
+    ) -> CreateTransactionsResponse:
+        pass
+
+    @abstractmethod
+    async def get_addr_transactions(
+        self,
+        user_api_key: str,
+        address: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        pass
+
+    @abstractmethod
+    async def get_transactions(
+        self, api_key: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TransactionPage:
+        pass
+
+    @abstractmethod
+    async def admin_valid(self, api_key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def user_valid(self, api_key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def get_wallet_balance(
+        self, api_key: str, wallet_address: str
+    ) -> Tuple[float, float]:
+        pass
+
+    @abstractmethod
+    async def create_wallet(self, api_key: str) -> Tuple[str, float, float]:
+        pass
+
+    @abstractmethod
+    async def get_statistics(self, admin_api_key: str) -> tuple[int, float]:
+        pass
+
+
+@dataclass
+class AsyncBitcoinService(IAsyncBitcoinService):
+    bitcoin_service: IBitcoinService
+    wallet_service: IWalletService
+    currency_api_client: IAsyncCurrencyApiClient
+    executor: Executor
+    logger: ILogger
+
+    async def create_user(self) -> str:
+        return await self._run(self.bitcoin_service.create_user)
+
+    async def create_transaction(
+        self,
+        user_api_key: str,
+        from_wallet_addr: str,
+        to_wallet_addr: str,
+        amount: float,
+    ) -> CreateTransactionResponse:
+        return await self._run(
+            self.bitcoin_service.create_transaction,
+            user_api_key,
+            from_wallet_addr,
+            to_wallet_addr,
+            amount,
+        )
+
+    async def create_transactions(
+        self,
+        user_api_key: str,
+        transactions: List[CreateTransactionRequest],
+        mode: BatchMode = BatchMode.ATOMIC,
+    ) -> CreateTransactionsResponse:
+        return await self._run(
+            self.bitcoin_service.create_transactions, user_api_key, transactions, mode
+        )
+
+    async def get_addr_transactions(
+        self,
+        user_api_key: str,
+        address: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        return await self._run(
+            self.bitcoin_service.get_addr_transactions,
+            user_api_key,
+            address,
+            limit,
+            cursor,
+        )
+
+    async def get_transactions(
+        self, api_key: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TransactionPage:
+        return await self._run(
+            self.bitcoin_service.get_transactions, api_key, limit, cursor
+        )
+
+    async def admin_valid(self, api_key: str) -> bool:
+        return self.bitcoin_service.admin_valid(api_key)
+
+    async def user_valid(self, api_key: str) -> bool:
+        return await self._run(self.bitcoin_service.user_valid, api_key)
+
+    async def get_wallet_balance(
+        self, api_key: str, wallet_address: str
+    ) -> Tuple[float, float]:
+        self.logger.info("Fetching balance for wallet: %s", wallet_address)
+        satoshi_balance = await self._run(
+            self.wallet_service.get_wallet_balance, api_key, wallet_address
+        )
+        btc_balance = CurrencyExchangeUtil.satoshi_to_bitcoin(satoshi_balance)
+        usd_rate = await self.currency_api_client.get_btc_to_usd_rate()
+        return btc_balance, btc_balance * usd_rate
+
+    async def create_wallet(self, api_key: str) -> Tuple[str, float, float]:
+        self.logger.info("Creating wallet for user: %s", api_key)
+        wallet_address = await self._run(self.wallet_service.create_wallet, api_key)
+        btc_balance, usd_balance = await self.get_wallet_balance(
+            api_key, wallet_address
+        )
+        return wallet_address, btc_balance, usd_balance
+
+    async def get_statistics(self, admin_api_key: str) -> tuple[int, float]:
+        return await self._run(self.bitcoin_service.get_statistics, admin_api_key)
+
+    async def _run(
+        self, function: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(context.run, function, *args, **kwargs)
+        )
+
+
+class AsyncBitcoinServiceBuilder:
+    def __init__(self) -> None:
+        self.service = AsyncBitcoinService(
+            logger=ConsoleLogger(AsyncBitcoinService.__name__),
+            bitcoin_service=BitcoinServiceBuilder().build(),
+            wallet_service=NullWalletService(),
+            currency_api_client=NullAsyncCurrencyApiClient(),
+            executor=database_executor(),
+        )
+
+    def set_logger(self: TAsyncBitcoinService, logger: ILogger) -> TAsyncBitcoinService:
+        self.service.logger = logger
+        return self
+
+    def set_bitcoin_service(
+        self: TAsyncBitcoinService, bitcoin_service: IBitcoinService
+    ) -> TAsyncBitcoinService:
+        self.service.bitcoin_service = bitcoin_service
+        return self
+
+    def set_wallet_service(
+        self: TAsyncBitcoinService, wallet_service: IWalletService
+    ) -> TAsyncBitcoinService:
+        self.service.wallet_service = wallet_service
+        return self
+
+    def set_currency_api_client(
+        self: TAsyncBitcoinService, currency_api_client: IAsyncCurrencyApiClient
+    ) -> TAsyncBitcoinService:
+        self.service.currency_api_client = currency_api_client
+        return self
+
+    def set_executor(
+        self: TAsyncBitcoinService, executor: Executor
+    ) -> TAsyncBitcoinService:
+        self.service.executor = executor
+        return self
+
+    def build(self) -> AsyncBitcoinService:
+        return self.service
@@ -1,13 +1,21 @@
 import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Tuple, TypeVar
+from typing import List, Optional, Tuple, TypeVar
 
 from bitcoinwallet.core.logger import ConsoleLogger, ILogger
 from bitcoinwallet.core.model.exception.wallet_exception import (
     UserHasNoRightOnWalletException,
 )
-from bitcoinwallet.core.model.model import CreateTransactionResponse, TransactionModel
+from bitcoinwallet.core.model.model import (
+    BatchMode,
+    CreateTransactionRequest,
+    CreateTransactionResponse,
+    CreateTransactionsResponse,
+    TransactionModel,
+    TransactionResult,
+)
+from bitcoinwallet.core.repository.ledger_repository import TransferStatus
 from bitcoinwallet.core.service.currency_api_client import (
     ICurrencyApiClient,
     NullCurrencyApiClient,
@@ -15,6 +23,8 @@ from bitcoinwallet.core.service.currency_api_client import (
 from bitcoinwallet.core.service.transaction_service import (
     ITransactionService,
     NullTransactionService,
+    TransactionPage,
+    Transfer,
 )
 from bitcoinwallet.core.service.user_service import IUserService, NullUserService
 from bitcoinwallet.core.service.wallet_service import IWalletService, NullWalletService
@@ -39,14 +49,29 @@ class IBitcoinService(ABC):
     ) -> CreateTransactionResponse:
         pass
 
+    @abstractmethod
+    def create_transactions(
+        self,
+        user_api_key: str,
+        transactions: List[CreateTransactionRequest],
+        mode: BatchMode = BatchMode.ATOMIC,
+    ) -> CreateTransactionsResponse:
+        pass
+
     @abstractmethod
     def get_addr_transactions(
-        self, user_api_key: str, address: str
-    ) -> List[TransactionModel]:
+        self,
+        user_api_key: str,
+        address: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
         pass
 
     @abstractmethod
-    def get_transactions(self, api_key: str) -> list[TransactionModel]:
+    def get_transactions(
+        self, api_key: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TransactionPage:
         pass
 
     @abstractmethod
@@ -86,18 +111,20 @@ class BitcoinService(IBitcoinService):
         return api_key
 
     def get_addr_transactions(
-        self, user_api_key: str, address: str
-    ) -> List[TransactionModel]:
+        self,
+        user_api_key: str,
+        address: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
         self.logger.info(
-            f"Getting transactions for user_api_key:"
-            f" {user_api_key} from_wallet_addr: {address}"
+            "Getting wallet transactions", user_api_key=user_api_key, address=address
         )
         if not self.wallet_service.has_uer_wallet(user_api_key, address):
             raise UserHasNoRightOnWalletException(user_api_key=user_api_key)
-        transactions_list = self.transaction_service.get_addr_transactions(
-            user_api_key, address
+        return self.transaction_service.get_addr_transactions(
+            user_api_key, address, limit, cursor
         )
-        return transactions_list
 
     def create_transaction(
         self,
@@ -107,29 +134,27 @@ class BitcoinService(IBitcoinService):
         amount: float,
     ) -> CreateTransactionResponse:
         self.logger.info(
-            f"Creating transaction user_api_key: {user_api_key}, "
-            f"from_wallet_addr: {from_wallet_addr} "
-            f"to_wallet_addr: {to_wallet_addr}, amount: {amount}"
+            "Creating transaction",
+            user_api_key=user_api_key,
+            from_wallet_addr=from_wallet_addr,
+            to_wallet_addr=to_wallet_addr,
+            amount=amount,
         )
         first_owner = self.wallet_service.get_owner_api_key(address=from_wallet_addr)
         second_owner = self.wallet_service.get_owner_api_key(address=to_wallet_addr)
-        fee_for_transaction = 0
 
         amount_in_satoshi = CurrencyExchangeUtil.bitcoin_to_satoshi(amount)
+        fee_for_transaction = self.calculate_fee(
+            first_owner, second_owner, amount_in_satoshi
+        )
 
-        if first_owner != second_owner:
-            fee_for_transaction = math.ceil(
-                amount_in_satoshi * BITCOIN_FEE_PERCENTAGE / 100
-            )
-
-        self.logger.info(f"Fee for transaction is:  {fee_for_transaction}")
-        self.wallet_service.withdraw(
+        self.logger.info("Fee for transaction is: %s", fee_for_transaction)
+        transaction_id = self.transaction_service.transfer(
             user_api_key=user_api_key,
-            wallet_address=from_wallet_addr,
-            amount=amount_in_satoshi + fee_for_transaction,
-        )
-        self.wallet_service.deposit(
-            wallet_address=to_wallet_addr, amount=amount_in_satoshi
+            from_addr=from_wallet_addr,
+            to_addr=to_wallet_addr,
+            amount=amount_in_satoshi,
+            fee_cost=fee_for_transaction,
         )
         transaction_model = TransactionModel(
             from_wallet_address=from_wallet_addr,
@@ -137,32 +162,100 @@ class BitcoinService(IBitcoinService):
             amount=amount,
             fee_price=CurrencyExchangeUtil.satoshi_to_bitcoin(fee_for_transaction),
         )
-        transaction_id = self.transaction_service.create_transaction(
-            from_addr=from_wallet_addr,
-            to_addr=to_wallet_addr,
-            amount=amount_in_satoshi,
-            fee_cost=fee_for_transaction,
-        )
         return CreateTransactionResponse(
             transaction_id=transaction_id, transaction=transaction_model
         )
 
-    def get_transactions(self, api_key: str) -> list[TransactionModel]:
-        self.logger.info(f"Collecting transactions for {api_key}")
-        return self.transaction_service.get_transactions(api_key)
+    def create_transactions(
+        self,
+        user_api_key: str,
+        transactions: List[CreateTransactionRequest],
+        mode: BatchMode = BatchMode.ATOMIC,
+    ) -> CreateTransactionsResponse:
+        self.logger.info(
+            "Creating %s transactions",
+            len(transactions),
+            user_api_key=user_api_key,
+            mode=mode.value,
+        )
+        owners = self.wallet_service.get_owner_api_keys(
+            address
+            for transaction in transactions
+            for address in (
+                transaction.from_wallet_address,
+                transaction.to_wallet_address,
+            )
+        )
+        transfers = []
+        for transaction in transactions:
+            amount_in_satoshi = CurrencyExchangeUtil.bitcoin_to_satoshi(
+                transaction.amount
+            )
+            fee_for_transaction = self.calculate_fee(
+                owners.get(transaction.from_wallet_address),
+                owners.get(transaction.to_wallet_address),
+                amount_in_satoshi,
+            )
+            transfers.append(
+                Transfer(
+                    from_addr=transaction.from_wallet_address,
+                    to_addr=transaction.to_wallet_address,
+                    amount=amount_in_satoshi,
+                    fee_cost=fee_for_transaction,
+                )
+            )
+
+        results = self.transaction_service.transfer_many(
+            user_api_key, transfers, mode is BatchMode.ATOMIC
+        )
+        completed = sum(result.status is TransferStatus.COMPLETED for result in results)
+        return CreateTransactionsResponse(
+            completed=completed,
+            failed=len(results) - completed,
+            results=[
+                TransactionResult(
+                    status=result.status.value,
+                    transaction=TransactionModel(
+                        from_wallet_address=transaction.from_wallet_address,
+                        to_wallet_address=transaction.to_wallet_address,
+                        amount=transaction.amount,
+                        fee_price=CurrencyExchangeUtil.satoshi_to_bitcoin(
+                            result.transfer.fee_cost
+                        ),
+                    ),
+                    transaction_id=result.transaction_id,
+                    error=result.error,
+                )
+                for transaction, result in zip(transactions, results)
+            ],
+        )
+
+    @staticmethod
+    def calculate_fee(
+        first_owner: Optional[str], second_owner: Optional[str], amount_in_satoshi: int
+    ) -> int:
+        if first_owner == second_owner:
+            return 0
+        return math.ceil(amount_in_satoshi * BITCOIN_FEE_PERCENTAGE / 100)
+
+    def get_transactions(
+        self, api_key: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TransactionPage:
+        self.logger.info("Collecting transactions for %s", api_key)
+        return self.transaction_service.get_transactions(api_key, limit, cursor)
 
     def admin_valid(self, api_key: str) -> bool:
-        self.logger.info(f"Checking admin validity: {api_key}")
+        self.logger.info("Checking admin validity: %s", api_key)
         return self.user_service.admin_valid(api_key)
 
     def user_valid(self, api_key: str) -> bool:
-        self.logger.info(f"Checking user validity: {api_key}")
+        self.logger.info("Checking user validity: %s", api_key)
         return self.user_service.user_valid(api_key)
 
     def get_wallet_balance(
         self, api_key: str, wallet_address: str
     ) -> Tuple[float, float]:
-        self.logger.info(f"Fetching balance for wallet: {wallet_address}")
+        self.logger.info("Fetching balance for wallet: %s", wallet_address)
         satoshi_balance = self.wallet_service.get_wallet_balance(
             api_key, wallet_address
         )
@@ -174,7 +267,7 @@ class BitcoinService(IBitcoinService):
         return btc_balance, usd_balance
 
     def create_wallet(self, api_key: str) -> Tuple[str, float, float]:
-        self.logger.info(f"Creating wallet for user: {api_key}")
+        self.logger.info("Creating wallet for user: %s", api_key)
         wallet_address = self.wallet_service.create_wallet(api_key)
         btc_balance, usd_balance = self.get_wallet_balance(api_key, wallet_address)
         return wallet_address, btc_balance, usd_balance
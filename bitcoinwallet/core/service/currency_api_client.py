@@ -1,52 +1,113 @@
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, TypeVar
+from typing import Optional, TypeVar
 
+import httpx
 import requests
-from cachetools import TTLCache, cached
 
+from bitcoinwallet.core.cache import SingleFlightCache, SingleFlightStats
 from bitcoinwallet.core.logger import ConsoleLogger, ILogger
 from definitions import (
-    CACHE_TTL,
-    CURRENCY_CACHE_MAX_SIZE,
+    CURRENCY_MAX_STALENESS,
+    CURRENCY_REFRESH_INTERVAL,
+    CURRENCY_REQUEST_TIMEOUT,
     GECKO_CURRENCY_BASE_URL,
     INITIAL_USD_RATE,
 )
 
-# Cache
-cache: TTLCache[Any, float] = TTLCache(maxsize=CURRENCY_CACHE_MAX_SIZE, ttl=CACHE_TTL)
 TCurrencyApiClient = TypeVar("TCurrencyApiClient", bound="CurrencyApiClient")
 
+BTC_USD = "bitcoin/usd"
+BTC_USD_PARAMS = {"ids": "bitcoin", "vs_currencies": "usd"}
+
 
 class ICurrencyApiClient(ABC):
     @abstractmethod
     def get_btc_to_usd_rate(self) -> float:
         pass
 
+    @abstractmethod
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_cache_stats(self) -> SingleFlightStats:
+        pass
+
 
 class CurrencyApiClient(ICurrencyApiClient):
     def __init__(
         self,
         url: str = GECKO_CURRENCY_BASE_URL,
         logger: ILogger = ConsoleLogger("CurrencyApiClient"),
+        refresh_interval: float = CURRENCY_REFRESH_INTERVAL,
+        max_staleness: float = CURRENCY_MAX_STALENESS,
+        timeout: float = CURRENCY_REQUEST_TIMEOUT,
     ) -> None:
         self.base_url = url
         self.logger = logger
+        self.refresh_interval = refresh_interval
+        self.max_staleness = max_staleness
+        self.timeout = timeout
         self.last_execution_result = INITIAL_USD_RATE
+        self._rates: SingleFlightCache[str, float] = SingleFlightCache(max_staleness)
+        self._session = requests.Session()
+        self._stopped = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
 
-    @cached(cache)
     def get_btc_to_usd_rate(self) -> float:
-        params = {"ids": "bitcoin", "vs_currencies": "usd"}
+        return self._rates.get(BTC_USD, self._fetch_btc_to_usd_rate)
+
+    def refresh(self) -> float:
+        return self._rates.refresh(BTC_USD, self._fetch_btc_to_usd_rate)
+
+    def get_cache_stats(self) -> SingleFlightStats:
+        return self._rates.get_stats()
+
+    def is_refreshing(self) -> bool:
+        return self._refresher is not None and self._refresher.is_alive()
+
+    def _fetch_btc_to_usd_rate(self) -> float:
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self._session.get(
+                self.base_url, params=BTC_USD_PARAMS, timeout=self.timeout
+            )
             response.raise_for_status()
             data = response.json()
             result = float(data["bitcoin"]["usd"])
             self.last_execution_result = result
             return result
         except Exception as e:
-            self.logger.error(f"Error fetching BTC to USD rate: {e}")
+            self.logger.error("Error fetching BTC to USD rate: %s", e)
             return self.last_execution_result
 
+    def start(self) -> None:
+        if self.is_refreshing():
+            return
+        self._stopped.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_periodically, name="currency-refresher", daemon=True
+        )
+        self._refresher.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+        self._session.close()
+
+    def _refresh_periodically(self) -> None:
+        while not self._stopped.is_set():
+            self.refresh()
+            self._stopped.wait(self.refresh_interval)
+
 
 class NullCurrencyApiClient(ICurrencyApiClient):
     def __init__(self) -> None:
@@ -54,3 +115,141 @@ class NullCurrencyApiClient(ICurrencyApiClient):
 
     def get_btc_to_usd_rate(self) -> float:
         return 0.0
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def get_cache_stats(self) -> SingleFlightStats:
+        return SingleFlightStats(hits=0, misses=0, coalesced=0, size=0)
+
+
+class IAsyncCurrencyApiClient(ABC):
+    @abstractmethod
+    async def get_btc_to_usd_rate(self) -> float:
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def get_cache_stats(self) -> SingleFlightStats:
+        pass
+
+
+class AsyncCurrencyApiClient(IAsyncCurrencyApiClient):
+    def __init__(
+        self,
+        url: str = GECKO_CURRENCY_BASE_URL,
+        logger: ILogger = ConsoleLogger("AsyncCurrencyApiClient"),
+        refresh_interval: float = CURRENCY_REFRESH_INTERVAL,
+        max_staleness: float = CURRENCY_MAX_STALENESS,
+        timeout: float = CURRENCY_REQUEST_TIMEOUT,
+    ) -> None:
+        self.base_url = url
+        self.logger = logger
+        self.refresh_interval = refresh_interval
+        self.max_staleness = max_staleness
+        self.timeout = timeout
+        self.last_execution_result = INITIAL_USD_RATE
+        self.last_refreshed_at: Optional[float] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._flight: Optional[asyncio.Task[float]] = None
+        self._refresher: Optional[asyncio.Task[None]] = None
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    async def get_btc_to_usd_rate(self) -> float:
+        refreshed_at = self.last_refreshed_at
+        if refreshed_at is None:
+            return await self.refresh()
+        expired = time.monotonic() - refreshed_at >= self.max_staleness
+        if expired and self._flight is None:
+            return await self.refresh()
+        if expired:
+            self._coalesced += 1
+        else:
+            self._hits += 1
+        return self.last_execution_result
+
+    async def refresh(self) -> float:
+        if self._flight is None:
+            self._misses += 1
+            self._flight = asyncio.create_task(self._fetch_btc_to_usd_rate())
+            self._flight.add_done_callback(self._land)
+        else:
+            self._coalesced += 1
+        return await asyncio.shield(self._flight)
+
+    def get_cache_stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+            size=0 if self.last_refreshed_at is None else 1,
+        )
+
+    async def start(self) -> None:
+        if self._refresher is not None:
+            return
+        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._refresher = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _land(self, flight: "asyncio.Task[float]") -> None:
+        self._flight = None
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    async def _fetch_btc_to_usd_rate(self) -> float:
+        try:
+            if self._client is not None:
+                response = await self._client.get(self.base_url, params=BTC_USD_PARAMS)
+            else:
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.get(self.base_url, params=BTC_USD_PARAMS)
+            response.raise_for_status()
+            result = float(response.json()["bitcoin"]["usd"])
+            self.last_execution_result = result
+            self.last_refreshed_at = time.monotonic()
+            return result
+        except Exception as e:
+            self.logger.error("Error fetching BTC to USD rate: %s", e)
+            self.last_refreshed_at = time.monotonic()
+            return self.last_execution_result
+
+
+class NullAsyncCurrencyApiClient(IAsyncCurrencyApiClient):
+    async def get_btc_to_usd_rate(self) -> float:
+        return 0.0
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def get_cache_stats(self) -> SingleFlightStats:
+        return SingleFlightStats(hits=0, misses=0, coalesced=0, size=0)
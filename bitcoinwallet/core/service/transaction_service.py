@@ -1,20 +1,65 @@
+import heapq
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, TypeVar, cast
+from typing import Dict, Iterator, List, Optional, TypeVar, Union, cast
 
 from bitcoinwallet.core.logger import ConsoleLogger, ILogger
-from bitcoinwallet.core.model.entity import TransactionEntity, WalletEntity
-from bitcoinwallet.core.model.model import TransactionModel
-from bitcoinwallet.core.model.query import Logical, Operator
+from bitcoinwallet.core.model.entity import (
+    PLATFORM_STATISTICS_ID,
+    PlatformStatisticsEntity,
+    TransactionEntity,
+    WalletEntity,
+)
+from bitcoinwallet.core.model.exception.exception import (
+    ForbiddenException,
+    InvalidInputException,
+    NotFoundException,
+)
+from bitcoinwallet.core.model.exception.wallet_exception import (
+    InvalidNumericValueException,
+    NotEnoughBalanceException,
+    UserHasNoRightOnWalletException,
+    WalletNotFoundException,
+)
+from bitcoinwallet.core.model.query import Keyset, Operator
+from bitcoinwallet.core.repository.ledger_repository import TransferStatus
 from bitcoinwallet.core.repository.repository_factory import (
     IRepositoryFactory,
     NullRepositoryFactory,
 )
-from bitcoinwallet.core.util import CurrencyExchangeUtil, datetime_now
+from bitcoinwallet.core.util import (
+    CurrencyExchangeUtil,
+    datetime_now,
+    datetimes_from_now,
+)
 
 TTransactionService = TypeVar("TTransactionService", bound="TransactionServiceBuilder")
 
+TRANSACTION_ORDER = ("transaction_time", "id")
+
+
+@dataclass(frozen=True)
+class Transfer:
+    from_addr: str
+    to_addr: str
+    amount: int
+    fee_cost: int
+
+
+@dataclass(frozen=True)
+class TransactionPage:
+    transactions: List[TransactionEntity]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TransferResult:
+    transfer: Transfer
+    status: TransferStatus
+    transaction_id: Optional[str] = None
+    error: Optional[str] = None
+
 
 class ITransactionService(ABC):
     @abstractmethod
@@ -24,19 +69,46 @@ class ITransactionService(ABC):
         pass
 
     @abstractmethod
-    def get_transactions(self, api_key: str) -> list[TransactionModel]:
+    def transfer(
+        self,
+        user_api_key: str,
+        from_addr: str,
+        to_addr: str,
+        amount: int,
+        fee_cost: int,
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def transfer_many(
+        self, user_api_key: str, transfers: List[Transfer], atomic: bool = True
+    ) -> List[TransferResult]:
+        pass
+
+    @abstractmethod
+    def get_transactions(
+        self, api_key: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TransactionPage:
         pass
 
     @abstractmethod
     def get_addr_transactions(
-        self, user_api_key: str, address: str
-    ) -> list[TransactionModel]:
+        self,
+        user_api_key: str,
+        address: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
         pass
 
     @abstractmethod
     def get_statistics(self, admin_api_key: str) -> tuple[int, float]:
         pass
 
+    @abstractmethod
+    def rebuild_statistics(self) -> None:
+        pass
+
 
 @dataclass
 class TransactionService(ITransactionService):
@@ -56,72 +128,182 @@ class TransactionService(ITransactionService):
             fee_cost=fee_cost,
             transaction_time=datetime_now(),
         )
-        self.repository_factory.get_repository(TransactionEntity).create(
+        self.repository_factory.get_ledger_repository().record_transaction(
             transaction_entity
         )
-        self.logger.info(f"Created transaction, id = {id}")
+        self.logger.info("Created transaction, id = %s", id)
         return id
 
-    def map_transaction_entity_to_model(
-        self, transaction_entity: TransactionEntity
-    ) -> TransactionModel:
-        return TransactionModel(
-            from_wallet_address=transaction_entity.from_addr,
-            to_wallet_address=transaction_entity.to_addr,
-            amount=CurrencyExchangeUtil.satoshi_to_bitcoin(transaction_entity.amount),
-            fee_price=transaction_entity.fee_cost,
+    def transfer(
+        self,
+        user_api_key: str,
+        from_addr: str,
+        to_addr: str,
+        amount: int,
+        fee_cost: int,
+    ) -> str:
+        if amount < 0:
+            self.logger.error("Invalid amount for transfer: %s", amount)
+            raise InvalidNumericValueException("Amount must be positive")
+        transaction_entity = TransactionEntity(
+            id=str(uuid.uuid4()),
+            from_addr=from_addr,
+            to_addr=to_addr,
+            amount=amount,
+            fee_cost=fee_cost,
+            transaction_time=datetime_now(),
+        )
+        status = self.repository_factory.get_ledger_repository().transfer(
+            user_api_key, transaction_entity
         )
+        exception = self._transfer_exception(status, user_api_key, transaction_entity)
+        if exception is not None:
+            raise exception
+        self.logger.info("Transferred, transaction id = %s", transaction_entity.id)
+        return transaction_entity.id
+
+    def transfer_many(
+        self, user_api_key: str, transfers: List[Transfer], atomic: bool = True
+    ) -> List[TransferResult]:
+        self.logger.info("Transferring a batch of %s", len(transfers))
+        # Distinct, increasing times keep the batch in submission order in the
+        # (transaction_time, id) history order.
+        entities = [
+            TransactionEntity(
+                id=str(uuid.uuid4()),
+                from_addr=transfer.from_addr,
+                to_addr=transfer.to_addr,
+                amount=transfer.amount,
+                fee_cost=transfer.fee_cost,
+                transaction_time=transaction_time,
+            )
+            for transfer, transaction_time in zip(
+                transfers, datetimes_from_now(len(transfers))
+            )
+        ]
+        valid = [entity for entity in entities if entity.amount >= 0]
+        statuses: Dict[str, TransferStatus] = {}
+        if atomic and len(valid) < len(entities):
+            statuses = {entity.id: TransferStatus.NOT_APPLIED for entity in valid}
+        elif valid:
+            applied = self.repository_factory.get_ledger_repository().transfer_many(
+                user_api_key, valid, atomic
+            )
+            statuses = {entity.id: status for entity, status in zip(valid, applied)}
+
+        results = []
+        for transfer, entity in zip(transfers, entities):
+            status = statuses.get(entity.id, TransferStatus.INVALID_AMOUNT)
+            if status is TransferStatus.COMPLETED:
+                results.append(TransferResult(transfer, status, entity.id))
+                continue
+            exception = self._transfer_exception(status, user_api_key, entity)
+            error = exception.get_msg() if exception is not None else None
+            results.append(TransferResult(transfer, status, error=error))
+        return results
+
+    def _transfer_exception(
+        self,
+        status: TransferStatus,
+        user_api_key: str,
+        transaction: TransactionEntity,
+    ) -> Optional[Union[NotFoundException, ForbiddenException, InvalidInputException]]:
+        if status is TransferStatus.SOURCE_NOT_FOUND:
+            return WalletNotFoundException(transaction.from_addr)
+        if status is TransferStatus.DESTINATION_NOT_FOUND:
+            return WalletNotFoundException(transaction.to_addr)
+        if status is TransferStatus.NOT_OWNER:
+            return UserHasNoRightOnWalletException(user_api_key)
+        if status is TransferStatus.INSUFFICIENT_BALANCE:
+            self.logger.error("Not enough balance in wallet: %s", transaction.from_addr)
+            return NotEnoughBalanceException(transaction.from_addr)
+        if status is TransferStatus.INVALID_AMOUNT:
+            return InvalidNumericValueException("Amount must be positive")
+        return None
 
     def get_addr_transactions(
-        self, api_key: str, address: str
-    ) -> list[TransactionModel]:
-        transactions = self.repository_factory.get_repository(
-            TransactionEntity
-        ).query_with_builder(
-            [
-                ("to_addr", Operator.EQUALS, address),
-                Logical.OR,
-                ("from_addr", Operator.EQUALS, address),
-            ]
-        )
+        self,
+        api_key: str,
+        address: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        after = Keyset.decode(TRANSACTION_ORDER, cursor) if cursor else None
+        fetch_limit = limit + 1 if limit else None
+        repository = self.repository_factory.get_repository(TransactionEntity)
 
-        transactions_models = [
-            self.map_transaction_entity_to_model(cast(TransactionEntity, transaction))
-            for transaction in transactions
+        sides = [
+            cast(
+                List[TransactionEntity],
+                repository.query_with_builder(
+                    [(field, Operator.EQUALS, address)],
+                    order_by=", ".join(TRANSACTION_ORDER),
+                    limit=fetch_limit,
+                    after=after,
+                ),
+            )
+            for field in ("from_addr", "to_addr")
         ]
-        return transactions_models
+        transactions = heapq.merge(*sides, key=lambda t: (t.transaction_time, t.id))
+        return self._to_page(transactions, limit)
 
-    def get_transactions(self, api_key: str) -> list[TransactionModel]:
-        self.logger.info(f"Collecting transactions for api_key: {api_key}")
+    def get_transactions(
+        self, api_key: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TransactionPage:
+        self.logger.info("Collecting transactions for api_key: %s", api_key)
+        after = Keyset.decode(TRANSACTION_ORDER, cursor) if cursor else None
         wallets = self.repository_factory.get_repository(
             WalletEntity
         ).query_with_builder([("owner_api_key", Operator.EQUALS, api_key)])
+        addresses = [cast(WalletEntity, wallet).address for wallet in wallets]
+        if not addresses:
+            return TransactionPage([])
 
-        transaction_models: List[TransactionModel] = []
-
-        for wallet in wallets:
-            wallet_address = cast(WalletEntity, wallet).address
-            transactions_for_wallet = self.get_addr_transactions(
-                api_key, wallet_address
-            )
-            transaction_models.extend(transactions_for_wallet)
+        transactions = self.repository_factory.get_repository(
+            TransactionEntity
+        ).query_union(
+            [
+                [(field, Operator.EQUALS, address)]
+                for address in addresses
+                for field in ("from_addr", "to_addr")
+            ],
+            order_by=", ".join(TRANSACTION_ORDER),
+            limit=limit + 1 if limit else None,
+            after=after,
+        )
+        return self._to_page(iter(cast(List[TransactionEntity], transactions)), limit)
 
-        return transaction_models
+    def _to_page(
+        self, transactions: Iterator[TransactionEntity], limit: Optional[int]
+    ) -> TransactionPage:
+        page: List[TransactionEntity] = []
+        for transaction in transactions:
+            if page and page[-1].id == transaction.id:
+                continue
+            if limit and len(page) == limit:
+                last = page[-1]
+                next_cursor = Keyset(
+                    TRANSACTION_ORDER, (last.transaction_time, last.id)
+                ).encode()
+                return TransactionPage(page, next_cursor)
+            page.append(transaction)
+        return TransactionPage(page)
 
     def get_statistics(self, admin_api_key: str) -> tuple[int, float]:
-        all_transactions = self.repository_factory.get_repository(
-            TransactionEntity
-        ).query_with_builder([])
-
-        transactions_num = len(all_transactions)
-        platform_profit_in_satoshi = sum(
-            cast(TransactionEntity, transaction).fee_cost
-            for transaction in all_transactions
-        )
+        statistics = self.repository_factory.get_repository(
+            PlatformStatisticsEntity
+        ).read(PLATFORM_STATISTICS_ID)
+        if statistics is None:
+            return 0, 0.0
+        statistics = cast(PlatformStatisticsEntity, statistics)
         platform_profit = CurrencyExchangeUtil.satoshi_to_bitcoin(
-            platform_profit_in_satoshi
+            statistics.platform_profit
         )
-        return transactions_num, platform_profit
+        return statistics.transactions_num, platform_profit
+
+    def rebuild_statistics(self) -> None:
+        self.logger.info("Rebuilding platform statistics")
+        self.repository_factory.get_ledger_repository().rebuild_statistics()
 
 
 class TransactionServiceBuilder:
@@ -151,13 +333,40 @@ class NullTransactionService(ITransactionService):
     ) -> str:
         return "TRANSACTION NOT CREATED"
 
-    def get_transactions(self, api_key: str) -> list[TransactionModel]:
-        return []
+    def transfer(
+        self,
+        user_api_key: str,
+        from_addr: str,
+        to_addr: str,
+        amount: int,
+        fee_cost: int,
+    ) -> str:
+        return "TRANSACTION NOT CREATED"
+
+    def transfer_many(
+        self, user_api_key: str, transfers: List[Transfer], atomic: bool = True
+    ) -> List[TransferResult]:
+        return [
+            TransferResult(transfer, TransferStatus.NOT_APPLIED)
+            for transfer in transfers
+        ]
+
+    def get_transactions(
+        self, api_key: str, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> TransactionPage:
+        return TransactionPage([])
 
     def get_addr_transactions(
-        self, user_api_key: str, address: str
-    ) -> list[TransactionModel]:
-        return []
+        self,
+        user_api_key: str,
+        address: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> TransactionPage:
+        return TransactionPage([])
 
     def get_statistics(self, admin_api_key: str) -> tuple[int, float]:
         return 0, 0.0
+
+    def rebuild_statistics(self) -> None:
+        pass
@@ -1,7 +1,10 @@
+import threading
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import TypeVar
+from dataclasses import dataclass, field
+from typing import Optional, TypeVar
+
+from cachetools import TTLCache
 
 from bitcoinwallet.core.logger import ConsoleLogger, ILogger
 from bitcoinwallet.core.model.entity import UserEntity
@@ -9,7 +12,13 @@ from bitcoinwallet.core.repository.repository_factory import (
     IRepositoryFactory,
     NullRepositoryFactory,
 )
-from definitions import ADMIN_API_KEY
+from definitions import (
+    ADMIN_API_KEY,
+    API_KEY_CACHE_CAPACITY,
+    API_KEY_CACHE_TTL,
+    INVALID_API_KEY_CACHE_CAPACITY,
+    INVALID_API_KEY_CACHE_TTL,
+)
 
 TUserService = TypeVar("TUserService", bound="UserServiceBuilder")
 
@@ -28,10 +37,72 @@ class IUserService(ABC):
         pass
 
 
+@dataclass(frozen=True)
+class ApiKeyCacheStats:
+    valid_hits: int
+    invalid_hits: int
+    misses: int
+    valid_size: int
+    invalid_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        hits = self.valid_hits + self.invalid_hits
+        return hits / (hits + self.misses) if hits + self.misses else 0.0
+
+
+class ApiKeyCache:
+    def __init__(
+        self,
+        capacity: int = API_KEY_CACHE_CAPACITY,
+        ttl: float = API_KEY_CACHE_TTL,
+        invalid_capacity: int = INVALID_API_KEY_CACHE_CAPACITY,
+        invalid_ttl: float = INVALID_API_KEY_CACHE_TTL,
+    ) -> None:
+        self._valid: TTLCache[str, bool] = TTLCache(maxsize=capacity, ttl=ttl)
+        self._invalid: TTLCache[str, bool] = TTLCache(
+            maxsize=invalid_capacity, ttl=invalid_ttl
+        )
+        self._lock = threading.Lock()
+        self._valid_hits = 0
+        self._invalid_hits = 0
+        self._misses = 0
+
+    def lookup(self, api_key: str) -> Optional[bool]:
+        with self._lock:
+            if api_key in self._valid:
+                self._valid_hits += 1
+                return True
+            if api_key in self._invalid:
+                self._invalid_hits += 1
+                return False
+            self._misses += 1
+            return None
+
+    def remember(self, api_key: str, valid: bool) -> None:
+        with self._lock:
+            if valid:
+                self._invalid.pop(api_key, None)
+                self._valid[api_key] = True
+            else:
+                self._invalid[api_key] = False
+
+    def get_stats(self) -> ApiKeyCacheStats:
+        with self._lock:
+            return ApiKeyCacheStats(
+                valid_hits=self._valid_hits,
+                invalid_hits=self._invalid_hits,
+                misses=self._misses,
+                valid_size=len(self._valid),
+                invalid_size=len(self._invalid),
+            )
+
+
 @dataclass
 class UserService(IUserService):
     logger: ILogger
     repository_factory: IRepositoryFactory
+    api_key_cache: ApiKeyCache = field(default_factory=ApiKeyCache)
 
     def create_user(self) -> str:
         self.logger.info("Creating new user")
@@ -40,14 +111,19 @@ class UserService(IUserService):
         self.repository_factory.get_repository(user_entity.__class__).create(
             user_entity
         )
-        self.logger.info(f"Created user, api_key = {api_key}")
+        self.api_key_cache.remember(api_key, True)
+        self.logger.info("Created user, api_key = %s", api_key)
         return api_key
 
     def user_valid(self, api_key: str) -> bool:
-        self.logger.info("Checking if user is valid")
-        return (
+        cached = self.api_key_cache.lookup(api_key)
+        if cached is not None:
+            return cached
+        valid = (
             self.repository_factory.get_repository(UserEntity).read(api_key) is not None
         )
+        self.api_key_cache.remember(api_key, valid)
+        return valid
 
     def admin_valid(self, api_key: str) -> bool:
         self.logger.info("Checking if admin is valid")
@@ -71,6 +147,12 @@ class UserServiceBuilder:
         self.service.repository_factory = repository_factory
         return self
 
+    def set_api_key_cache(
+        self: TUserService, api_key_cache: ApiKeyCache
+    ) -> TUserService:
+        self.service.api_key_cache = api_key_cache
+        return self
+
     def build(self) -> UserService:
         return self.service
 
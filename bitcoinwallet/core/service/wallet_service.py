@@ -1,8 +1,9 @@
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, TypeVar, cast
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, TypeVar, cast
 
+from bitcoinwallet.core.cache import BoundedCache, CacheStats
 from bitcoinwallet.core.logger import ConsoleLogger, ILogger
 from bitcoinwallet.core.model.entity import WalletEntity
 from bitcoinwallet.core.model.exception.wallet_exception import (
@@ -12,12 +13,19 @@ from bitcoinwallet.core.model.exception.wallet_exception import (
     WalletNotFoundException,
     WalletsLimitExceededException,
 )
+from bitcoinwallet.core.model.query import Logical, Operator
+from bitcoinwallet.core.repository.repository import chunked
 from bitcoinwallet.core.repository.repository_factory import (
     IRepositoryFactory,
     NullRepositoryFactory,
 )
 from bitcoinwallet.core.util import datetime_now
-from definitions import INITIAL_WALLET_BALANCE, MAX_WALLETS_PER_USER
+from definitions import (
+    INITIAL_WALLET_BALANCE,
+    MAX_WALLETS_PER_USER,
+    QUERY_BATCH_SIZE,
+    WALLET_CACHE_CAPACITY,
+)
 
 TWalletServiceBuilder = TypeVar("TWalletServiceBuilder", bound="WalletServiceBuilder")
 
@@ -31,6 +39,10 @@ class IWalletService(ABC):
     def get_owner_api_key(self, address: str) -> str:
         pass
 
+    @abstractmethod
+    def get_owner_api_keys(self, addresses: Iterable[str]) -> Dict[str, str]:
+        pass
+
     @abstractmethod
     def withdraw(self, user_api_key: str, wallet_address: str, amount: int) -> None:
         pass
@@ -48,10 +60,35 @@ class IWalletService(ABC):
         pass
 
 
+@dataclass(frozen=True)
+class WalletMetadata:
+    id: str
+    owner_api_key: str
+    address: str
+
+
+class WalletIndex:
+    def __init__(self, capacity: int = WALLET_CACHE_CAPACITY) -> None:
+        self._by_address: BoundedCache[str, WalletMetadata] = BoundedCache(capacity)
+
+    def get_by_address(self, address: str) -> Optional[WalletMetadata]:
+        return self._by_address.get(address)
+
+    def add(self, wallet: WalletEntity) -> None:
+        self._by_address.put(
+            wallet.address,
+            WalletMetadata(wallet.id, wallet.owner_api_key, wallet.address),
+        )
+
+    def get_stats(self) -> CacheStats:
+        return self._by_address.get_stats()
+
+
 @dataclass
 class WalletService(IWalletService):
     logger: ILogger
     repository_factory: IRepositoryFactory
+    wallet_index: WalletIndex = field(default_factory=WalletIndex)
 
     def _get_wallet_by_address(self, address: str) -> WalletEntity:
         wallets: List[WalletEntity] = cast(
@@ -61,25 +98,23 @@ class WalletService(IWalletService):
             ),
         )
         if wallets is None or len(wallets) == 0:
-            self.logger.error(f"Wallet not found: {address}")
+            self.logger.error("Wallet not found: %s", address)
             raise WalletNotFoundException(address)
+        self.wallet_index.add(wallets[0])
         return wallets[0]
 
+    def _get_wallet_metadata(self, address: str) -> WalletMetadata:
+        metadata = self.wallet_index.get_by_address(address)
+        if metadata is None:
+            wallet = self._get_wallet_by_address(address)
+            metadata = WalletMetadata(wallet.id, wallet.owner_api_key, wallet.address)
+        return metadata
+
+    def get_cache_stats(self) -> CacheStats:
+        return self.wallet_index.get_stats()
+
     def create_wallet(self, user_api_key: str) -> str:
         self.logger.info("Creating new wallet")
-        users_wallets = cast(
-            list[WalletEntity],
-            self.repository_factory.get_repository(WalletEntity).get_by_field(
-                "owner_api_key", user_api_key
-            ),
-        )
-        self.logger.info(
-            f"User with api_key {user_api_key} has {len(users_wallets)} wallets"
-        )
-
-        if len(users_wallets) >= MAX_WALLETS_PER_USER:
-            self.logger.error(f"Wallets limit exceeded for user: {user_api_key}")
-            raise WalletsLimitExceededException(user_api_key)
         wallet_entity = WalletEntity(
             id=str(uuid.uuid4()),
             owner_api_key=user_api_key,
@@ -87,30 +122,52 @@ class WalletService(IWalletService):
             creation_time=datetime_now(),
             address=str(uuid.uuid4()),
         )
-        self.repository_factory.get_repository(WalletEntity).create(wallet_entity)
+        created = self.repository_factory.get_repository(
+            WalletEntity
+        ).create_if_count_below(wallet_entity, "owner_api_key", MAX_WALLETS_PER_USER)
+        if not created:
+            self.logger.error("Wallets limit exceeded for user: %s", user_api_key)
+            raise WalletsLimitExceededException(user_api_key)
+        self.wallet_index.add(wallet_entity)
         self.logger.info("Successfully inserted a new wallet")
         return wallet_entity.address
 
     def get_owner_api_key(self, address: str) -> str:
-        wallet = self._get_wallet_by_address(address)
-        return wallet.owner_api_key
+        return self._get_wallet_metadata(address).owner_api_key
+
+    def get_owner_api_keys(self, addresses: Iterable[str]) -> Dict[str, str]:
+        owners: Dict[str, str] = {}
+        missing: List[str] = []
+        for address in set(addresses):
+            metadata = self.wallet_index.get_by_address(address)
+            if metadata is None:
+                missing.append(address)
+            else:
+                owners[address] = metadata.owner_api_key
+        repository = self.repository_factory.get_repository(WalletEntity)
+        for chunk in chunked(missing, QUERY_BATCH_SIZE):
+            wallets = repository.query_with_builder([("address", Operator.IN, chunk)])
+            for wallet in cast(List[WalletEntity], wallets):
+                self.wallet_index.add(wallet)
+                owners[wallet.address] = wallet.owner_api_key
+        return owners
 
     def withdraw(self, user_api_key: str, wallet_address: str, amount: int) -> None:
         if self.get_owner_api_key(wallet_address) != user_api_key:
             raise UserHasNoRightOnWalletException(user_api_key)
         if amount < 0:
-            self.logger.error(f"Invalid amount for withdrawal: {amount}")
+            self.logger.error("Invalid amount for withdrawal: %s", amount)
             raise InvalidNumericValueException("Amount must be positive")
         wallet = self._get_wallet_by_address(wallet_address)
         if wallet.balance < amount:
-            self.logger.error(f"Not enough balance in wallet: {wallet_address}")
+            self.logger.error("Not enough balance in wallet: %s", wallet_address)
             raise NotEnoughBalanceException(wallet_address)
         wallet.balance -= amount
         self.repository_factory.get_repository(WalletEntity).update(wallet)
 
     def deposit(self, wallet_address: str, amount: int) -> None:
         if amount < 0:
-            self.logger.error(f"Invalid amount for deposit: {amount}")
+            self.logger.error("Invalid amount for deposit: %s", amount)
             raise InvalidNumericValueException("Amount must be positive")
         wallet = self._get_wallet_by_address(wallet_address)
         wallet.balance += amount
@@ -124,14 +181,16 @@ class WalletService(IWalletService):
 
     def has_uer_wallet(self, api_key: str, address: str) -> bool:
         self.logger.info("Checking if user has wallet with address")
-        wallets = self.repository_factory.get_repository(WalletEntity).get_by_field(
-            "owner_api_key", api_key
+        metadata = self.wallet_index.get_by_address(address)
+        if metadata is not None:
+            return metadata.owner_api_key == api_key
+        return self.repository_factory.get_repository(WalletEntity).exists(
+            [
+                ("address", Operator.EQUALS, address),
+                Logical.AND,
+                ("owner_api_key", Operator.EQUALS, api_key),
+            ]
         )
-        for wallet in wallets:
-            addr = cast(WalletEntity, wallet).address
-            if addr == address:
-                return True
-        return False
 
 
 class NullWalletService(IWalletService):
@@ -141,6 +200,9 @@ class NullWalletService(IWalletService):
     def get_owner_api_key(self, address: str) -> str:
         return "NO OWNER"
 
+    def get_owner_api_keys(self, addresses: Iterable[str]) -> Dict[str, str]:
+        return {}
+
     def withdraw(self, user_api_key: str, wallet_address: str, amount: int) -> None:
         pass
 
@@ -173,6 +235,12 @@ class WalletServiceBuilder:
         self.service.repository_factory = repository_factory
         return self
 
+    def set_wallet_cache_capacity(
+        self: TWalletServiceBuilder, capacity: int
+    ) -> TWalletServiceBuilder:
+        self.service.wallet_index = WalletIndex(capacity)
+        return self
+
     def build(self) -> WalletService:
         return self.service
 
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List
 
 from bitcoinwallet.core.service.currency_api_client import ICurrencyApiClient
 from definitions import FORMAT, SATOSHIS_PER_BITCOIN
@@ -8,6 +9,13 @@ def datetime_now() -> str:
     return datetime.now().strftime(FORMAT)
 
 
+def datetimes_from_now(count: int) -> List[str]:
+    now = datetime.now()
+    return [
+        (now + timedelta(microseconds=index)).strftime(FORMAT) for index in range(count)
+    ]
+
+
 class CurrencyExchangeUtil:
     @staticmethod
     def bitcoin_to_satoshi(amount_in_btc: float) -> int:
@@ -0,0 +1,164 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import PlainTextResponse
+
+from bitcoinwallet.core.metrics import CONTENT_TYPE
+from bitcoinwallet.core.model.model import (
+    CreateTransactionRequest,
+    CreateTransactionResponse,
+    CreateTransactionsRequest,
+    CreateTransactionsResponse,
+    CreateUserResponse,
+    CreateWalletResponse,
+    ListTransactionsResponse,
+    StatisticsResponse,
+    WalletBalanceResponse,
+)
+from bitcoinwallet.infra.fastapi.dependables import (
+    AsyncBitcoinServiceDependable,
+    MetricsRegistryDependable,
+)
+from bitcoinwallet.infra.fastapi.interceptor.validity_interceptor import (
+    async_verify_admin_api_key,
+    async_verify_api_key,
+)
+from bitcoinwallet.infra.fastapi.response.json_response import (
+    TransactionPageResponse,
+)
+from definitions import MAX_TRANSACTIONS_PAGE_SIZE
+
+async_bitcoin_api = APIRouter(tags=["Bitcoin"])
+
+
+@async_bitcoin_api.post(
+    "/users", status_code=status.HTTP_201_CREATED, response_model=CreateUserResponse
+)
+async def create_user(
+    bitcoin_service: AsyncBitcoinServiceDependable,
+) -> CreateUserResponse:
+    api_key = await bitcoin_service.create_user()
+    return CreateUserResponse(api_key=api_key)
+
+
+@async_bitcoin_api.post(
+    "/wallets", status_code=status.HTTP_201_CREATED, response_model=CreateWalletResponse
+)
+async def create_wallet(
+    bitcoin_service: AsyncBitcoinServiceDependable,
+    api_key: str = Depends(async_verify_api_key),
+) -> CreateWalletResponse:
+    wallet_address, balance_btc, balance_usd = await bitcoin_service.create_wallet(
+        api_key
+    )
+    return CreateWalletResponse(
+        wallet_address=wallet_address,
+        balance_btc=balance_btc,
+        balance_usd=balance_usd,
+    )
+
+
+@async_bitcoin_api.get("/wallets/{address}", response_model=WalletBalanceResponse)
+async def get_wallet_balance(
+    address: str,
+    bitcoin_service: AsyncBitcoinServiceDependable,
+    api_key: str = Depends(async_verify_api_key),
+) -> WalletBalanceResponse:
+    btc_balance, usd_balance = await bitcoin_service.get_wallet_balance(
+        api_key, address
+    )
+    return WalletBalanceResponse(btc_balance=btc_balance, usd_balance=usd_balance)
+
+
+@async_bitcoin_api.post(
+    "/transactions",
+    status_code=status.HTTP_201_CREATED,
+    response_model=CreateTransactionResponse,
+)
+async def create_transaction(
+    transaction_request: CreateTransactionRequest,
+    bitcoin_service: AsyncBitcoinServiceDependable,
+    api_key: str = Depends(async_verify_api_key),
+) -> CreateTransactionResponse:
+    return await bitcoin_service.create_transaction(
+        api_key,
+        transaction_request.from_wallet_address,
+        transaction_request.to_wallet_address,
+        transaction_request.amount,
+    )
+
+
+@async_bitcoin_api.post(
+    "/transactions/batch",
+    status_code=status.HTTP_200_OK,
+    response_model=CreateTransactionsResponse,
+)
+async def create_transactions(
+    transactions_request: CreateTransactionsRequest,
+    bitcoin_service: AsyncBitcoinServiceDependable,
+    api_key: str = Depends(async_verify_api_key),
+) -> CreateTransactionsResponse:
+    return await bitcoin_service.create_transactions(
+        api_key, transactions_request.transactions, transactions_request.mode
+    )
+
+
+@async_bitcoin_api.get(
+    "/transactions",
+    status_code=status.HTTP_200_OK,
+    response_model=ListTransactionsResponse,
+)
+async def get_transactions(
+    bitcoin_service: AsyncBitcoinServiceDependable,
+    api_key: str = Depends(async_verify_api_key),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_TRANSACTIONS_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> TransactionPageResponse:
+    return TransactionPageResponse(
+        await bitcoin_service.get_transactions(api_key, limit, cursor)
+    )
+
+
+@async_bitcoin_api.get(
+    "/wallets/{address}/transactions",
+    status_code=status.HTTP_200_OK,
+    response_model=ListTransactionsResponse,
+)
+async def get_addr_transactions(
+    address: str,
+    bitcoin_service: AsyncBitcoinServiceDependable,
+    user_api_key: str = Depends(async_verify_api_key),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_TRANSACTIONS_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> TransactionPageResponse:
+    return TransactionPageResponse(
+        await bitcoin_service.get_addr_transactions(
+            user_api_key, address, limit, cursor
+        )
+    )
+
+
+@async_bitcoin_api.get(
+    "/statistics",
+    status_code=status.HTTP_200_OK,
+    response_model=StatisticsResponse,
+)
+async def get_statistics(
+    bitcoin_service: AsyncBitcoinServiceDependable,
+    admin_api_key: str = Depends(async_verify_admin_api_key),
+) -> StatisticsResponse:
+    statistic = await bitcoin_service.get_statistics(admin_api_key)
+
+    return StatisticsResponse(
+        transactions_num=statistic[0], platform_profit=statistic[1]
+    )
+
+
+@async_bitcoin_api.get(
+    "/metrics", status_code=status.HTTP_200_OK, response_class=PlainTextResponse
+)
+async def get_metrics(
+    metrics: MetricsRegistryDependable,
+    admin_api_key: str = Depends(async_verify_admin_api_key),
+) -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
@@ -1,19 +1,32 @@
-from fastapi import APIRouter, Depends, status
+from typing import Optional
 
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import PlainTextResponse
+
+from bitcoinwallet.core.metrics import CONTENT_TYPE
 from bitcoinwallet.core.model.model import (
     CreateTransactionRequest,
     CreateTransactionResponse,
+    CreateTransactionsRequest,
+    CreateTransactionsResponse,
     CreateUserResponse,
     CreateWalletResponse,
     ListTransactionsResponse,
     StatisticsResponse,
     WalletBalanceResponse,
 )
-from bitcoinwallet.infra.fastapi.dependables import BitcoinServiceDependable
+from bitcoinwallet.infra.fastapi.dependables import (
+    BitcoinServiceDependable,
+    MetricsRegistryDependable,
+)
 from bitcoinwallet.infra.fastapi.interceptor.validity_interceptor import (
     verify_admin_api_key,
     verify_api_key,
 )
+from bitcoinwallet.infra.fastapi.response.json_response import (
+    TransactionPageResponse,
+)
+from definitions import MAX_TRANSACTIONS_PAGE_SIZE
 
 bitcoin_api = APIRouter(tags=["Bitcoin"])
 
@@ -68,16 +81,35 @@ def create_transaction(
     )
 
 
+@bitcoin_api.post(
+    "/transactions/batch",
+    status_code=status.HTTP_200_OK,
+    response_model=CreateTransactionsResponse,
+)
+def create_transactions(
+    transactions_request: CreateTransactionsRequest,
+    bitcoin_service: BitcoinServiceDependable,
+    api_key: str = Depends(verify_api_key),
+) -> CreateTransactionsResponse:
+    return bitcoin_service.create_transactions(
+        api_key, transactions_request.transactions, transactions_request.mode
+    )
+
+
 @bitcoin_api.get(
     "/transactions",
     status_code=status.HTTP_200_OK,
     response_model=ListTransactionsResponse,
 )
 def get_transactions(
-    bitcoin_service: BitcoinServiceDependable, api_key: str = Depends(verify_api_key)
-) -> ListTransactionsResponse:
-    transactions = bitcoin_service.get_transactions(api_key)
-    return ListTransactionsResponse(transactions=transactions)
+    bitcoin_service: BitcoinServiceDependable,
+    api_key: str = Depends(verify_api_key),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_TRANSACTIONS_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> TransactionPageResponse:
+    return TransactionPageResponse(
+        bitcoin_service.get_transactions(api_key, limit, cursor)
+    )
 
 
 @bitcoin_api.get(
@@ -89,9 +121,12 @@ def get_addr_transactions(
     address: str,
     bitcoin_service: BitcoinServiceDependable,
     user_api_key: str = Depends(verify_api_key),
-) -> ListTransactionsResponse:
-    transactions = bitcoin_service.get_addr_transactions(user_api_key, address)
-    return ListTransactionsResponse(transactions=transactions)
+    limit: Optional[int] = Query(None, ge=1, le=MAX_TRANSACTIONS_PAGE_SIZE),
+    cursor: Optional[str] = None,
+) -> TransactionPageResponse:
+    return TransactionPageResponse(
+        bitcoin_service.get_addr_transactions(user_api_key, address, limit, cursor)
+    )
 
 
 @bitcoin_api.get(
@@ -108,3 +143,13 @@ def get_statistics(
     return StatisticsResponse(
         transactions_num=statistic[0], platform_profit=statistic[1]
     )
+
+
+@bitcoin_api.get(
+    "/metrics", status_code=status.HTTP_200_OK, response_class=PlainTextResponse
+)
+def get_metrics(
+    metrics: MetricsRegistryDependable,
+    admin_api_key: str = Depends(verify_admin_api_key),
+) -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
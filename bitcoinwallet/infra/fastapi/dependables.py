@@ -3,6 +3,8 @@ from typing import Annotated, Any
 from fastapi import Depends
 from fastapi.requests import Request
 
+from bitcoinwallet.core.metrics import MetricsRegistry
+from bitcoinwallet.core.service.async_bitcoin_service import IAsyncBitcoinService
 from bitcoinwallet.core.service.bitcoin_service import IBitcoinService
 
 
@@ -11,3 +13,19 @@ def get_bitcoin_service(request: Request) -> Any:
 
 
 BitcoinServiceDependable = Annotated[IBitcoinService, Depends(get_bitcoin_service)]
+
+
+async def get_async_bitcoin_service(request: Request) -> Any:
+    return request.app.state.async_bitcoin
+
+
+AsyncBitcoinServiceDependable = Annotated[
+    IAsyncBitcoinService, Depends(get_async_bitcoin_service)
+]
+
+
+async def get_metrics_registry(request: Request) -> Any:
+    return request.app.state.metrics
+
+
+MetricsRegistryDependable = Annotated[MetricsRegistry, Depends(get_metrics_registry)]
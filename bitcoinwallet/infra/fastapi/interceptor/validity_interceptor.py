@@ -4,7 +4,10 @@ from bitcoinwallet.core.model.exception.user_exception import (
     UserHasNoRightsException,
     UserNotFoundException,
 )
-from bitcoinwallet.infra.fastapi.dependables import BitcoinServiceDependable
+from bitcoinwallet.infra.fastapi.dependables import (
+    AsyncBitcoinServiceDependable,
+    BitcoinServiceDependable,
+)
 
 
 def verify_api_key(
@@ -23,3 +26,21 @@ def verify_admin_api_key(
     if not bitcoin_service.admin_valid(admin_api_key):
         raise UserHasNoRightsException(api_key=admin_api_key)
     return admin_api_key
+
+
+async def async_verify_api_key(
+    bitcoin_service: AsyncBitcoinServiceDependable,
+    api_key: str = Header(..., alias="X-API-KEY"),
+) -> str:
+    if not await bitcoin_service.user_valid(api_key):
+        raise UserNotFoundException(api_key=api_key)
+    return api_key
+
+
+async def async_verify_admin_api_key(
+    bitcoin_service: AsyncBitcoinServiceDependable,
+    admin_api_key: str = Header(..., alias="X-ADMIN-API-KEY"),
+) -> str:
+    if not await bitcoin_service.admin_valid(admin_api_key):
+        raise UserHasNoRightsException(api_key=admin_api_key)
+    return admin_api_key
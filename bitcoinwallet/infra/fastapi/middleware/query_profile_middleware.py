@@ -0,0 +1,43 @@
+from typing import Mapping, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from bitcoinwallet.core.logger import ConsoleLogger, ILogger
+from bitcoinwallet.core.repository.query_profiler import (
+    check_query_budget,
+    profile_queries,
+)
+from bitcoinwallet.infra.fastapi.middleware.metrics_middleware import UNMATCHED_ROUTE
+
+
+class QueryProfileMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: ILogger = ConsoleLogger("QueryProfileMiddleware"),
+        query_budgets: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        self.app = app
+        self.logger = logger
+        self.query_budgets = query_budgets or {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as profile:
+            await self.app(scope, receive, send)
+
+        route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+        endpoint = f"{scope['method']} {route}"
+        self.logger.info(
+            "%s: %s queries, %s rows, %.2f ms in the database",
+            endpoint,
+            profile.queries,
+            profile.rows,
+            profile.duration * 1000,
+        )
+        max_queries = self.query_budgets.get(endpoint)
+        if max_queries is not None:
+            check_query_budget(endpoint, profile, max_queries)
@@ -0,0 +1,51 @@
+import json
+from typing import Any, Dict
+
+from fastapi.responses import JSONResponse
+
+from bitcoinwallet.core.model.entity import TransactionEntity
+from bitcoinwallet.core.service.transaction_service import TransactionPage
+from bitcoinwallet.core.util import CurrencyExchangeUtil
+
+
+def encode_json(content: Any) -> bytes:
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+try:
+    import orjson
+
+    def fast_encode_json(content: Any) -> bytes:
+        return orjson.dumps(content)
+
+except ImportError:
+    fast_encode_json = encode_json
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return fast_encode_json(content)
+
+
+def transaction_to_json(transaction: TransactionEntity) -> Dict[str, Any]:
+    return {
+        "from_wallet_address": transaction.from_addr,
+        "to_wallet_address": transaction.to_addr,
+        "amount": CurrencyExchangeUtil.satoshi_to_bitcoin(transaction.amount),
+        "fee_price": transaction.fee_cost,
+    }
+
+
+class TransactionPageResponse(FastJSONResponse):
+    def __init__(self, page: TransactionPage) -> None:
+        super().__init__(
+            {
+                "transactions": [
+                    transaction_to_json(transaction)
+                    for transaction in page.transactions
+                ],
+                "next_cursor": page.next_cursor,
+            }
+        )
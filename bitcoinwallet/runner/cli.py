@@ -1,17 +1,110 @@
 from __future__ import annotations
 
+import json
+import os
+import tempfile
+from dataclasses import asdict
+
 import uvicorn
-from typer import Typer
+from typer import BadParameter, Exit, Typer
 
 from bitcoinwallet.core.repository.repository_factory import RepositoryFactory
+from bitcoinwallet.core.service.transaction_service import TransactionServiceBuilder
+from bitcoinwallet.runner.loadtest import (
+    DEFAULT_MIX,
+    LoadConfig,
+    ServerConfig,
+    find_free_port,
+    parse_mix,
+    print_report,
+    run_load_test,
+)
 from bitcoinwallet.runner.setup import init_app
-from definitions import DB_NAME
+from definitions import (
+    BUFFERED_LOGGING,
+    DB_NAME,
+    GROUP_COMMIT,
+    PROFILE_QUERIES,
+    STORAGE_PROFILE,
+)
 from resources.db.sql import db_setup
 
 cli = Typer(no_args_is_help=True, add_completion=False)
 
 
 @cli.command()
-def run(host: str = "127.0.0.1", port: int = 8080) -> None:
+def run(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    storage_profile: str = STORAGE_PROFILE,
+    asynchronous: bool = False,
+    group_commit: bool = GROUP_COMMIT,
+    metrics: bool = True,
+    profile_queries: bool = PROFILE_QUERIES,
+    buffered_logging: bool = BUFFERED_LOGGING,
+) -> None:
+    db_setup(DB_NAME)
+    repository_factory = RepositoryFactory.get_instance()
+    repository_factory.set_storage_profile(storage_profile)
+    repository_factory.set_group_commit(group_commit)
+    app = init_app(
+        repository_factory,
+        asynchronous,
+        metrics,
+        profile_queries,
+        buffered_logging=buffered_logging,
+    )
+    uvicorn.run(host=host, port=port, app=app)
+
+
+@cli.command()
+def rebuild_statistics() -> None:
     db_setup(DB_NAME)
-    uvicorn.run(host=host, port=port, app=init_app(RepositoryFactory.get_instance()))
+    repository_factory = RepositoryFactory.get_instance()
+    TransactionServiceBuilder().set_repository_factory(
+        repository_factory
+    ).build().rebuild_statistics()
+    repository_factory.close_connections()
+
+
+@cli.command()
+def loadtest(
+    clients: int = 32,
+    duration: float = 10.0,
+    users: int = 100,
+    wallets_per_user: int = 2,
+    mix: str = DEFAULT_MIX,
+    seed: int = 0,
+    host: str = "127.0.0.1",
+    storage_profile: str = STORAGE_PROFILE,
+    asynchronous: bool = False,
+    group_commit: bool = GROUP_COMMIT,
+    buffered_logging: bool = BUFFERED_LOGGING,
+    max_error_rate: float = 0.01,
+    output: str = "",
+) -> None:
+    try:
+        weights = parse_mix(mix)
+    except ValueError as error:
+        raise BadParameter(str(error), param_hint="--mix")
+    load = LoadConfig(clients, duration, users, wallets_per_user, weights, seed)
+    with tempfile.TemporaryDirectory() as directory:
+        server = ServerConfig(
+            os.path.join(directory, "loadtest.db"),
+            host,
+            find_free_port(host),
+            asynchronous,
+            storage_profile,
+            group_commit,
+            buffered_logging,
+        )
+        report = run_load_test(server, load)
+
+    print_report(report)
+    if output:
+        with open(output, "w", encoding="utf-8") as output_file:
+            json.dump(asdict(report), output_file, indent=2)
+    if not report.conservation.is_conserved():
+        raise Exit(1)
+    if report.get_error_rate() > max_error_rate:
+        raise Exit(1)
@@ -0,0 +1,478 @@
+import asyncio
+import contextlib
+import math
+import multiprocessing
+import os
+import random
+import socket
+import sys
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from multiprocessing.process import BaseProcess
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+import httpx
+import uvicorn
+
+from bitcoinwallet.core.model.entity import (
+    PLATFORM_STATISTICS_ID,
+    PlatformStatisticsEntity,
+    TransactionEntity,
+    WalletEntity,
+)
+from bitcoinwallet.core.model.query import Aggregate, AggregateExpression
+from bitcoinwallet.core.repository.repository_factory import repository_factory_for
+from bitcoinwallet.runner.setup import init_app
+from definitions import (
+    ADMIN_API_KEY,
+    BUFFERED_LOGGING,
+    GROUP_COMMIT,
+    INITIAL_WALLET_BALANCE,
+    MAX_WALLETS_PER_USER,
+    STORAGE_PROFILE,
+)
+from resources.db.sql import db_setup
+
+DEFAULT_MIX = "transfer=50,history=20,balance=20,wallet=5,user=3,statistics=2"
+TRANSFER_AMOUNT = 0.00001
+HISTORY_PAGE_SIZE = 50
+REQUEST_TIMEOUT = 30.0
+SERVER_START_TIMEOUT = 30.0
+POOL_METRICS_PREFIX = "db_pool_"
+
+
+class Operation(str, Enum):
+    USER = "user"
+    WALLET = "wallet"
+    TRANSFER = "transfer"
+    HISTORY = "history"
+    BALANCE = "balance"
+    STATISTICS = "statistics"
+
+
+def parse_mix(mix: str) -> Dict[Operation, float]:
+    weights = {}
+    for entry in mix.split(","):
+        name, _, weight = entry.partition("=")
+        try:
+            weights[Operation(name.strip())] = float(weight)
+        except ValueError:
+            raise ValueError(f"Invalid mix entry: {entry!r}") from None
+    if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+        raise ValueError(f"Mix weights must be non-negative with a positive sum: {mix}")
+    return weights
+
+
+def percentile(sorted_values: Sequence[float], percent: float) -> float:
+    index = max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+def find_free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    db_path: str
+    host: str
+    port: int
+    asynchronous: bool = False
+    storage_profile: str = STORAGE_PROFILE
+    group_commit: bool = GROUP_COMMIT
+    buffered_logging: bool = BUFFERED_LOGGING
+
+    def get_base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+
+@dataclass(frozen=True)
+class LoadConfig:
+    clients: int
+    duration: float
+    users: int
+    wallets_per_user: int
+    mix: Dict[Operation, float]
+    seed: int = 0
+
+
+@dataclass
+class OperationStats:
+    durations: List[float] = field(default_factory=list)
+    succeeded: int = 0
+    rejected: int = 0
+    failed: int = 0
+
+    def record(self, status_code: Optional[int], duration: float) -> None:
+        self.durations.append(duration)
+        if status_code is None or status_code >= 500:
+            self.failed += 1
+        elif status_code >= 400:
+            self.rejected += 1
+        else:
+            self.succeeded += 1
+
+
+@dataclass(frozen=True)
+class OperationReport:
+    requests: int
+    succeeded: int
+    rejected: int
+    failed: int
+    ops_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @classmethod
+    def from_stats(cls, stats: OperationStats, elapsed: float) -> "OperationReport":
+        durations = sorted(stats.durations) or [0.0]
+        return cls(
+            requests=len(stats.durations),
+            succeeded=stats.succeeded,
+            rejected=stats.rejected,
+            failed=stats.failed,
+            ops_per_sec=len(stats.durations) / elapsed,
+            p50_ms=percentile(durations, 50) * 1000,
+            p95_ms=percentile(durations, 95) * 1000,
+            p99_ms=percentile(durations, 99) * 1000,
+        )
+
+
+@dataclass(frozen=True)
+class ConservationReport:
+    wallets: int
+    balances: int
+    transactions: int
+    fees: int
+    transactions_num: int
+    platform_profit: int
+
+    def is_conserved(self) -> bool:
+        return (
+            self.balances + self.fees == self.wallets * INITIAL_WALLET_BALANCE
+            and self.transactions_num == self.transactions
+            and self.platform_profit == self.fees
+        )
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    elapsed: float
+    operations: Dict[str, OperationReport]
+    pool_metrics: Dict[str, float]
+    conservation: ConservationReport
+
+    def get_requests(self) -> int:
+        return sum(report.requests for report in self.operations.values())
+
+    def get_error_rate(self) -> float:
+        failed = sum(report.failed for report in self.operations.values())
+        return failed / max(1, self.get_requests())
+
+
+@dataclass
+class LoadUser:
+    api_key: str
+    wallets: List[str] = field(default_factory=list)
+
+    def get_headers(self) -> Dict[str, str]:
+        return {"X-API-KEY": self.api_key}
+
+
+class LoadDriver:
+    def __init__(
+        self, client: httpx.AsyncClient, mix: Dict[Operation, float], seed: int = 0
+    ) -> None:
+        self._client = client
+        self._operations = list(mix)
+        self._weights = list(mix.values())
+        self._rng = random.Random(seed)
+        self._users: List[LoadUser] = []
+        self._wallet_owners: List[LoadUser] = []
+        self._stats = {operation: OperationStats() for operation in self._operations}
+        self._calls: Dict[Operation, Callable[[], Awaitable[None]]] = {
+            Operation.USER: self._create_user,
+            Operation.WALLET: self._create_wallet,
+            Operation.TRANSFER: self._create_transaction,
+            Operation.HISTORY: self._get_transactions,
+            Operation.BALANCE: self._get_wallet_balance,
+            Operation.STATISTICS: self._get_statistics,
+        }
+
+    async def setup(self, users: int, wallets_per_user: int, clients: int) -> None:
+        if not 0 < wallets_per_user <= MAX_WALLETS_PER_USER:
+            raise ValueError(
+                f"Wallets per user must be between 1 and {MAX_WALLETS_PER_USER}"
+            )
+        if users * wallets_per_user < 2:
+            raise ValueError("Load test needs at least two wallets to transfer between")
+        semaphore = asyncio.Semaphore(clients)
+
+        async def create_user() -> None:
+            async with semaphore:
+                response = await self._client.post("/users")
+                user = LoadUser(response.raise_for_status().json()["api_key"])
+                for _ in range(wallets_per_user):
+                    response = await self._client.post(
+                        "/wallets", headers=user.get_headers()
+                    )
+                    self._add_wallet(user, response.raise_for_status().json())
+                self._users.append(user)
+
+        await asyncio.gather(*(create_user() for _ in range(users)))
+
+    async def run(self, clients: int, duration: float) -> float:
+        start = time.perf_counter()
+        deadline = start + duration
+
+        async def client_loop() -> None:
+            while time.perf_counter() < deadline:
+                operation = self._rng.choices(self._operations, self._weights)[0]
+                await self._calls[operation]()
+
+        await asyncio.gather(*(client_loop() for _ in range(clients)))
+        return time.perf_counter() - start
+
+    def get_reports(self, elapsed: float) -> Dict[str, OperationReport]:
+        return {
+            operation.value: OperationReport.from_stats(stats, elapsed)
+            for operation, stats in self._stats.items()
+        }
+
+    async def get_pool_metrics(self) -> Dict[str, float]:
+        response = await self._client.get(
+            "/metrics", headers={"X-ADMIN-API-KEY": ADMIN_API_KEY}
+        )
+        samples = {}
+        for line in response.raise_for_status().text.splitlines():
+            if line.startswith(POOL_METRICS_PREFIX):
+                name, _, value = line.rpartition(" ")
+                samples[name] = float(value)
+        return samples
+
+    async def _send(
+        self, operation: Operation, method: str, url: str, **kwargs: Any
+    ) -> Optional[httpx.Response]:
+        start = time.perf_counter()
+        try:
+            response: Optional[httpx.Response] = await self._client.request(
+                method, url, **kwargs
+            )
+        except httpx.HTTPError:
+            response = None
+        status_code = None if response is None else response.status_code
+        self._stats[operation].record(status_code, time.perf_counter() - start)
+        return response if response is not None and response.is_success else None
+
+    def _add_wallet(self, user: LoadUser, wallet: Dict[str, Any]) -> None:
+        user.wallets.append(wallet["wallet_address"])
+        self._wallet_owners.append(user)
+
+    def _pick_wallet_owner(self) -> LoadUser:
+        return self._rng.choice(self._wallet_owners)
+
+    async def _create_user(self) -> None:
+        response = await self._send(Operation.USER, "POST", "/users")
+        if response is not None:
+            self._users.append(LoadUser(response.json()["api_key"]))
+
+    async def _create_wallet(self) -> None:
+        user = self._rng.choice(self._users)
+        response = await self._send(
+            Operation.WALLET, "POST", "/wallets", headers=user.get_headers()
+        )
+        if response is not None:
+            self._add_wallet(user, response.json())
+
+    async def _create_transaction(self) -> None:
+        source, destination = self._pick_wallet_owner(), self._pick_wallet_owner()
+        source_address = self._rng.choice(source.wallets)
+        destination_address = self._rng.choice(destination.wallets)
+        while destination_address == source_address:
+            destination = self._pick_wallet_owner()
+            destination_address = self._rng.choice(destination.wallets)
+        request = {
+            "from_wallet_address": source_address,
+            "to_wallet_address": destination_address,
+            "amount": TRANSFER_AMOUNT,
+        }
+        await self._send(
+            Operation.TRANSFER,
+            "POST",
+            "/transactions",
+            headers=source.get_headers(),
+            json=request,
+        )
+
+    async def _get_transactions(self) -> None:
+        user = self._pick_wallet_owner()
+        await self._send(
+            Operation.HISTORY,
+            "GET",
+            "/transactions",
+            headers=user.get_headers(),
+            params={"limit": HISTORY_PAGE_SIZE},
+        )
+
+    async def _get_wallet_balance(self) -> None:
+        user = self._pick_wallet_owner()
+        address = self._rng.choice(user.wallets)
+        await self._send(
+            Operation.BALANCE, "GET", f"/wallets/{address}", headers=user.get_headers()
+        )
+
+    async def _get_statistics(self) -> None:
+        await self._send(
+            Operation.STATISTICS,
+            "GET",
+            "/statistics",
+            headers={"X-ADMIN-API-KEY": ADMIN_API_KEY},
+        )
+
+
+def serve(config: ServerConfig) -> None:
+    sys.stdout = open(os.devnull, "w")
+    repository_factory = repository_factory_for(config.db_path)
+    repository_factory.set_storage_profile(config.storage_profile)
+    repository_factory.set_group_commit(config.group_commit)
+    app = init_app(
+        repository_factory,
+        config.asynchronous,
+        buffered_logging=config.buffered_logging,
+    )
+    uvicorn.run(app, host=config.host, port=config.port, log_level="warning")
+
+
+def wait_until_ready(base_url: str, process: BaseProcess) -> None:
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if not process.is_alive():
+            raise RuntimeError(f"Server exited with code {process.exitcode}")
+        try:
+            httpx.get(f"{base_url}/openapi.json").raise_for_status()
+            return
+        except httpx.TransportError:
+            time.sleep(0.05)
+    raise TimeoutError(f"Server did not start within {SERVER_START_TIMEOUT}s")
+
+
+@contextlib.contextmanager
+def running_server(config: ServerConfig) -> Iterator[None]:
+    process = multiprocessing.get_context("spawn").Process(
+        target=serve, args=(config,), daemon=True
+    )
+    process.start()
+    try:
+        wait_until_ready(config.get_base_url(), process)
+        yield
+    finally:
+        process.terminate()
+        process.join()
+
+
+async def drive(
+    base_url: str, load: LoadConfig
+) -> Tuple[float, Dict[str, OperationReport], Dict[str, float]]:
+    limits = httpx.Limits(
+        max_connections=load.clients, max_keepalive_connections=load.clients
+    )
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=REQUEST_TIMEOUT
+    ) as client:
+        driver = LoadDriver(client, load.mix, load.seed)
+        await driver.setup(load.users, load.wallets_per_user, load.clients)
+        elapsed = await driver.run(load.clients, load.duration)
+        return elapsed, driver.get_reports(elapsed), await driver.get_pool_metrics()
+
+
+def check_conservation(db_path: str) -> ConservationReport:
+    repository_factory = repository_factory_for(db_path)
+    wallets = repository_factory.get_repository(WalletEntity).aggregate(
+        [
+            AggregateExpression(Aggregate.COUNT, alias="wallets"),
+            AggregateExpression(Aggregate.SUM, "balance", "balances"),
+        ],
+        [],
+    )[0]
+    transactions = repository_factory.get_repository(TransactionEntity).aggregate(
+        [
+            AggregateExpression(Aggregate.COUNT, alias="transactions"),
+            AggregateExpression(Aggregate.SUM, "fee_cost", "fees"),
+        ],
+        [],
+    )[0]
+    statistics = cast(
+        Optional[PlatformStatisticsEntity],
+        repository_factory.get_repository(PlatformStatisticsEntity).read(
+            PLATFORM_STATISTICS_ID
+        ),
+    )
+    repository_factory.close_connections()
+    return ConservationReport(
+        wallets=wallets["wallets"],
+        balances=wallets["balances"] or 0,
+        transactions=transactions["transactions"],
+        fees=transactions["fees"] or 0,
+        transactions_num=statistics.transactions_num if statistics else 0,
+        platform_profit=statistics.platform_profit if statistics else 0,
+    )
+
+
+def run_load_test(server: ServerConfig, load: LoadConfig) -> LoadTestReport:
+    db_setup(server.db_path)
+    with running_server(server):
+        elapsed, operations, pool_metrics = asyncio.run(
+            drive(server.get_base_url(), load)
+        )
+    return LoadTestReport(
+        elapsed=elapsed,
+        operations=operations,
+        pool_metrics=pool_metrics,
+        conservation=check_conservation(server.db_path),
+    )
+
+
+def print_report(report: LoadTestReport) -> None:
+    print(
+        f"{'operation':<12}{'requests':>10}{'ok':>8}{'4xx':>8}{'errors':>8}"
+        f"{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    )
+    for name, operation in report.operations.items():
+        print(
+            f"{name:<12}{operation.requests:>10}{operation.succeeded:>8}"
+            f"{operation.rejected:>8}{operation.failed:>8}"
+            f"{operation.ops_per_sec:>10.1f}{operation.p50_ms:>10.2f}"
+            f"{operation.p95_ms:>10.2f}{operation.p99_ms:>10.2f}"
+        )
+    requests = report.get_requests()
+    print(
+        f"{requests} requests in {report.elapsed:.1f}s: "
+        f"{requests / report.elapsed:.1f} req/s, "
+        f"error rate {report.get_error_rate():.2%}"
+    )
+    for name, value in report.pool_metrics.items():
+        print(f"{name} {value:g}")
+    conservation = report.conservation
+    print(
+        f"Balance conservation {'OK' if conservation.is_conserved() else 'FAILED'}: "
+        f"{conservation.wallets} wallets hold {conservation.balances} satoshi, "
+        f"{conservation.transactions} transactions paid {conservation.fees} in fees, "
+        f"statistics report {conservation.transactions_num} transactions and "
+        f"{conservation.platform_profit} profit"
+    )
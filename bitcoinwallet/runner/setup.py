@@ -1,54 +1,223 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import (
+    AsyncContextManager,
+    AsyncIterator,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+from fastapi import APIRouter, FastAPI
+from starlette.middleware import Middleware
 
+from bitcoinwallet.core.logger import (
+    LogWriter,
+    create_logger_factory,
+    get_log_level,
+)
+from bitcoinwallet.core.metrics import (
+    MetricsQueryObserver,
+    MetricsRegistry,
+    register_currency_metrics,
+    register_log_metrics,
+    register_pool_metrics,
+)
 from bitcoinwallet.core.model.exception.exception import (
     ForbiddenException,
     InvalidInputException,
     NotFoundException,
 )
+from bitcoinwallet.core.repository.query_observer import (
+    CompositeQueryObserver,
+    IQueryObserver,
+)
+from bitcoinwallet.core.repository.query_profiler import QueryProfiler
 from bitcoinwallet.core.repository.repository_factory import IRepositoryFactory
-from bitcoinwallet.core.service.bitcoin_service import BitcoinServiceBuilder
-from bitcoinwallet.core.service.currency_api_client import CurrencyApiClient
-from bitcoinwallet.core.service.transaction_service import TransactionServiceBuilder
-from bitcoinwallet.core.service.user_service import UserServiceBuilder
-from bitcoinwallet.core.service.wallet_service import WalletServiceBuilder
+from bitcoinwallet.core.service.async_bitcoin_service import (
+    AsyncBitcoinService,
+    AsyncBitcoinServiceBuilder,
+    database_executor,
+)
+from bitcoinwallet.core.service.bitcoin_service import (
+    BitcoinService,
+    BitcoinServiceBuilder,
+    IBitcoinService,
+)
+from bitcoinwallet.core.service.currency_api_client import (
+    AsyncCurrencyApiClient,
+    CurrencyApiClient,
+)
+from bitcoinwallet.core.service.transaction_service import (
+    TransactionService,
+    TransactionServiceBuilder,
+)
+from bitcoinwallet.core.service.user_service import UserService, UserServiceBuilder
+from bitcoinwallet.core.service.wallet_service import (
+    IWalletService,
+    WalletService,
+    WalletServiceBuilder,
+)
+from bitcoinwallet.infra.fastapi.async_bitcoin_controller import async_bitcoin_api
 from bitcoinwallet.infra.fastapi.bitcoin_controller import bitcoin_api
 from bitcoinwallet.infra.fastapi.exceptionhandler.error_handler import (
     forbidden_exception_handler,
     invalid_input_exception_handler,
     not_found_exception_handler,
 )
-from definitions import GECKO_CURRENCY_BASE_URL
+from bitcoinwallet.infra.fastapi.middleware.metrics_middleware import MetricsMiddleware
+from bitcoinwallet.infra.fastapi.middleware.query_profile_middleware import (
+    QueryProfileMiddleware,
+)
+from definitions import (
+    BUFFERED_LOGGING,
+    GECKO_CURRENCY_BASE_URL,
+    LOG_FILE,
+    LOG_LEVEL,
+    PROFILE_QUERIES,
+)
 
 
-def init_app(repository_factory: IRepositoryFactory) -> FastAPI:
-    app = FastAPI()
-    app.include_router(bitcoin_api)
-    app.add_exception_handler(NotFoundException, not_found_exception_handler)
-    app.add_exception_handler(ForbiddenException, forbidden_exception_handler)
-    app.add_exception_handler(InvalidInputException, invalid_input_exception_handler)
+def init_app(
+    repository_factory: IRepositoryFactory,
+    asynchronous: bool = False,
+    metrics: bool = True,
+    profile_queries: bool = PROFILE_QUERIES,
+    query_budgets: Optional[Mapping[str, int]] = None,
+    buffered_logging: bool = BUFFERED_LOGGING,
+) -> FastAPI:
+    log_writer = LogWriter(path=LOG_FILE or None) if buffered_logging else None
+    create_logger = create_logger_factory(log_writer, get_log_level(LOG_LEVEL))
+    registry = MetricsRegistry() if metrics else None
+    observers: List[IQueryObserver] = []
+    middleware: List[Middleware] = []
+    if registry is not None:
+        observers.append(MetricsQueryObserver(registry))
+        middleware.append(Middleware(MetricsMiddleware, registry=registry))
+        register_pool_metrics(registry, repository_factory.get_pool_stats)
+        if log_writer is not None:
+            register_log_metrics(registry, log_writer.get_stats)
+    if profile_queries or query_budgets is not None:
+        observers.append(QueryProfiler(create_logger(QueryProfiler.__name__)))
+        middleware.append(
+            Middleware(
+                QueryProfileMiddleware,
+                logger=create_logger(QueryProfileMiddleware.__name__),
+                query_budgets=query_budgets,
+            )
+        )
+    repository_factory.set_query_observer(
+        CompositeQueryObserver(observers) if observers else None
+    )
 
     user_service = (
-        UserServiceBuilder().set_repository_factory(repository_factory).build()
+        UserServiceBuilder()
+        .set_repository_factory(repository_factory)
+        .set_logger(create_logger(UserService.__name__))
+        .build()
     )
 
     transaction_service = (
-        TransactionServiceBuilder().set_repository_factory(repository_factory).build()
+        TransactionServiceBuilder()
+        .set_repository_factory(repository_factory)
+        .set_logger(create_logger(TransactionService.__name__))
+        .build()
     )
 
     wallet_service = (
-        WalletServiceBuilder().set_repository_factory(repository_factory).build()
+        WalletServiceBuilder()
+        .set_repository_factory(repository_factory)
+        .set_logger(create_logger(WalletService.__name__))
+        .build()
     )
 
-    currency_api_client = CurrencyApiClient(GECKO_CURRENCY_BASE_URL)
-
-    bitcoin_service = (
+    bitcoin_service_builder = (
         BitcoinServiceBuilder()
+        .set_logger(create_logger(BitcoinService.__name__))
         .set_user_service(user_service)
         .set_transaction_service(transaction_service)
         .set_wallet_service(wallet_service)
+    )
+
+    if asynchronous:
+        return init_async_app(
+            bitcoin_service_builder.build(),
+            wallet_service,
+            registry,
+            middleware,
+            log_writer,
+        )
+
+    currency_api_client = CurrencyApiClient(
+        GECKO_CURRENCY_BASE_URL, create_logger(CurrencyApiClient.__name__)
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        currency_api_client.start()
+        yield
+        currency_api_client.stop()
+        if log_writer is not None:
+            log_writer.close()
+
+    if registry is not None:
+        register_currency_metrics(registry, currency_api_client.get_cache_stats)
+
+    app = create_app(bitcoin_api, lifespan, registry, middleware)
+    app.state.bitcoin = bitcoin_service_builder.set_currency_api_client(
+        currency_api_client
+    ).build()
+    return app
+
+
+def init_async_app(
+    bitcoin_service: IBitcoinService,
+    wallet_service: IWalletService,
+    registry: Optional[MetricsRegistry] = None,
+    middleware: Sequence[Middleware] = (),
+    log_writer: Optional[LogWriter] = None,
+) -> FastAPI:
+    create_logger = create_logger_factory(log_writer, get_log_level(LOG_LEVEL))
+    currency_api_client = AsyncCurrencyApiClient(
+        GECKO_CURRENCY_BASE_URL, create_logger(AsyncCurrencyApiClient.__name__)
+    )
+    executor = database_executor()
+    if registry is not None:
+        register_currency_metrics(registry, currency_api_client.get_cache_stats)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        await currency_api_client.start()
+        yield
+        await currency_api_client.stop()
+        executor.shutdown()
+        if log_writer is not None:
+            log_writer.close()
+
+    app = create_app(async_bitcoin_api, lifespan, registry, middleware)
+    app.state.async_bitcoin = (
+        AsyncBitcoinServiceBuilder()
+        .set_logger(create_logger(AsyncBitcoinService.__name__))
+        .set_bitcoin_service(bitcoin_service)
+        .set_wallet_service(wallet_service)
         .set_currency_api_client(currency_api_client)
+        .set_executor(executor)
         .build()
     )
+    return app
 
-    app.state.bitcoin = bitcoin_service
+
+def create_app(
+    router: APIRouter,
+    lifespan: Callable[[FastAPI], AsyncContextManager[None]],
+    registry: Optional[MetricsRegistry] = None,
+    middleware: Sequence[Middleware] = (),
+) -> FastAPI:
+    app = FastAPI(lifespan=lifespan, middleware=list(middleware))
+    app.state.metrics = MetricsRegistry() if registry is None else registry
+    app.include_router(router)
+    app.add_exception_handler(NotFoundException, not_found_exception_handler)
+    app.add_exception_handler(ForbiddenException, forbidden_exception_handler)
+    app.add_exception_handler(InvalidInputException, invalid_input_exception_handler)
     return app
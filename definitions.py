@@ -1,21 +1,57 @@
+import configparser
 import os
 
 BITCOIN_FEE_PERCENTAGE = 1.5
 ROOT_PATH = os.path.dirname(os.path.abspath(__file__))
 
+PROPERTIES = configparser.ConfigParser()
+PROPERTIES.read(os.path.join(ROOT_PATH, "properties.ini"))
+
 DB_NAME = os.path.join(ROOT_PATH, "resources", "db", "bw_db.db")
 TEST_DB_NAME = os.path.join(ROOT_PATH, "tests", "bw_db.db")
 
 FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 
+BULK_CHUNK_SIZE = 1000
+QUERY_BATCH_SIZE = 500
+MAX_TRANSACTIONS_PAGE_SIZE = 1000
+MAX_TRANSACTIONS_BATCH_SIZE = 1000
+DB_POOL_SIZE = 8
+DB_POOL_TIMEOUT = 5.0
+STORAGE_PROFILE = PROPERTIES.get("storage", "profile", fallback="balanced")
+GROUP_COMMIT = PROPERTIES.getboolean("storage", "group_commit", fallback=False)
+GROUP_COMMIT_MAX_BATCH_SIZE = 128
+GROUP_COMMIT_MAX_WAIT_US = 500
+PROFILE_QUERIES = PROPERTIES.getboolean("profiling", "profile_queries", fallback=False)
+SLOW_QUERY_THRESHOLD_MS = PROPERTIES.getfloat(
+    "profiling", "slow_query_threshold_ms", fallback=50.0
+)
+
 MAX_WALLETS_PER_USER = 3
 INITIAL_WALLET_BALANCE = 100000000
+WALLET_CACHE_CAPACITY = 100000
 
 SATOSHIS_PER_BITCOIN = 100000000
 
 GECKO_CURRENCY_BASE_URL = "https://api.coingecko.com/api/v3/simple/price"
 INITIAL_USD_RATE = 42646.20
 CACHE_TTL = 300
-CURRENCY_CACHE_MAX_SIZE = 1
+CURRENCY_REFRESH_INTERVAL = PROPERTIES.getfloat(
+    "currency", "refresh_interval", fallback=60.0
+)
+CURRENCY_MAX_STALENESS = PROPERTIES.getfloat(
+    "currency", "max_staleness", fallback=float(CACHE_TTL)
+)
+CURRENCY_REQUEST_TIMEOUT = 5.0
 
 ADMIN_API_KEY = "admin"
+API_KEY_CACHE_CAPACITY = 100000
+API_KEY_CACHE_TTL = 600
+INVALID_API_KEY_CACHE_CAPACITY = 10000
+INVALID_API_KEY_CACHE_TTL = 60
+
+BUFFERED_LOGGING = PROPERTIES.getboolean("logging", "buffered", fallback=False)
+LOG_LEVEL = PROPERTIES.get("logging", "level", fallback="info")
+LOG_FILE = PROPERTIES.get("logging", "file", fallback="")
+LOG_QUEUE_SIZE = 10000
+LOG_BATCH_SIZE = 256
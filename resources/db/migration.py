@@ -0,0 +1,113 @@
+import sqlite3
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    statements: Tuple[str, ...]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        description="Create users, wallets and transactions tables",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS users (
+                api_key PRIMARY KEY,
+                wallet_count
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS wallets (
+                id PRIMARY KEY,
+                owner_api_key,
+                balance,
+                creation_time,
+                address NOT NULL UNIQUE,
+                FOREIGN KEY(owner_api_key) REFERENCES users(api_key)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS transactions (
+                id PRIMARY KEY,
+                from_addr,
+                to_addr,
+                amount,
+                fee_cost,
+                transaction_time,
+                FOREIGN KEY(from_addr) REFERENCES wallets(address),
+                FOREIGN KEY(to_addr) REFERENCES wallets(address)
+            )
+            """,
+        ),
+    ),
+    Migration(
+        version=2,
+        description="Index wallet owners and transaction history lookups",
+        statements=(
+            """
+            CREATE INDEX IF NOT EXISTS idx_wallets_owner_api_key
+            ON wallets (owner_api_key)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_transactions_from_addr
+            ON transactions (from_addr, transaction_time, id, to_addr, amount, fee_cost)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_transactions_to_addr
+            ON transactions (to_addr, transaction_time, id, from_addr, amount, fee_cost)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_transactions_transaction_time
+            ON transactions (transaction_time, id)
+            """,
+        ),
+    ),
+    Migration(
+        version=3,
+        description="Keep running platform statistics",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS platform_statistics (
+                id PRIMARY KEY,
+                transactions_num,
+                platform_profit
+            )
+            """,
+            """
+            INSERT OR REPLACE INTO platform_statistics
+            SELECT 'platform', COUNT(*), COALESCE(SUM(fee_cost), 0)
+            FROM transactions
+            """,
+        ),
+    ),
+]
+
+
+def get_schema_version(connection: sqlite3.Connection) -> int:
+    version: int = connection.execute("PRAGMA user_version").fetchone()[0]
+    return version
+
+
+def migrate(
+    connection: sqlite3.Connection, migrations: Sequence[Migration] = MIGRATIONS
+) -> int:
+    version = get_schema_version(connection)
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version <= version:
+            continue
+        connection.execute("BEGIN")
+        try:
+            for statement in migration.statements:
+                connection.execute(statement)
+            connection.execute(f"PRAGMA user_version = {migration.version}")
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        version = migration.version
+    return version
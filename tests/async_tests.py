@@ -0,0 +1,148 @@
+import asyncio
+import inspect
+import os
+import threading
+from typing import Any, Callable, Dict, Generator, Iterator, List
+
+import httpx
+import pytest
+from fastapi import status
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from bitcoinwallet.infra.fastapi.async_bitcoin_controller import async_bitcoin_api
+from bitcoinwallet.runner.setup import init_app
+from definitions import ADMIN_API_KEY, DB_POOL_SIZE, TEST_DB_NAME
+from resources.db.sql import db_setup
+from tests.test_repository_factory import TestRepositoryFactory
+
+
+@pytest.fixture(scope="session")
+def async_client() -> Generator[TestClient, None, None]:
+    db_setup(TEST_DB_NAME)
+
+    with TestClient(
+        init_app(TestRepositoryFactory.get_instance(), asynchronous=True)
+    ) as client:
+        yield client
+
+    TestRepositoryFactory.get_instance().close_connections()
+
+    if os.path.exists(TEST_DB_NAME):
+        os.remove(TEST_DB_NAME)
+
+
+def create_user_with_wallets(client: TestClient, wallets: int) -> Dict[str, str]:
+    api_key = client.post("/users").json()["api_key"]
+    headers = {"X-API-KEY": api_key}
+    for _ in range(wallets):
+        response = client.post("/wallets", headers=headers)
+        assert response.status_code == status.HTTP_201_CREATED
+    return headers
+
+
+def test_async_transaction_flow(async_client: TestClient) -> None:
+    headers = create_user_with_wallets(async_client, 0)
+    from_address = async_client.post("/wallets", headers=headers).json()[
+        "wallet_address"
+    ]
+    to_address = async_client.post("/wallets", headers=headers).json()["wallet_address"]
+
+    response = async_client.post(
+        "/transactions",
+        headers=headers,
+        json={
+            "from_wallet_address": from_address,
+            "to_wallet_address": to_address,
+            "amount": 0.25,
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = async_client.get(f"/wallets/{to_address}", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["btc_balance"] == 1.25
+
+    response = async_client.get("/transactions", headers=headers)
+    assert len(response.json()["transactions"]) == 1
+
+    response = async_client.get(
+        f"/wallets/{from_address}/transactions", headers=headers
+    )
+    assert len(response.json()["transactions"]) == 1
+
+    response = async_client.get(
+        "/statistics", headers={"X-ADMIN-API-KEY": ADMIN_API_KEY}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["transactions_num"] >= 1
+
+
+def test_async_rejects_unknown_and_foreign_keys(async_client: TestClient) -> None:
+    owner = create_user_with_wallets(async_client, 0)
+    address = async_client.post("/wallets", headers=owner).json()["wallet_address"]
+    intruder = create_user_with_wallets(async_client, 0)
+
+    response = async_client.get(f"/wallets/{address}", headers={"X-API-KEY": "x"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = async_client.get(f"/wallets/{address}", headers=intruder)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = async_client.get("/statistics", headers={"X-ADMIN-API-KEY": "x"})
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_async_requests_share_database_threads(async_client: TestClient) -> None:
+    headers = create_user_with_wallets(async_client, 0)
+    address = async_client.post("/wallets", headers=headers).json()["wallet_address"]
+    app = async_client.app
+    baseline = threading.active_count()
+
+    async def get_balances(requests: int) -> List[int]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            responses = await asyncio.gather(
+                *[
+                    client.get(f"/wallets/{address}", headers=headers)
+                    for _ in range(requests)
+                ]
+            )
+        return [response.status_code for response in responses]
+
+    assert asyncio.run(get_balances(500)) == [status.HTTP_200_OK] * 500
+    assert threading.active_count() <= baseline + DB_POOL_SIZE
+
+
+def test_async_dependencies_resolve_on_event_loop() -> None:
+    def calls(dependant: Dependant) -> Iterator[Callable[..., Any]]:
+        for dependency in dependant.dependencies:
+            if dependency.call is not None:
+                yield dependency.call
+            yield from calls(dependency)
+
+    routes = [
+        route for route in async_bitcoin_api.routes if isinstance(route, APIRoute)
+    ]
+    sync_calls = {
+        f"{route.path}: {call.__name__}"
+        for route in routes
+        for call in calls(route.dependant)
+        if not inspect.iscoroutinefunction(call)
+    }
+
+    assert routes
+    assert sync_calls == set()
+
+
+def test_async_metrics(async_client: TestClient) -> None:
+    create_user_with_wallets(async_client, 1)
+
+    response = async_client.get("/metrics", headers={"X-ADMIN-API-KEY": ADMIN_API_KEY})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'route="/wallets",status="201"' in response.text
+    assert 'currency_rate_cache_total{result="miss"}' in response.text
@@ -0,0 +1,77 @@
+import threading
+from typing import List
+
+import pytest
+
+from bitcoinwallet.core.cache import BoundedCache, SingleFlightCache
+
+
+def test_bounded_cache_evicts_least_recently_used() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(capacity=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.size, stats.capacity) == (3, 1, 2, 2)
+    assert stats.hit_rate == 0.75
+
+
+def test_single_flight_cache_expires_entries() -> None:
+    now = [0.0]
+    loads: List[int] = []
+    cache: SingleFlightCache[str, int] = SingleFlightCache(ttl=10, timer=lambda: now[0])
+
+    def loader() -> int:
+        loads.append(len(loads))
+        return len(loads)
+
+    assert cache.get("rate", loader) == 1
+    now[0] = 9.9
+    assert cache.get("rate", loader) == 1
+    now[0] = 10.0
+    assert cache.get("rate", loader) == 2
+    assert cache.refresh("rate", loader) == 3
+
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.coalesced, stats.size) == (1, 3, 0, 1)
+
+
+def test_single_flight_cache_serves_last_value_while_loading() -> None:
+    cache: SingleFlightCache[str, int] = SingleFlightCache(ttl=0)
+    cache.get("rate", lambda: 1)
+    loading = threading.Event()
+    release = threading.Event()
+
+    def slow_loader() -> int:
+        loading.set()
+        release.wait()
+        return 2
+
+    leader = threading.Thread(target=cache.get, args=("rate", slow_loader))
+    leader.start()
+    loading.wait()
+
+    assert cache.get("rate", lambda: 3) == 1
+
+    release.set()
+    leader.join()
+    assert cache.get_stats().coalesced == 1
+
+
+def test_single_flight_cache_retries_after_failed_load() -> None:
+    cache: SingleFlightCache[str, int] = SingleFlightCache(ttl=10)
+
+    def failing_loader() -> int:
+        raise ConnectionError()
+
+    with pytest.raises(ConnectionError):
+        cache.get("rate", failing_loader)
+
+    assert cache.get("rate", lambda: 1) == 1
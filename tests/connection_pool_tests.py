@@ -0,0 +1,152 @@
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from bitcoinwallet.core.model.entity import UserEntity
+from bitcoinwallet.core.repository import connection_pool
+from bitcoinwallet.core.repository.connection_pool import (
+    ConnectionPool,
+    ConnectionPoolTimeoutError,
+)
+from bitcoinwallet.core.repository.repository import Repository
+from bitcoinwallet.core.repository.storage_profile import (
+    UnknownStorageProfileError,
+    get_storage_profile,
+)
+from resources.db.sql import db_setup
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    return db_setup(os.path.join(tmp_path, "pool_db.db"))
+
+
+def test_pool_reuses_connections(db_path: str) -> None:
+    pool = ConnectionPool(db_path, size=2, timeout=1)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        assert first is second
+
+    stats = pool.get_stats()
+    assert stats.opened == 1
+    assert stats.checkouts == 2
+    assert stats.in_use == 0
+    assert stats.waits == 0
+    pool.close()
+
+
+def test_pool_is_bounded_and_times_out(db_path: str) -> None:
+    pool = ConnectionPool(db_path, size=2, timeout=0.05)
+
+    with pool.connection(), pool.connection():
+        with pytest.raises(ConnectionPoolTimeoutError):
+            with pool.connection():
+                pass
+
+    stats = pool.get_stats()
+    assert stats.opened == 2
+    assert stats.high_water_mark == 2
+    assert stats.waits == 1
+    assert stats.timeouts == 1
+    pool.close()
+
+
+def test_pool_waiter_gets_released_connection(db_path: str) -> None:
+    pool = ConnectionPool(db_path, size=1, timeout=5)
+    checked_out = threading.Event()
+    release = threading.Event()
+
+    def hold_connection() -> None:
+        with pool.connection():
+            checked_out.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_connection)
+    holder.start()
+    checked_out.wait()
+    threading.Timer(0.05, release.set).start()
+
+    with pool.connection() as connection:
+        assert connection.execute("SELECT 1").fetchone() == (1,)
+    holder.join()
+
+    stats = pool.get_stats()
+    assert stats.waits == 1
+    assert stats.timeouts == 0
+    pool.close()
+
+
+def test_pool_close_reopens_connections(db_path: str) -> None:
+    pool = ConnectionPool(db_path, size=1, timeout=1)
+
+    with pool.connection() as first:
+        pass
+    pool.close()
+    with pool.connection() as second:
+        assert second is not first
+
+    assert pool.get_stats().opened == 1
+    pool.close()
+
+
+def test_concurrent_repository_reads(db_path: str) -> None:
+    pool = ConnectionPool(db_path, size=4, timeout=5)
+    user_repo = Repository(UserEntity, pool)
+    users = [UserEntity(str(uuid.uuid4()), 1) for _ in range(50)]
+    user_repo.create_many(users)
+
+    def read_all(_: int) -> int:
+        return len(user_repo.get_by_field("wallet_count", 1))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(read_all, range(200)))
+
+    assert results == [len(users)] * 200
+    assert pool.get_stats().high_water_mark <= 4
+    pool.close()
+
+
+@pytest.mark.parametrize(
+    "profile_name, synchronous", [("durable", 2), ("balanced", 1), ("throughput", 0)]
+)
+def test_pool_applies_storage_profile(
+    db_path: str, profile_name: str, synchronous: int
+) -> None:
+    profile = get_storage_profile(profile_name)
+    pool = ConnectionPool(db_path, size=1, timeout=1, storage_profile=profile)
+
+    with pool.connection() as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert connection.execute("PRAGMA synchronous").fetchone() == (synchronous,)
+        assert connection.execute("PRAGMA cache_size").fetchone() == (
+            profile.cache_size,
+        )
+        assert connection.execute("PRAGMA busy_timeout").fetchone() == (
+            profile.busy_timeout,
+        )
+    pool.close()
+
+
+def test_unknown_storage_profile() -> None:
+    with pytest.raises(UnknownStorageProfileError):
+        get_storage_profile("fastest")
+
+
+def test_pool_resolves_default_storage_profile_on_construction(
+    db_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(connection_pool, "STORAGE_PROFILE", "throughput")
+    pool = ConnectionPool(db_path, size=1, timeout=1)
+
+    assert pool.get_storage_profile() == get_storage_profile("throughput")
+    pool.close()
+
+    monkeypatch.setattr(connection_pool, "STORAGE_PROFILE", "fastest")
+    with pytest.raises(UnknownStorageProfileError):
+        ConnectionPool(db_path, size=1, timeout=1)
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Generator, List
+
+import pytest
+
+from bitcoinwallet.core.service.currency_api_client import (
+    AsyncCurrencyApiClient,
+    CurrencyApiClient,
+)
+from definitions import INITIAL_USD_RATE
+
+
+class StubCoinGecko(ThreadingHTTPServer):
+    rate = 50000.0
+    status = 200
+    delay = 0.0
+    calls = 0
+
+
+class StubCoinGeckoHandler(BaseHTTPRequestHandler):
+    server: StubCoinGecko
+
+    def do_GET(self) -> None:
+        self.server.calls += 1
+        time.sleep(self.server.delay)
+        body = json.dumps({"bitcoin": {"usd": self.server.rate}}).encode()
+        self.send_response(self.server.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub() -> Generator[StubCoinGecko, None, None]:
+    server = StubCoinGecko(("127.0.0.1", 0), StubCoinGeckoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def stub_url(stub: StubCoinGecko) -> str:
+    host, port = stub.server_address[:2]
+    return f"http://{host!s}:{port}/simple/price"
+
+
+def test_fresh_rate_is_served_from_cache(stub: StubCoinGecko) -> None:
+    client = CurrencyApiClient(stub_url(stub))
+
+    rates = [client.get_btc_to_usd_rate() for _ in range(100)]
+
+    assert rates == [50000.0] * 100
+    assert stub.calls == 1
+
+
+def test_stale_rate_is_refetched_without_refresher(stub: StubCoinGecko) -> None:
+    client = CurrencyApiClient(stub_url(stub), max_staleness=0)
+
+    client.get_btc_to_usd_rate()
+    stub.rate = 51000.0
+
+    assert client.get_btc_to_usd_rate() == 51000.0
+    assert stub.calls == 2
+
+
+def test_failed_refresh_keeps_last_rate(stub: StubCoinGecko) -> None:
+    client = CurrencyApiClient(stub_url(stub), max_staleness=0)
+    assert client.refresh() == 50000.0
+
+    stub.status = 503
+
+    assert client.refresh() == 50000.0
+    assert client.get_btc_to_usd_rate() == 50000.0
+    assert stub.calls == 3
+
+
+def test_refresh_times_out(stub: StubCoinGecko) -> None:
+    stub.delay = 1.0
+    client = CurrencyApiClient(stub_url(stub), timeout=0.1)
+
+    started = time.monotonic()
+
+    assert client.get_btc_to_usd_rate() == INITIAL_USD_RATE
+    assert time.monotonic() - started < 0.9
+
+
+def test_refresher_updates_rate_in_background(stub: StubCoinGecko) -> None:
+    client = CurrencyApiClient(stub_url(stub), refresh_interval=0.01)
+    client.start()
+    try:
+        stub.rate = 52000.0
+        deadline = time.monotonic() + 5
+        while client.get_btc_to_usd_rate() != 52000.0:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        client.stop()
+
+    calls = stub.calls
+    time.sleep(0.05)
+    assert not client.is_refreshing()
+    assert stub.calls == calls
+
+
+def test_expired_rate_is_fetched_once_by_concurrent_callers(
+    stub: StubCoinGecko,
+) -> None:
+    stub.delay = 0.2
+    client = CurrencyApiClient(stub_url(stub), max_staleness=0.5)
+    threads = 64
+    barrier = threading.Barrier(threads)
+
+    def get_rate(_: int) -> float:
+        barrier.wait()
+        return client.get_btc_to_usd_rate()
+
+    def burst() -> List[float]:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(get_rate, range(threads)))
+
+    assert burst() == [50000.0] * threads
+    assert stub.calls == 1
+
+    stub.rate = 51000.0
+    time.sleep(0.5)
+    rates = burst()
+
+    assert stub.calls == 2
+    assert set(rates) <= {50000.0, 51000.0}
+    stats = client.get_cache_stats()
+    assert stats.misses == 2
+    assert stats.coalesced >= threads - 1
+
+
+def test_async_client_coalesces_concurrent_fetches(stub: StubCoinGecko) -> None:
+    stub.delay = 0.1
+    client = AsyncCurrencyApiClient(stub_url(stub), max_staleness=60)
+
+    async def get_rates() -> List[float]:
+        return list(
+            await asyncio.gather(*[client.get_btc_to_usd_rate() for _ in range(50)])
+        )
+
+    assert asyncio.run(get_rates()) == [50000.0] * 50
+    assert stub.calls == 1
+
+
+def test_async_refresher_updates_rate_in_background(stub: StubCoinGecko) -> None:
+    client = AsyncCurrencyApiClient(stub_url(stub), refresh_interval=0.01)
+
+    async def refresh_in_background() -> float:
+        await client.start()
+        try:
+            stub.rate = 52000.0
+            for _ in range(500):
+                rate = await client.get_btc_to_usd_rate()
+                if rate == 52000.0:
+                    break
+                await asyncio.sleep(0.01)
+            return rate
+        finally:
+            await client.stop()
+
+    assert asyncio.run(refresh_in_background()) == 52000.0
@@ -0,0 +1,59 @@
+import os
+from pathlib import Path
+
+from benchmarks.dataset import generate_dataset, load_dataset
+from bitcoinwallet.core.model.entity import (
+    PLATFORM_STATISTICS_ID,
+    PlatformStatisticsEntity,
+    WalletEntity,
+)
+from bitcoinwallet.core.repository.repository_factory import repository_factory_for
+from definitions import INITIAL_WALLET_BALANCE, MAX_WALLETS_PER_USER
+from resources.db.sql import db_setup
+
+
+def test_dataset_is_deterministic() -> None:
+    first = generate_dataset(50, 500, seed=7)
+    second = generate_dataset(50, 500, seed=7)
+    other = generate_dataset(50, 500, seed=8)
+
+    assert first == second
+    assert first != other
+
+
+def test_dataset_conserves_balances_and_skews_to_hot_wallets() -> None:
+    dataset = generate_dataset(200, 5000, seed=1)
+
+    fees = sum(transaction.fee_cost for transaction in dataset.transactions)
+    balances = sum(wallet.balance for wallet in dataset.wallets)
+    assert balances + fees == len(dataset.wallets) * INITIAL_WALLET_BALANCE
+    assert all(1 <= user.wallet_count <= MAX_WALLETS_PER_USER for user in dataset.users)
+
+    hot = {wallet.address for wallet in dataset.hot_wallets}
+    hot_transactions = [
+        transaction
+        for transaction in dataset.transactions
+        if transaction.from_addr in hot or transaction.to_addr in hot
+    ]
+    assert len(hot) < len(dataset.wallets) / 50
+    assert len(hot_transactions) > len(dataset.transactions) / 3
+
+
+def test_loaded_dataset_matches_generated(tmp_path: Path) -> None:
+    dataset = generate_dataset(20, 200, seed=2)
+    db_path = db_setup(os.path.join(tmp_path, "dataset.db"))
+
+    load_dataset(db_path, dataset)
+
+    repository_factory = repository_factory_for(db_path)
+    statistics = repository_factory.get_repository(PlatformStatisticsEntity).read(
+        PLATFORM_STATISTICS_ID
+    )
+    assert statistics == PlatformStatisticsEntity(
+        PLATFORM_STATISTICS_ID,
+        len(dataset.transactions),
+        sum(transaction.fee_cost for transaction in dataset.transactions),
+    )
+    wallet = dataset.hot_wallets[0]
+    assert repository_factory.get_repository(WalletEntity).read(wallet.id) == wallet
+    repository_factory.close_connections()
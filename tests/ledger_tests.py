@@ -0,0 +1,313 @@
+import os
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Generator, List, Sequence, Tuple, cast
+
+import pytest
+
+from bitcoinwallet.core.model.entity import (
+    PLATFORM_STATISTICS_ID,
+    PlatformStatisticsEntity,
+    TransactionEntity,
+    UserEntity,
+    WalletEntity,
+)
+from bitcoinwallet.core.repository.connection_pool import ConnectionPool
+from bitcoinwallet.core.repository.group_commit import GroupCommitLedgerRepository
+from bitcoinwallet.core.repository.ledger_repository import (
+    LedgerRepository,
+    TransferOutcome,
+    TransferStatus,
+)
+from bitcoinwallet.core.repository.repository import Repository
+from bitcoinwallet.core.util import datetime_now
+from resources.db.sql import db_setup
+
+
+@pytest.fixture
+def pool(tmp_path: Path) -> Generator[ConnectionPool, None, None]:
+    pool = ConnectionPool(db_setup(os.path.join(tmp_path, "ledger.db")), size=4)
+    yield pool
+    pool.close()
+
+
+def create_wallets(pool: ConnectionPool, owner: str, balances: List[int]) -> List[str]:
+    Repository(UserEntity, pool).create(UserEntity(owner, len(balances)))
+    wallets = [
+        WalletEntity(
+            str(uuid.uuid4()), owner, balance, datetime_now(), str(uuid.uuid4())
+        )
+        for balance in balances
+    ]
+    Repository(WalletEntity, pool).create_many(wallets)
+    return [wallet.address for wallet in wallets]
+
+
+def new_transaction(
+    from_addr: str, to_addr: str, amount: int, fee_cost: int = 0
+) -> TransactionEntity:
+    return TransactionEntity(
+        str(uuid.uuid4()), from_addr, to_addr, amount, fee_cost, datetime_now()
+    )
+
+
+def balance_of(pool: ConnectionPool, address: str) -> int:
+    wallets = Repository(WalletEntity, pool).get_by_field("address", address)
+    return cast(WalletEntity, wallets[0]).balance
+
+
+def statistics_of(pool: ConnectionPool) -> Tuple[int, int]:
+    statistics = Repository(PlatformStatisticsEntity, pool).read(PLATFORM_STATISTICS_ID)
+    assert isinstance(statistics, PlatformStatisticsEntity)
+    return statistics.transactions_num, statistics.platform_profit
+
+
+def test_transfer_moves_funds_and_records_transaction(pool: ConnectionPool) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [1000, 0])
+    transaction = new_transaction(source, destination, 300, 15)
+
+    status = LedgerRepository(pool).transfer(owner, transaction)
+
+    assert status is TransferStatus.COMPLETED
+    assert balance_of(pool, source) == 685
+    assert balance_of(pool, destination) == 300
+    assert Repository(TransactionEntity, pool).read(transaction.id) == transaction
+
+
+@pytest.mark.parametrize(
+    "amount, user, destination_exists, expected",
+    [
+        (2000, "owner", True, TransferStatus.INSUFFICIENT_BALANCE),
+        (100, "intruder", True, TransferStatus.NOT_OWNER),
+        (100, "owner", False, TransferStatus.DESTINATION_NOT_FOUND),
+    ],
+)
+def test_failed_transfer_changes_nothing(
+    pool: ConnectionPool,
+    amount: int,
+    user: str,
+    destination_exists: bool,
+    expected: TransferStatus,
+) -> None:
+    source, destination = create_wallets(pool, "owner", [1000, 0])
+    if not destination_exists:
+        destination = str(uuid.uuid4())
+    transaction = new_transaction(source, destination, amount)
+
+    assert LedgerRepository(pool).transfer(user, transaction) is expected
+    assert balance_of(pool, source) == 1000
+    assert Repository(TransactionEntity, pool).read(transaction.id) is None
+
+
+def test_transfer_from_missing_wallet(pool: ConnectionPool) -> None:
+    transaction = new_transaction(str(uuid.uuid4()), str(uuid.uuid4()), 1)
+
+    status = LedgerRepository(pool).transfer("owner", transaction)
+
+    assert status is TransferStatus.SOURCE_NOT_FOUND
+
+
+def test_concurrent_transfers_never_overdraw(pool: ConnectionPool) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [1000, 0])
+    ledger = LedgerRepository(pool)
+
+    def transfer(_: int) -> TransferStatus:
+        return ledger.transfer(owner, new_transaction(source, destination, 100))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        statuses = list(executor.map(transfer, range(25)))
+
+    assert statuses.count(TransferStatus.COMPLETED) == 10
+    assert statuses.count(TransferStatus.INSUFFICIENT_BALANCE) == 15
+    assert balance_of(pool, source) == 0
+    assert balance_of(pool, destination) == 1000
+
+
+def test_transfers_maintain_statistics(pool: ConnectionPool) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [1000, 0])
+    ledger = LedgerRepository(pool)
+
+    ledger.transfer(owner, new_transaction(source, destination, 300, 15))
+    ledger.transfer(owner, new_transaction(source, destination, 5000, 10))
+    ledger.record_transaction(new_transaction(destination, source, 100, 7))
+
+    assert statistics_of(pool) == (2, 22)
+
+
+def test_rebuild_statistics_recounts_transactions(pool: ConnectionPool) -> None:
+    Repository(TransactionEntity, pool).create_many(
+        [new_transaction("a", "b", 10, fee) for fee in (1, 2, 3)]
+    )
+    assert statistics_of(pool) == (0, 0)
+
+    LedgerRepository(pool).rebuild_statistics()
+
+    assert statistics_of(pool) == (3, 6)
+
+
+def test_atomic_batch_applies_nothing_on_failure(pool: ConnectionPool) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [1000, 0])
+    transactions = [
+        new_transaction(source, destination, 300, 3),
+        new_transaction(source, str(uuid.uuid4()), 100),
+        new_transaction(source, destination, 200),
+    ]
+
+    statuses = LedgerRepository(pool).transfer_many(owner, transactions)
+
+    assert statuses == [
+        TransferStatus.NOT_APPLIED,
+        TransferStatus.DESTINATION_NOT_FOUND,
+        TransferStatus.NOT_APPLIED,
+    ]
+    assert balance_of(pool, source) == 1000
+    assert balance_of(pool, destination) == 0
+    assert statistics_of(pool) == (0, 0)
+
+
+def test_best_effort_batch_skips_failed_transfers(pool: ConnectionPool) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [1000, 0])
+    transactions = [
+        new_transaction(source, destination, 300, 3),
+        new_transaction(source, str(uuid.uuid4()), 100),
+        new_transaction(source, destination, 900),
+        new_transaction(source, destination, 200),
+    ]
+
+    statuses = LedgerRepository(pool).transfer_many(owner, transactions, atomic=False)
+
+    assert statuses == [
+        TransferStatus.COMPLETED,
+        TransferStatus.DESTINATION_NOT_FOUND,
+        TransferStatus.INSUFFICIENT_BALANCE,
+        TransferStatus.COMPLETED,
+    ]
+    assert balance_of(pool, source) == 497
+    assert balance_of(pool, destination) == 500
+    assert statistics_of(pool) == (2, 3)
+
+
+def test_group_commit_batches_concurrent_transfers(pool: ConnectionPool) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [1000, 0])
+    ledger = GroupCommitLedgerRepository(LedgerRepository(pool), max_wait_us=20000)
+
+    def transfer(index: int) -> TransferStatus:
+        user = owner if index % 10 else "intruder"
+        return ledger.transfer(user, new_transaction(source, destination, 10, 1))
+
+    with ThreadPoolExecutor(max_workers=50) as executor:
+        statuses = list(executor.map(transfer, range(100)))
+    ledger.close()
+
+    assert statuses.count(TransferStatus.COMPLETED) == 90
+    assert statuses.count(TransferStatus.NOT_OWNER) == 10
+    assert [statuses[index] for index in range(0, 100, 10)] == [
+        TransferStatus.NOT_OWNER
+    ] * 10
+    assert balance_of(pool, source) == 10
+    assert balance_of(pool, destination) == 900
+    assert statistics_of(pool) == (90, 90)
+    stats = ledger.get_stats()
+    assert stats.transfers == 100
+    assert stats.batches < 100
+    assert stats.largest_batch > 1
+
+
+def test_group_commit_close_races_concurrent_transfers(pool: ConnectionPool) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [1000, 0])
+    ledger = GroupCommitLedgerRepository(LedgerRepository(pool), max_wait_us=1000)
+    stop = threading.Event()
+
+    def close_repeatedly() -> None:
+        while not stop.is_set():
+            ledger.close()
+
+    closer = threading.Thread(target=close_repeatedly, daemon=True)
+    closer.start()
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        futures = [
+            executor.submit(
+                ledger.transfer, owner, new_transaction(source, destination, 1, 0)
+            )
+            for _ in range(200)
+        ]
+        statuses = [future.result(timeout=10) for future in futures]
+    stop.set()
+    closer.join(timeout=10)
+    ledger.close()
+
+    assert not closer.is_alive()
+    assert statuses == [TransferStatus.COMPLETED] * 200
+    assert balance_of(pool, destination) == 200
+
+
+def test_group_commit_reports_insufficient_balance(pool: ConnectionPool) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [100, 0])
+    ledger = GroupCommitLedgerRepository(LedgerRepository(pool), max_batch_size=1)
+
+    statuses = [
+        ledger.transfer(owner, new_transaction(source, destination, 60))
+        for _ in range(2)
+    ]
+    ledger.close()
+
+    assert statuses == [TransferStatus.COMPLETED, TransferStatus.INSUFFICIENT_BALANCE]
+    assert ledger.get_stats().batches == 2
+
+
+def test_group_commit_fails_only_the_transfer_that_raised(
+    pool: ConnectionPool,
+) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [1000, 0])
+    ledger = GroupCommitLedgerRepository(LedgerRepository(pool), max_wait_us=200000)
+    duplicate = new_transaction(source, destination, 10)
+
+    def transfer(transaction: TransactionEntity) -> TransferOutcome:
+        try:
+            return ledger.transfer(owner, transaction)
+        except sqlite3.IntegrityError as error:
+            return error
+
+    transactions = [duplicate, new_transaction(source, destination, 20), duplicate]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        outcomes = list(executor.map(transfer, transactions))
+    ledger.close()
+
+    assert ledger.get_stats().batches == 1
+    assert outcomes.count(TransferStatus.COMPLETED) == 2
+    assert len([o for o in outcomes if isinstance(o, sqlite3.IntegrityError)]) == 1
+    assert balance_of(pool, source) == 970
+    assert statistics_of(pool) == (2, 0)
+
+
+class StoppingLedgerRepository(LedgerRepository):
+    def transfer_each(
+        self, transfers: Sequence[Tuple[str, TransactionEntity]]
+    ) -> List[TransferOutcome]:
+        raise SystemExit()
+
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_group_commit_fails_callers_when_writer_stops(pool: ConnectionPool) -> None:
+    owner = str(uuid.uuid4())
+    source, destination = create_wallets(pool, owner, [1000, 0])
+    ledger = GroupCommitLedgerRepository(StoppingLedgerRepository(pool))
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            ledger.transfer(owner, new_transaction(source, destination, 10))
+    ledger.close()
+
+    assert balance_of(pool, source) == 1000
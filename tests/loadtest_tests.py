@@ -0,0 +1,48 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from bitcoinwallet.runner.loadtest import (
+    LoadConfig,
+    Operation,
+    ServerConfig,
+    find_free_port,
+    parse_mix,
+    run_load_test,
+)
+
+
+def test_mix_is_parsed_and_validated() -> None:
+    assert parse_mix("transfer=3, history=1") == {
+        Operation.TRANSFER: 3.0,
+        Operation.HISTORY: 1.0,
+    }
+    with pytest.raises(ValueError):
+        parse_mix("transfer=1,deposit=1")
+    with pytest.raises(ValueError):
+        parse_mix("transfer=0")
+
+
+def test_load_test_conserves_balances(tmp_path: Path) -> None:
+    host = "127.0.0.1"
+    server = ServerConfig(
+        os.path.join(tmp_path, "loadtest.db"), host, find_free_port(host)
+    )
+    load = LoadConfig(
+        clients=8,
+        duration=1.0,
+        users=5,
+        wallets_per_user=2,
+        mix=parse_mix("transfer=6,history=1,balance=1,wallet=1,user=1,statistics=1"),
+    )
+
+    report = run_load_test(server, load)
+
+    transfers = report.operations[Operation.TRANSFER.value]
+    assert transfers.succeeded > 0
+    assert report.get_error_rate() == 0
+    assert report.conservation.wallets >= 10
+    assert report.conservation.transactions == transfers.succeeded
+    assert report.conservation.is_conserved()
+    assert report.pool_metrics["db_pool_timeouts_total"] == 0
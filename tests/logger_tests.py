@@ -0,0 +1,171 @@
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, TextIO
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from bitcoinwallet.core.logger import (
+    BufferedLogger,
+    ConsoleLogger,
+    LogLevel,
+    LogWriter,
+    LogWriterStats,
+    get_log_level,
+)
+from bitcoinwallet.runner.setup import init_app
+from definitions import ADMIN_API_KEY, TEST_DB_NAME
+from resources.db.sql import db_setup
+from tests.test_repository_factory import TestRepositoryFactory
+
+
+class CountingArgument:
+    def __init__(self) -> None:
+        self.formatted = 0
+
+    def __str__(self) -> str:
+        self.formatted += 1
+        return "argument"
+
+
+class BlockingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.released = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.released.wait()
+        return super().write(text)
+
+
+def test_buffered_logger_filters_levels_and_formats_lazily() -> None:
+    stream = io.StringIO()
+    writer = LogWriter(stream)
+    logger = BufferedLogger("Service", writer, LogLevel.WARNING)
+    skipped, logged = CountingArgument(), CountingArgument()
+
+    logger.info("Skipped %s", skipped)
+    logger.error("Failed %s", logged, api_key="key", amount=5)
+    writer.close()
+
+    lines: List[str] = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    assert lines[0].endswith("ERROR Service: Failed argument api_key=key amount=5")
+    assert skipped.formatted == 0
+    assert logged.formatted == 1
+    assert writer.get_stats().written == 1
+
+
+def test_log_writer_drops_records_when_queue_is_full() -> None:
+    stream = BlockingStream()
+    writer = LogWriter(stream, capacity=1)
+    logger = BufferedLogger("Service", writer)
+
+    for index in range(5):
+        logger.info("Record %s", index)
+    blocked = writer.get_stats()
+    stream.released.set()
+    writer.close()
+
+    stats = writer.get_stats()
+    assert blocked.dropped >= 3
+    assert stats.written + stats.dropped == 5
+    assert stats.queued == 0
+
+
+def test_log_writer_bounds_concurrent_submitters() -> None:
+    stream = BlockingStream()
+    writer = LogWriter(stream, capacity=10)
+    logger = BufferedLogger("Service", writer)
+
+    def log(index: int) -> None:
+        for record in range(50):
+            logger.info("Record %s %s", index, record)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(log, range(8)))
+    blocked = writer.get_stats()
+    stream.released.set()
+    writer.close()
+
+    stats = writer.get_stats()
+    assert blocked.queued <= 10
+    assert stats.written + stats.dropped == 400
+    assert stats.written == len(stream.getvalue().splitlines())
+
+
+class LateSubmitWriter(LogWriter):
+    def _drain(self, stream: TextIO) -> None:
+        super()._drain(stream)
+        if threading.current_thread().name == "log-writer" and self._stopping:
+            BufferedLogger("Service", self).info("Late")
+
+
+def test_log_writer_close_writes_records_submitted_during_shutdown() -> None:
+    stream = io.StringIO()
+    writer = LateSubmitWriter(stream)
+
+    BufferedLogger("Service", writer).info("Stopping")
+    writer.close()
+
+    lines = stream.getvalue().splitlines()
+    assert [line.split(" ", 2)[2] for line in lines] == [
+        "INFO Service: Stopping",
+        "INFO Service: Late",
+    ]
+    assert writer.get_stats() == LogWriterStats(written=2, dropped=0, queued=0)
+
+
+def test_log_writer_appends_to_file(tmp_path: Path) -> None:
+    path = os.path.join(tmp_path, "app.log")
+    writer = LogWriter(path=path)
+
+    BufferedLogger("Service", writer).info("Started")
+    writer.close()
+    BufferedLogger("Service", writer).info("Restarted")
+    writer.close()
+
+    with open(path, encoding="utf-8") as log_file:
+        lines = log_file.read().splitlines()
+    assert [line.split(" ", 2)[2] for line in lines] == [
+        "INFO Service: Started",
+        "INFO Service: Restarted",
+    ]
+
+
+def test_console_logger_prints_every_level(capsys: pytest.CaptureFixture[str]) -> None:
+    logger = ConsoleLogger("Service")
+
+    logger.debug("Debug %s", 1)
+    logger.info("Info")
+    logger.warning("Warning", key="value")
+    logger.error("Error")
+
+    assert capsys.readouterr().out.splitlines() == [
+        "DEBUG: LOGGING CLASS: Service: Debug 1",
+        "INFO: LOGGING CLASS: Service: Info",
+        "WARNING: LOGGING CLASS: Service: Warning key=value",
+        "ERROR: LOGGING CLASS: Service: Error",
+    ]
+
+
+def test_unknown_log_level_is_rejected() -> None:
+    assert get_log_level("debug") == LogLevel.DEBUG
+    with pytest.raises(ValueError):
+        get_log_level("verbose")
+
+
+def test_app_with_buffered_logging_exports_log_metrics() -> None:
+    db_setup(TEST_DB_NAME)
+    app = init_app(TestRepositoryFactory.get_instance(), buffered_logging=True)
+
+    with TestClient(app) as client:
+        assert client.post("/users").status_code == status.HTTP_201_CREATED
+        response = client.get("/metrics", headers={"X-ADMIN-API-KEY": ADMIN_API_KEY})
+
+    assert 'log_records_total{result="dropped"} 0' in response.text
+    assert 'log_records_total{result="written"}' in response.text
@@ -0,0 +1,133 @@
+import os
+import uuid
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from bitcoinwallet.core.metrics import MetricsQueryObserver, MetricsRegistry
+from bitcoinwallet.core.model.entity import UserEntity
+from bitcoinwallet.core.repository.connection_pool import ConnectionPool
+from bitcoinwallet.core.repository.repository import Repository
+from bitcoinwallet.runner.setup import init_app
+from definitions import ADMIN_API_KEY, TEST_DB_NAME
+from resources.db.sql import db_setup
+from tests.test_repository_factory import TestRepositoryFactory
+
+ADMIN_HEADERS = {"X-ADMIN-API-KEY": ADMIN_API_KEY}
+
+
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    db_setup(TEST_DB_NAME)
+
+    yield TestClient(init_app(TestRepositoryFactory.get_instance()))
+
+    TestRepositoryFactory.get_instance().close_connections()
+
+    if os.path.exists(TEST_DB_NAME):
+        os.remove(TEST_DB_NAME)
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ("path",))
+    histogram = registry.histogram(
+        "latency_seconds", "Latency.", ("path",), buckets=(0.1, 1.0)
+    )
+
+    counter.inc(('/a"b',))
+    counter.inc(('/a"b',), 2)
+    histogram.observe(0.05, ("/",))
+    histogram.observe(0.5, ("/",))
+    histogram.observe(5, ("/",))
+
+    assert registry.render() == (
+        "# HELP requests_total Requests.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{path="/a\\"b"} 3\n'
+        "# HELP latency_seconds Latency.\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{path="/",le="0.1"} 1\n'
+        'latency_seconds_bucket{path="/",le="1"} 2\n'
+        'latency_seconds_bucket{path="/",le="+Inf"} 3\n'
+        'latency_seconds_sum{path="/"} 5.55\n'
+        'latency_seconds_count{path="/"} 3\n'
+    )
+
+
+def test_registry_rejects_duplicate_names() -> None:
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests.")
+
+    with pytest.raises(ValueError):
+        registry.counter("requests_total", "Requests.")
+
+
+def test_query_observer_counts_queries_rows_and_commits(tmp_path: Path) -> None:
+    registry = MetricsRegistry()
+    observer = MetricsQueryObserver(registry)
+    pool = ConnectionPool(
+        db_setup(os.path.join(tmp_path, "metrics.db")), query_observer=observer
+    )
+    repository = Repository(UserEntity, pool)
+    api_key = str(uuid.uuid4())
+
+    repository.create(UserEntity(api_key, 0))
+    assert repository.read(api_key) is not None
+
+    assert observer.queries.get(("INSERT",)) == 1
+    assert observer.rows.get(("INSERT",)) == 1
+    assert observer.queries.get(("SELECT",)) == 1
+    assert observer.rows.get(("SELECT",)) == 1
+    assert observer.query_duration.get_count(("SELECT",)) == 2
+    assert observer.commit_duration.get_count() == 1
+    pool.close()
+
+
+def test_metrics_requires_admin_api_key(client: TestClient) -> None:
+    response = client.get("/metrics", headers={"X-ADMIN-API-KEY": "wrong"})
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_metrics_reports_routes_database_and_currency(client: TestClient) -> None:
+    api_key = client.post("/users").json()["api_key"]
+    headers = {"X-API-KEY": api_key}
+    address = client.post("/wallets", headers=headers).json()["wallet_address"]
+    client.get(f"/wallets/{address}", headers=headers)
+    client.get("/no-such-route")
+
+    response = client.get("/metrics", headers=ADMIN_HEADERS)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert 'http_requests_total{method="POST",route="/users",status="201"}' in body
+    assert (
+        'http_requests_total{method="GET",route="/wallets/{address}",status="200"}'
+        in body
+    )
+    assert address not in body
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"}' in body
+    assert 'http_request_duration_seconds_count{method="POST",route="/users"}' in body
+    assert 'db_queries_total{operation="INSERT"}' in body
+    assert "db_commit_duration_seconds_count" in body
+    assert 'db_pool_connections{state="opened"}' in body
+    assert 'currency_rate_cache_total{result="miss"}' in body
+
+
+def test_metrics_can_be_disabled() -> None:
+    db_setup(TEST_DB_NAME)
+    repository_factory = TestRepositoryFactory.get_instance()
+    app = init_app(repository_factory, metrics=False)
+    client = TestClient(app)
+
+    client.post("/users")
+    response = client.get("/metrics", headers=ADMIN_HEADERS)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == ""
+    assert repository_factory.get_connection_pool().get_query_observer() is None
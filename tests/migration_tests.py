@@ -0,0 +1,157 @@
+import os
+import sqlite3
+from pathlib import Path
+from typing import Generator, List
+
+import pytest
+
+from resources.db.migration import (
+    MIGRATIONS,
+    Migration,
+    get_schema_version,
+    migrate,
+)
+from resources.db.sql import db_setup
+
+LATEST_VERSION = max(migration.version for migration in MIGRATIONS)
+
+
+@pytest.fixture
+def connection(tmp_path: Path) -> Generator[sqlite3.Connection, None, None]:
+    connection = sqlite3.connect(db_setup(os.path.join(tmp_path, "migrated.db")))
+    yield connection
+    connection.close()
+
+
+def query_plan(connection: sqlite3.Connection, query: str) -> List[str]:
+    params = ("",) * query.count("?")
+    rows = connection.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+    return [row[3] for row in rows]
+
+
+def test_db_setup_applies_all_migrations(connection: sqlite3.Connection) -> None:
+    assert get_schema_version(connection) == LATEST_VERSION
+
+
+def test_migrate_is_idempotent(connection: sqlite3.Connection) -> None:
+    assert migrate(connection) == LATEST_VERSION
+    assert get_schema_version(connection) == LATEST_VERSION
+
+
+def test_migrate_upgrades_unversioned_database(tmp_path: Path) -> None:
+    connection = sqlite3.connect(os.path.join(tmp_path, "legacy.db"))
+    connection.execute("CREATE TABLE users (api_key PRIMARY KEY, wallet_count)")
+    connection.execute("INSERT INTO users VALUES ('legacy', 0)")
+    connection.commit()
+
+    assert migrate(connection) == LATEST_VERSION
+    assert connection.execute("SELECT * FROM users").fetchall() == [("legacy", 0)]
+    connection.close()
+
+
+def test_failed_migration_is_rolled_back(connection: sqlite3.Connection) -> None:
+    broken = MIGRATIONS + [
+        Migration(
+            version=LATEST_VERSION + 1,
+            description="Broken",
+            statements=("CREATE TABLE broken (id)", "NOT VALID SQL"),
+        )
+    ]
+
+    with pytest.raises(sqlite3.OperationalError):
+        migrate(connection, broken)
+
+    assert get_schema_version(connection) == LATEST_VERSION
+    tables = connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'broken'"
+    ).fetchall()
+    assert tables == []
+
+
+def test_wallet_owner_lookup_uses_index(connection: sqlite3.Connection) -> None:
+    plan = query_plan(connection, "SELECT * FROM wallets WHERE owner_api_key = ?")
+
+    assert any("USING INDEX idx_wallets_owner_api_key" in step for step in plan)
+
+
+def test_address_history_uses_covering_indexes(
+    connection: sqlite3.Connection,
+) -> None:
+    plan = query_plan(
+        connection, "SELECT * FROM transactions WHERE to_addr = ? OR from_addr = ?"
+    )
+
+    assert "MULTI-INDEX OR" in plan
+    assert any("COVERING INDEX idx_transactions_to_addr" in step for step in plan)
+    assert any("COVERING INDEX idx_transactions_from_addr" in step for step in plan)
+    assert not any(step.startswith("SCAN") for step in plan)
+
+
+def test_transaction_time_ordering_uses_index(
+    connection: sqlite3.Connection,
+) -> None:
+    plan = query_plan(
+        connection, "SELECT * FROM transactions ORDER BY transaction_time, id LIMIT 10"
+    )
+
+    assert plan == ["SCAN transactions USING INDEX idx_transactions_transaction_time"]
+
+
+def test_address_history_page_uses_keyset_seek(
+    connection: sqlite3.Connection,
+) -> None:
+    plan = query_plan(
+        connection,
+        "SELECT * FROM transactions WHERE (from_addr = ?) "
+        "AND (transaction_time, id) > (?, ?) "
+        "ORDER BY transaction_time, id LIMIT 11",
+    )
+
+    assert len(plan) == 1
+    assert "COVERING INDEX idx_transactions_from_addr" in plan[0]
+    assert "(transaction_time,id)>(?,?)" in plan[0]
+
+
+def test_user_history_uses_address_indexes(connection: sqlite3.Connection) -> None:
+    branch = (
+        "SELECT id, from_addr, to_addr, amount, fee_cost, transaction_time "
+        "FROM transactions WHERE ({} = ?) AND (transaction_time, id) > (?, ?)"
+    )
+    plan = query_plan(
+        connection,
+        " UNION ".join(
+            branch.format(field) for _ in range(3) for field in ("from_addr", "to_addr")
+        )
+        + " ORDER BY transaction_time, id LIMIT 11",
+    )
+
+    assert "MERGE (UNION)" in plan
+    assert not any("TEMP B-TREE" in step for step in plan)
+    assert not any(step.startswith("SCAN") for step in plan)
+
+
+def test_ownership_check_is_an_index_probe(connection: sqlite3.Connection) -> None:
+    plan = query_plan(
+        connection,
+        "SELECT 1 FROM wallets WHERE address = ? AND owner_api_key = ? LIMIT 1",
+    )
+
+    assert len(plan) == 1
+    assert plan[0].startswith("SEARCH wallets USING INDEX")
+
+
+def test_statistics_are_seeded_from_existing_transactions(tmp_path: Path) -> None:
+    connection = sqlite3.connect(os.path.join(tmp_path, "legacy.db"))
+    migrate(connection, MIGRATIONS[:2])
+    connection.execute(
+        "INSERT INTO transactions VALUES ('1', 'a', 'b', 10, 4, 't'), "
+        "('2', 'b', 'a', 20, 6, 't')"
+    )
+    connection.commit()
+
+    migrate(connection)
+
+    assert connection.execute("SELECT * FROM platform_statistics").fetchall() == [
+        ("platform", 2, 10)
+    ]
+    connection.close()
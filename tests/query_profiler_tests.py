@@ -0,0 +1,151 @@
+import os
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Generator, List
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from bitcoinwallet.core.logger import ILogger, format_message
+from bitcoinwallet.core.model.entity import UserEntity
+from bitcoinwallet.core.repository.connection_pool import ConnectionPool
+from bitcoinwallet.core.repository.query_profiler import (
+    QueryBudgetExceededError,
+    QueryProfiler,
+    profile_queries,
+    query_budget,
+)
+from bitcoinwallet.core.repository.repository import Repository
+from bitcoinwallet.runner.setup import init_app
+from definitions import ADMIN_API_KEY, TEST_DB_NAME
+from resources.db.sql import db_setup
+from tests.test_repository_factory import TestRepositoryFactory
+
+QUERY_BUDGETS = {
+    "POST /users": 1,
+    "POST /wallets": 3,
+    "GET /wallets/{address}": 1,
+    "POST /transactions": 4,
+    "GET /transactions": 2,
+    "GET /wallets/{address}/transactions": 2,
+    "GET /statistics": 1,
+}
+
+
+@dataclass
+class RecordingLogger(ILogger):
+    errors: List[str] = field(default_factory=list)
+
+    def error(self, msg: str, *args: Any, **fields: Any) -> None:
+        self.errors.append(format_message(msg, args, fields))
+
+
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    db_setup(TEST_DB_NAME)
+
+    yield TestClient(
+        init_app(TestRepositoryFactory.get_instance(), query_budgets=QUERY_BUDGETS)
+    )
+
+    TestRepositoryFactory.get_instance().close_connections()
+
+    if os.path.exists(TEST_DB_NAME):
+        os.remove(TEST_DB_NAME)
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> Generator[Repository, None, None]:
+    pool = ConnectionPool(
+        db_setup(os.path.join(tmp_path, "profiler.db")),
+        query_observer=QueryProfiler(RecordingLogger()),
+    )
+    yield Repository(UserEntity, pool)
+    pool.close()
+
+
+def test_profile_counts_queries_and_rows(repository: Repository) -> None:
+    api_keys = [str(uuid.uuid4()) for _ in range(3)]
+    for api_key in api_keys:
+        repository.create(UserEntity(api_key, 0))
+
+    with profile_queries() as profile:
+        for api_key in api_keys:
+            repository.read(api_key)
+
+    assert profile.queries == 3
+    assert profile.rows == 3
+    assert profile.duration > 0
+
+
+def test_query_budget_fails_when_exceeded(repository: Repository) -> None:
+    with query_budget(1):
+        repository.create(UserEntity(str(uuid.uuid4()), 0))
+
+    with pytest.raises(QueryBudgetExceededError):
+        with query_budget(1, "two inserts"):
+            repository.create(UserEntity(str(uuid.uuid4()), 0))
+            repository.create(UserEntity(str(uuid.uuid4()), 0))
+
+
+def test_slow_queries_are_logged_with_plan(tmp_path: Path) -> None:
+    logger = RecordingLogger()
+    pool = ConnectionPool(
+        db_setup(os.path.join(tmp_path, "slow.db")),
+        query_observer=QueryProfiler(logger, slow_query_threshold_ms=0),
+    )
+
+    Repository(UserEntity, pool).read(str(uuid.uuid4()))
+
+    assert logger.errors
+    assert all("Slow query" in message for message in logger.errors)
+    assert any("plan=SEARCH users" in message for message in logger.errors)
+    pool.close()
+
+
+def test_endpoints_stay_within_query_budget(client: TestClient) -> None:
+    headers: Dict[str, str] = {"X-API-KEY": client.post("/users").json()["api_key"]}
+    from_address = client.post("/wallets", headers=headers).json()["wallet_address"]
+    to_address = client.post("/wallets", headers=headers).json()["wallet_address"]
+    transaction = {
+        "from_wallet_address": from_address,
+        "to_wallet_address": to_address,
+        "amount": 0.1,
+    }
+
+    responses = [
+        client.get(f"/wallets/{from_address}", headers=headers),
+        client.post("/transactions", headers=headers, json=transaction),
+        client.get("/transactions", headers=headers),
+        client.get(f"/wallets/{from_address}/transactions", headers=headers),
+        client.get("/statistics", headers={"X-ADMIN-API-KEY": ADMIN_API_KEY}),
+    ]
+
+    assert all(response.status_code < 300 for response in responses)
+
+
+def test_request_over_budget_fails() -> None:
+    db_setup(TEST_DB_NAME)
+    client = TestClient(
+        init_app(TestRepositoryFactory.get_instance(), query_budgets={"POST /users": 0})
+    )
+
+    with pytest.raises(QueryBudgetExceededError, match="POST /users"):
+        client.post("/users")
+
+
+def test_async_request_over_budget_fails() -> None:
+    db_setup(TEST_DB_NAME)
+    app = init_app(
+        TestRepositoryFactory.get_instance(),
+        asynchronous=True,
+        query_budgets={"POST /users": 0, "GET /wallets/{address}": 1},
+    )
+
+    with TestClient(app) as client:
+        with pytest.raises(QueryBudgetExceededError, match="POST /users"):
+            client.post("/users")
+        response = client.get("/wallets/unknown", headers={"X-API-KEY": "unknown"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
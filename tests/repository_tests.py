@@ -1,11 +1,19 @@
 import os
+import sqlite3
 import uuid
-from typing import Generator
+from typing import Any, Generator, List, Tuple, Union, cast
 
 import pytest
 
 from bitcoinwallet.core.model.entity import TransactionEntity, UserEntity, WalletEntity
+from bitcoinwallet.core.model.query import (
+    Aggregate,
+    AggregateExpression,
+    Logical,
+    Operator,
+)
 from bitcoinwallet.core.repository.repository import IRepository
+from bitcoinwallet.core.repository.statement import compile_statements
 from bitcoinwallet.core.util import datetime_now
 from definitions import TEST_DB_NAME
 from resources.db.sql import db_setup
@@ -155,3 +163,125 @@ def test_transaction_repository(setup_test_db: str) -> None:
     transaction_repo.delete(tr2_id)
     transactions1 = transaction_repo.get_by_field("from_addr", wallet1.id)
     assert len(transactions1) == 1
+
+
+def test_bulk_repository_operations(setup_test_db: str) -> None:
+    user_repo: IRepository = TestRepositoryFactory.get_instance().get_repository(
+        UserEntity
+    )
+
+    wallet_count: int = 42
+    users = [UserEntity(str(uuid.uuid4()), wallet_count) for _ in range(25)]
+    user_repo.create_many(users, chunk_size=10)
+    assert len(user_repo.get_by_field("wallet_count", wallet_count)) == len(users)
+
+    for user in users:
+        user.wallet_count = wallet_count + 1
+    user_repo.update_many(iter(users), chunk_size=7)
+    assert len(user_repo.get_by_field("wallet_count", wallet_count)) == 0
+    assert user_repo.read(users[0].api_key) == users[0]
+
+    user_repo.delete_many((user.api_key for user in users[:20]), chunk_size=3)
+    assert len(user_repo.get_by_field("wallet_count", wallet_count + 1)) == 5
+
+
+def test_bulk_create_is_atomic(setup_test_db: str) -> None:
+    user_repo: IRepository = TestRepositoryFactory.get_instance().get_repository(
+        UserEntity
+    )
+
+    wallet_count: int = 100
+    duplicate = UserEntity(str(uuid.uuid4()), wallet_count)
+    users = [UserEntity(str(uuid.uuid4()), wallet_count), duplicate, duplicate]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        user_repo.create_many(users, chunk_size=1)
+
+    assert len(user_repo.get_by_field("wallet_count", wallet_count)) == 0
+
+
+def test_compiled_entity_statements() -> None:
+    statements = compile_statements(WalletEntity)
+    assert compile_statements(WalletEntity) is statements
+
+    wallet = WalletEntity("id", "owner", 10, "time", "address")
+    assert statements.to_row(wallet) == ("id", "owner", 10, "time", "address")
+    assert statements.to_update_row(wallet) == ("owner", 10, "time", "address", "id")
+    assert (
+        statements.row_factory(cast(sqlite3.Cursor, None), statements.to_row(wallet))
+        == wallet
+    )
+
+
+def test_iter_query_streams_in_batches(setup_test_db: str) -> None:
+    factory = TestRepositoryFactory.get_instance()
+    user_repo: IRepository = factory.get_repository(UserEntity)
+
+    wallet_count: int = 200
+    users = [UserEntity(str(uuid.uuid4()), wallet_count) for _ in range(23)]
+    user_repo.create_many(users)
+
+    conditions: List[Union[Tuple[str, Operator, Any], Logical]] = [
+        ("wallet_count", Operator.EQUALS, wallet_count)
+    ]
+    streamed = user_repo.iter_query(conditions, order_by="api_key", batch_size=5)
+
+    assert next(streamed) == min(users, key=lambda user: user.api_key)
+    assert factory.get_pool_stats().in_use == 1
+    assert len(list(streamed)) == len(users) - 1
+    assert factory.get_pool_stats().in_use == 0
+    assert list(user_repo.iter_query(conditions, "api_key")) == (
+        user_repo.query_with_builder(conditions, "api_key")
+    )
+
+
+def test_aggregate_with_group_by_and_having(setup_test_db: str) -> None:
+    wallet_repo: IRepository = TestRepositoryFactory.get_instance().get_repository(
+        WalletEntity
+    )
+
+    owners = [str(uuid.uuid4()) for _ in range(3)]
+    wallet_repo.create_many(
+        WalletEntity(
+            str(uuid.uuid4()), owner, balance, datetime_now(), str(uuid.uuid4())
+        )
+        for index, owner in enumerate(owners)
+        for balance in range(1, index + 2)
+    )
+
+    rows = wallet_repo.aggregate(
+        [
+            AggregateExpression(Aggregate.COUNT, alias="wallets"),
+            AggregateExpression(Aggregate.SUM, "balance", "total"),
+            AggregateExpression(Aggregate.MAX, "balance", "largest"),
+        ],
+        [("owner_api_key", Operator.IN, owners)],
+        group_by=["owner_api_key"],
+        having=[("wallets", Operator.GREATER_THAN, 1)],
+        order_by="wallets",
+    )
+
+    assert [tuple(row) for row in rows] == [(owners[1], 2, 3, 2), (owners[2], 3, 6, 3)]
+    assert rows[0]["total"] == 3
+
+
+def test_exists(setup_test_db: str) -> None:
+    wallet_repo: IRepository = TestRepositoryFactory.get_instance().get_repository(
+        WalletEntity
+    )
+    wallet = WalletEntity(
+        str(uuid.uuid4()), str(uuid.uuid4()), 0, datetime_now(), str(uuid.uuid4())
+    )
+    wallet_repo.create(wallet)
+
+    def owned_by(owner: str) -> bool:
+        return wallet_repo.exists(
+            [
+                ("address", Operator.EQUALS, wallet.address),
+                Logical.AND,
+                ("owner_api_key", Operator.EQUALS, owner),
+            ]
+        )
+
+    assert owned_by(wallet.owner_api_key)
+    assert not owned_by(str(uuid.uuid4()))
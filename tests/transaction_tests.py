@@ -1,10 +1,20 @@
+import json
 import os
-from typing import Generator
+from base64 import urlsafe_b64encode
+from typing import Any, Generator, List
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from bitcoinwallet.core.model.entity import TransactionEntity
+from bitcoinwallet.core.model.model import ListTransactionsResponse, TransactionModel
+from bitcoinwallet.core.service.transaction_service import TransactionPage
+from bitcoinwallet.infra.fastapi.response.json_response import (
+    TransactionPageResponse,
+    encode_json,
+    fast_encode_json,
+)
 from bitcoinwallet.runner.setup import init_app
 from definitions import TEST_DB_NAME
 from resources.db.sql import db_setup
@@ -204,3 +214,207 @@ def test_get_addr_transactions_invalid_api_key(client: TestClient) -> None:
     response = client.get(f"/wallets/{wallet_address}/transactions", headers=headers)
 
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_transactions_keyset_pagination(client: TestClient) -> None:
+    response = client.post("/users")
+    headers = {"X-API-KEY": response.json()["api_key"]}
+
+    from_wallet_address = client.post("/wallets", headers=headers).json()[
+        "wallet_address"
+    ]
+    to_wallet_address = client.post("/wallets", headers=headers).json()[
+        "wallet_address"
+    ]
+
+    amounts = [0.01, 0.02, 0.03, 0.04, 0.05]
+    for amount in amounts:
+        client.post(
+            "/transactions",
+            headers=headers,
+            json={
+                "from_wallet_address": from_wallet_address,
+                "to_wallet_address": to_wallet_address,
+                "amount": amount,
+            },
+        )
+
+    for url in ["/transactions", f"/wallets/{to_wallet_address}/transactions"]:
+        pages = []
+        params = {"limit": 2}
+        while True:
+            response = client.get(url, headers=headers, params=params)
+            assert response.status_code == status.HTTP_200_OK
+            pages.append(response.json()["transactions"])
+            next_cursor = response.json()["next_cursor"]
+            if next_cursor is None:
+                break
+            params = {"limit": 2, "cursor": next_cursor}
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [t["amount"] for page in pages for t in page] == amounts
+
+    response = client.get("/transactions", headers=headers)
+    assert len(response.json()["transactions"]) == len(amounts)
+    assert response.json()["next_cursor"] is None
+
+
+def test_transactions_invalid_cursor(client: TestClient) -> None:
+    response = client.post("/users")
+    headers = {"X-API-KEY": response.json()["api_key"]}
+
+    response = client.get(
+        "/transactions", headers=headers, params={"limit": 2, "cursor": "???"}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [{}, 1],
+        [[1], 2],
+        [None, "id"],
+        [True, "id"],
+        [2**70, "a"],
+        [-(2**70), "a"],
+        [float("inf"), "a"],
+        [float("nan"), "a"],
+    ],
+)
+def test_transactions_cursor_with_invalid_values(
+    client: TestClient, values: List[Any]
+) -> None:
+    response = client.post("/users")
+    headers = {"X-API-KEY": response.json()["api_key"]}
+    cursor = urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    response = client.get(
+        "/transactions", headers=headers, params={"limit": 2, "cursor": cursor}
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_batch_transactions(client: TestClient) -> None:
+    owner = {"X-API-KEY": client.post("/users").json()["api_key"]}
+    other = {"X-API-KEY": client.post("/users").json()["api_key"]}
+    source = client.post("/wallets", headers=owner).json()["wallet_address"]
+    own = client.post("/wallets", headers=owner).json()["wallet_address"]
+    foreign = client.post("/wallets", headers=other).json()["wallet_address"]
+
+    def transfer(to_address: str, amount: float) -> dict[str, object]:
+        return {
+            "from_wallet_address": source,
+            "to_wallet_address": to_address,
+            "amount": amount,
+        }
+
+    transfers = [
+        transfer(own, 0.1),
+        transfer(foreign, 0.2),
+        transfer("missing", 0.1),
+        transfer(own, -1),
+    ]
+
+    response = client.post(
+        "/transactions/batch", headers=owner, json={"transactions": transfers}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["completed"] == 0
+    assert [result["status"] for result in response.json()["results"]] == [
+        "NOT_APPLIED",
+        "NOT_APPLIED",
+        "NOT_APPLIED",
+        "INVALID_AMOUNT",
+    ]
+    balance = client.get(f"/wallets/{source}", headers=owner).json()["btc_balance"]
+    assert balance == 1
+
+    response = client.post(
+        "/transactions/batch",
+        headers=owner,
+        json={"transactions": transfers, "mode": "best_effort"},
+    )
+    results = response.json()["results"]
+    assert (response.json()["completed"], response.json()["failed"]) == (2, 2)
+    assert [result["status"] for result in results] == [
+        "COMPLETED",
+        "COMPLETED",
+        "DESTINATION_NOT_FOUND",
+        "INVALID_AMOUNT",
+    ]
+    assert results[0]["transaction"]["fee_price"] == 0
+    assert results[1]["transaction"]["fee_price"] == 0.003
+    assert results[1]["transaction_id"] is not None
+    assert results[2]["error"] == "Wallet with address: missing not found."
+    balance = client.get(f"/wallets/{source}", headers=owner).json()["btc_balance"]
+    assert balance == 0.697
+
+    response = client.post(
+        "/transactions/batch", headers=other, json={"transactions": transfers[:1]}
+    )
+    assert response.json()["results"][0]["status"] == "NOT_OWNER"
+
+
+def test_batch_transactions_page_in_submission_order(client: TestClient) -> None:
+    headers = {"X-API-KEY": client.post("/users").json()["api_key"]}
+    source = client.post("/wallets", headers=headers).json()["wallet_address"]
+    destination = client.post("/wallets", headers=headers).json()["wallet_address"]
+    amounts = [0.07, 0.01, 0.05, 0.03, 0.06, 0.02, 0.04]
+
+    response = client.post(
+        "/transactions/batch",
+        headers=headers,
+        json={
+            "transactions": [
+                {
+                    "from_wallet_address": source,
+                    "to_wallet_address": destination,
+                    "amount": amount,
+                }
+                for amount in amounts
+            ]
+        },
+    )
+    assert response.json()["completed"] == len(amounts)
+
+    for url in ["/transactions", f"/wallets/{destination}/transactions"]:
+        paged: List[float] = []
+        params = {"limit": 2}
+        while True:
+            response = client.get(url, headers=headers, params=params)
+            paged += [t["amount"] for t in response.json()["transactions"]]
+            next_cursor = response.json()["next_cursor"]
+            if next_cursor is None:
+                break
+            params = {"limit": 2, "cursor": next_cursor}
+
+        assert paged == amounts
+
+
+def test_transaction_page_response_matches_response_model() -> None:
+    page = TransactionPage(
+        [TransactionEntity("id", "from", "to", 1500, 23, "2024-01-01 00:00:00.0")],
+        "cursor",
+    )
+
+    body = bytes(TransactionPageResponse(page).body)
+
+    assert ListTransactionsResponse.model_validate_json(
+        body
+    ) == ListTransactionsResponse(
+        transactions=[
+            TransactionModel(
+                from_wallet_address="from",
+                to_wallet_address="to",
+                amount=0.000015,
+                fee_price=23,
+            )
+        ],
+        next_cursor="cursor",
+    )
+    assert json.loads(encode_json(json.loads(body))) == json.loads(
+        fast_encode_json(json.loads(body))
+    )
@@ -1,10 +1,12 @@
 import os
+import time
 from typing import Generator
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from bitcoinwallet.core.service.user_service import ApiKeyCache, UserServiceBuilder
 from bitcoinwallet.runner.setup import init_app
 from definitions import TEST_DB_NAME
 from resources.db.sql import db_setup
@@ -28,3 +30,39 @@ def test_create_user(client: TestClient) -> None:
 
     assert response.status_code == status.HTTP_201_CREATED
     assert response.json()["api_key"] is not None
+
+
+def test_api_key_validation_is_cached(client: TestClient) -> None:
+    user_service = (
+        UserServiceBuilder()
+        .set_repository_factory(TestRepositoryFactory.get_instance())
+        .set_api_key_cache(ApiKeyCache(capacity=10, invalid_capacity=10))
+        .build()
+    )
+
+    assert not user_service.user_valid("NO_USER")
+    assert not user_service.user_valid("NO_USER")
+
+    api_key = user_service.create_user()
+    assert user_service.user_valid(api_key)
+
+    existing_api_key = client.post("/users").json()["api_key"]
+    assert user_service.user_valid(existing_api_key)
+    assert user_service.user_valid(existing_api_key)
+
+    stats = user_service.api_key_cache.get_stats()
+    assert (stats.valid_hits, stats.invalid_hits, stats.misses) == (2, 1, 2)
+    assert (stats.valid_size, stats.invalid_size) == (2, 1)
+
+
+def test_api_key_cache_entries_expire() -> None:
+    api_key_cache = ApiKeyCache(ttl=0.01, invalid_ttl=0.01)
+    api_key_cache.remember("valid", True)
+    api_key_cache.remember("invalid", False)
+
+    assert api_key_cache.lookup("valid") is True
+    assert api_key_cache.lookup("invalid") is False
+    time.sleep(0.02)
+
+    assert api_key_cache.lookup("valid") is None
+    assert api_key_cache.lookup("invalid") is None
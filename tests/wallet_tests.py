@@ -5,6 +5,10 @@ import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from bitcoinwallet.core.model.exception.wallet_exception import (
+    WalletsLimitExceededException,
+)
+from bitcoinwallet.core.service.wallet_service import WalletServiceBuilder
 from bitcoinwallet.runner.setup import init_app
 from definitions import MAX_WALLETS_PER_USER, TEST_DB_NAME
 from resources.db.sql import db_setup
@@ -67,3 +71,42 @@ def test_wallet_number_limit_exceeded(client: TestClient) -> None:
         response = client.post("/wallets", headers=headers)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_wallet_metadata_is_cached(client: TestClient) -> None:
+    wallet_service = (
+        WalletServiceBuilder()
+        .set_repository_factory(TestRepositoryFactory.get_instance())
+        .set_wallet_cache_capacity(10)
+        .build()
+    )
+    api_key = client.post("/users").json()["api_key"]
+
+    address = wallet_service.create_wallet(api_key)
+    misses = wallet_service.get_cache_stats().misses
+
+    assert wallet_service.get_owner_api_key(address) == api_key
+    assert wallet_service.has_uer_wallet(api_key, address)
+    assert not wallet_service.has_uer_wallet("intruder", address)
+
+    stats = wallet_service.get_cache_stats()
+    assert stats.hits == 3
+    assert stats.misses == misses
+
+
+def test_wallet_limit_holds_across_service_instances(client: TestClient) -> None:
+    repository_factories = [TestRepositoryFactory(), TestRepositoryFactory()]
+    first, second = [
+        WalletServiceBuilder().set_repository_factory(repository_factory).build()
+        for repository_factory in repository_factories
+    ]
+    api_key = client.post("/users").json()["api_key"]
+
+    second.create_wallet(api_key)
+    for _ in range(MAX_WALLETS_PER_USER - 1):
+        first.create_wallet(api_key)
+
+    with pytest.raises(WalletsLimitExceededException):
+        second.create_wallet(api_key)
+    for repository_factory in repository_factories:
+        repository_factory.close_connections()